@@ -3,8 +3,8 @@ from flask_cors import CORS
 import os
 
 from db_service.config import DB_Config
-from db_service.db import DB_Client
-from models.base import Base
+from db_service.db import engine, init_app
+from db_service.migrate import upgrade
 from routes import register_routes
 from setup_logging.setup_logging import logger
 
@@ -12,10 +12,14 @@ def initialise_app():
     """
     Initialises app instance
     """
-    logger.info("Deleting any pre-existing db instance.")
-    app_db_path = os.path.join(os.path.dirname(__file__), "app.db")
-    if os.path.exists(app_db_path):
-        os.remove(app_db_path)
+    if DB_Config.PERSISTENT or engine.dialect.name != "sqlite":
+        logger.info(f"Keeping db instance at {engine.url.render_as_string(hide_password=True)}.")
+    elif engine.url.database and os.path.exists(engine.url.database):
+        logger.info("Deleting any pre-existing db instance.")
+        # a WAL db also leaves its -wal and -shm files, which must not outlive the db
+        for path in (engine.url.database, f"{engine.url.database}-wal", f"{engine.url.database}-shm"):
+            if os.path.exists(path):
+                os.remove(path)
     
     logger.info("Initialising flask app.")
     app = Flask(__name__)
@@ -25,12 +29,11 @@ def initialise_app():
     logger.info("App configuration.")
     app.config.from_object(DB_Config)
 
-    logger.info("Initialize DB client.")
-    db_client = DB_Client()
+    logger.info("Initialize DB sessions.")
+    init_app(app)
 
-    logger.info("Create table if they do not exist.")
-    with app.app_context():
-        Base.metadata.create_all(db_client.session.bind)
+    logger.info("Apply pending schema migrations.")
+    upgrade(engine)
     
     logger.info("Register route blueprints.")
     register_routes(app=app)
@@ -0,0 +1,170 @@
+import argparse
+import os
+import tempfile
+import time
+from datetime import date, timedelta
+
+import numpy as np
+from sqlalchemy import create_engine, func, insert, select
+from sqlalchemy.orm import Session
+
+from db_service.bulk import bulk_upsert
+from db_service.db import tune_sqlite
+from db_service.migrate import upgrade
+from models.stock_price_model import StockPriceModel
+
+# bars per ticker, i.e. ~10 years of daily bars
+BARS_PER_CODE = 2520
+
+PRICE_COLUMNS = [
+    StockPriceModel.date,
+    StockPriceModel.open_price,
+    StockPriceModel.high_price,
+    StockPriceModel.low_price,
+    StockPriceModel.close_price,
+    StockPriceModel.volume,
+]
+
+
+def build_db(path: str, n_rows: int, tuned: bool, chunk_size: int = 100_000) -> dict:
+    """
+    Creates a sqlite db at path with n_rows rows of stock_price_history (BARS_PER_CODE bars
+    per code) and returns the load time.
+    >>> tuned=False : default pragmas and the unique constraint only (covering index dropped)
+    >>> tuned=True  : tune_sqlite pragmas and every migration (covering indexes)
+    """
+    engine = create_engine(f"sqlite:///{path}")
+    if tuned:
+        tune_sqlite(engine)
+    upgrade(engine)
+    if not tuned:
+        with engine.begin() as connection:
+            connection.exec_driver_sql("DROP INDEX ix_stock_price_history_covering")
+
+    n_codes = -(-n_rows // BARS_PER_CODE)
+    codes = [f"T{code_number:05d}" for code_number in range(n_codes)]
+    dates = [date(2010, 1, 1) + timedelta(days=day) for day in range(BARS_PER_CODE)]
+    rng = np.random.default_rng(0)
+    close = (100 * np.exp(np.cumsum(rng.normal(0, 0.01, (BARS_PER_CODE, n_codes)), axis=0))).round(2)
+    statement = insert(StockPriceModel.__table__)
+
+    # rows are loaded a date at a time across every code, the order the daily syncs write them in,
+    # so the rows of a code are spread over the table like they are in a long-lived db
+    start = time.perf_counter()
+    rows = []
+    for bar, bar_date in enumerate(dates):
+        n_bar_codes = min(n_codes, n_rows - bar * n_codes)
+        if n_bar_codes <= 0:
+            break
+        rows.extend(
+            {
+                "code": code, "country": "US", "date": bar_date, "open_price": price, "high_price": price,
+                "low_price": price, "close_price": price, "volume": 1_000_000,
+            }
+            for code, price in zip(codes[:n_bar_codes], close[bar, :n_bar_codes].tolist())
+        )
+        if len(rows) >= chunk_size or bar == BARS_PER_CODE - 1:
+            with engine.begin() as connection:
+                connection.execute(statement, rows)
+            rows = []
+    if rows:
+        with engine.begin() as connection:
+            connection.execute(statement, rows)
+
+    seconds = time.perf_counter() - start
+    engine.dispose()
+    return {"rows": n_rows, "codes": n_codes, "load_seconds": round(seconds, 2), "rows_per_second": round(n_rows / seconds)}
+
+
+def measure(path: str, tuned: bool, n_queries: int, seed: int = 1) -> dict:
+    """
+    Runs the hot queries against random codes of the db at path and returns the median and
+    p95 latency (ms) of each:
+    >>> price_frame   : get_price_frame, every bar of a code ordered by date
+    >>> price_frame_1y: get_price_frame from a start date (the last 252 bars)
+    >>> date_range    : get_date_range, min / max date of a code
+    >>> upsert_sync   : sync_stock_price, upsert of the latest 5 bars of a code and commit
+    """
+    engine = create_engine(f"sqlite:///{path}")
+    if tuned:
+        tune_sqlite(engine)
+
+    with engine.connect() as connection:
+        codes = connection.execute(select(StockPriceModel.code).distinct()).scalars().all()
+        plan = connection.exec_driver_sql(
+            "EXPLAIN QUERY PLAN SELECT date, open_price, high_price, low_price, close_price, volume "
+            "FROM stock_price_history WHERE code = 'T00000' AND time_interval = '1d' ORDER BY date"
+        ).all()
+
+    rng = np.random.default_rng(seed)
+    picks = rng.choice(codes, size=n_queries)
+    start_date = date(2010, 1, 1) + timedelta(days=BARS_PER_CODE - 252)
+    latencies = {"price_frame": [], "price_frame_1y": [], "date_range": [], "upsert_sync": []}
+
+    with Session(engine) as session:
+        for code in picks:
+            code = str(code)
+            daily = (StockPriceModel.code == code, StockPriceModel.time_interval == "1d")
+            queries = {
+                "price_frame": select(*PRICE_COLUMNS).where(*daily).order_by(StockPriceModel.date),
+                "price_frame_1y": (
+                    select(*PRICE_COLUMNS)
+                    .where(*daily, StockPriceModel.date >= start_date)
+                    .order_by(StockPriceModel.date)
+                ),
+                "date_range": select(func.min(StockPriceModel.date), func.max(StockPriceModel.date)).where(*daily),
+            }
+            for name, query in queries.items():
+                start = time.perf_counter()
+                session.execute(query).all()
+                latencies[name].append(time.perf_counter() - start)
+
+            rows = [
+                {
+                    "code": code, "country": "US", "time_interval": "1d", "date": start_date + timedelta(days=251 - day), "open_price": 1.0,
+                    "high_price": 1.0, "low_price": 1.0, "close_price": 1.0, "volume": 1,
+                }
+                for day in range(5)
+            ]
+            start = time.perf_counter()
+            bulk_upsert(session, StockPriceModel, rows, conflict_columns=["code", "time_interval", "date"])
+            session.commit()
+            latencies["upsert_sync"].append(time.perf_counter() - start)
+
+    engine.dispose()
+    report = {
+        name: {"p50_ms": round(1000 * float(np.median(values)), 3), "p95_ms": round(1000 * float(np.percentile(values, 95)), 3)}
+        for name, values in latencies.items()
+    }
+    report["price_frame_plan"] = " / ".join(row[-1] for row in plan)
+    return report
+
+
+def main():
+    """
+    Command line entry point for the sqlite benchmark of the default and tuned profiles.
+    Ex:
+    >>> python -m db_service.benchmark --rows 10000000
+    """
+    parser = argparse.ArgumentParser(description="Benchmark stock_price_history reads and writes on sqlite, default vs tuned.")
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--dir", default=None, help="defaults to a temporary directory")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as directory:
+        for tuned in (False, True):
+            path = os.path.join(directory, f"benchmark_{'tuned' if tuned else 'default'}.db")
+            load = build_db(path, args.rows, tuned=tuned)
+            report = measure(path, tuned=tuned, n_queries=args.queries)
+
+            print(f"\n{'tuned' if tuned else 'default'}: {load['rows']} rows, {load['codes']} codes, "
+                  f"loaded in {load['load_seconds']}s ({load['rows_per_second']} rows/s), "
+                  f"{os.path.getsize(path) / 1024 ** 2:.0f} MiB")
+            print(f"  price_frame plan: {report.pop('price_frame_plan')}")
+            for name, latency in report.items():
+                print(f"  {name:<15} p50 {latency['p50_ms']:>9} ms   p95 {latency['p95_ms']:>9} ms")
+
+
+if __name__ == "__main__":
+    main()
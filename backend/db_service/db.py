@@ -1,10 +1,98 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+import threading
+
+from flask import has_app_context
+from flask.globals import app_ctx
+from sqlalchemy import create_engine, event, make_url
+from sqlalchemy.orm import scoped_session, sessionmaker
 
 from db_service.config import DB_Config
+from setup_logging.setup_logging import logger
+
+
+def _session_scope():
+    """
+    Returns the key of the current session scope: the Flask app context when there is one
+    (i.e. the request being served), otherwise the current thread (e.g. the CLI runners).
+    """
+    if has_app_context():
+        return id(app_ctx._get_current_object())
+    return threading.get_ident()
+
+
+def _connect_args(database_uri: str) -> dict:
+    """
+    Returns the driver arguments of the configured backend.
+    """
+    backend = make_url(database_uri).get_backend_name()
+    if backend == "sqlite":
+        return {"timeout": DB_Config.CONNECT_TIMEOUT}
+    if backend == "postgresql":
+        return {"connect_timeout": DB_Config.CONNECT_TIMEOUT}
+    return {}
+
+
+def tune_sqlite(sqlite_engine) -> None:
+    """
+    Sets the SQLite performance pragmas on every new connection of sqlite_engine:
+    >>> journal_mode=WAL      : readers no longer block the writer and vice versa
+    >>> synchronous=NORMAL    : WAL commits skip the fsync, the db stays consistent on a crash
+    >>> mmap_size, cache_size : pages are read through a memory map and a larger page cache
+    """
+    @event.listens_for(sqlite_engine, "connect")
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA mmap_size={DB_Config.SQLITE_MMAP_SIZE}")
+        # negative cache_size is in KiB rather than pages
+        cursor.execute(f"PRAGMA cache_size=-{DB_Config.SQLITE_CACHE_SIZE // 1024}")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+
+# one engine and connection pool for the whole process, shared by every DB client
+engine = create_engine(
+    DB_Config.SQLALCHEMY_DATABASE_URI,
+    pool_size=DB_Config.POOL_SIZE,
+    max_overflow=DB_Config.MAX_OVERFLOW,
+    pool_timeout=DB_Config.POOL_TIMEOUT,
+    pool_recycle=DB_Config.POOL_RECYCLE,
+    pool_pre_ping=True,
+    connect_args=_connect_args(DB_Config.SQLALCHEMY_DATABASE_URI),
+)
+
+if engine.dialect.name == "sqlite" and DB_Config.SQLITE_TUNED:
+    tune_sqlite(engine)
+
+# a session per app context / thread, checked out of the engine's pool on first use
+Session = scoped_session(sessionmaker(bind=engine), scopefunc=_session_scope)
+
 
 class DB_Client:
-    def __init__(self):
-        engine = create_engine(DB_Config.SQLALCHEMY_DATABASE_URI)
-        Session = sessionmaker(bind=engine)
-        self.session = Session()
+    """
+    Base class of the DB clients.
+    The session is looked up per request, so a single client instance can be shared by
+    concurrent request threads.
+    """
+    @property
+    def session(self):
+        return Session()
+
+
+def init_app(app) -> None:
+    """
+    Registers the teardown that ends the request's session: anything left uncommitted is rolled
+    back and the session's connection is returned to the pool. The methods commit their own
+    writes, so a handled error (returned as a 500 rather than raised) never commits a partial write.
+    """
+    @app.teardown_appcontext
+    def remove_session(exception=None):
+        if not Session.registry.has():
+            return  # the request did not use the DB
+
+        try:
+            Session.rollback()
+        except Exception as e:
+            logger.error(f"Error ending the session: {e}")
+        finally:
+            Session.remove()
@@ -0,0 +1,104 @@
+import argparse
+import importlib
+import pkgutil
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, func, insert, select
+
+import db_service.migrations
+from db_service.db import engine
+from setup_logging.setup_logging import logger
+
+metadata = MetaData()
+
+# one row per applied migration
+schema_version = Table(
+    "schema_version",
+    metadata,
+    Column("version", Integer, primary_key=True),
+    Column("description", String, nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+def load_migrations() -> list:
+    """
+    Returns the migration modules of db_service.migrations ordered by VERSION.
+    Each module is named m<version>_<name>.py and defines VERSION, DESCRIPTION and
+    upgrade(connection).
+    """
+    migrations = [
+        importlib.import_module(f"{db_service.migrations.__name__}.{module.name}")
+        for module in pkgutil.iter_modules(db_service.migrations.__path__)
+        if module.name.startswith("m")
+    ]
+    migrations.sort(key=lambda migration: migration.VERSION)
+
+    versions = [migration.VERSION for migration in migrations]
+    if len(set(versions)) != len(versions):
+        raise ValueError(f"Duplicate migration versions: {versions}")
+    return migrations
+
+
+def current_version(engine) -> int:
+    """
+    Returns the latest applied migration version, 0 for an empty db.
+    """
+    with engine.begin() as connection:
+        schema_version.create(connection, checkfirst=True)
+        return connection.execute(select(func.coalesce(func.max(schema_version.c.version), 0))).scalar()
+
+
+def upgrade(engine, target: int = None) -> list:
+    """
+    Applies the pending migrations up to target (defaults to the latest), each in its own
+    transaction together with its schema_version row. Returns the applied versions.
+    """
+    version = current_version(engine)
+    pending = [
+        migration for migration in load_migrations()
+        if migration.VERSION > version and (target is None or migration.VERSION <= target)
+    ]
+
+    if not pending:
+        logger.info(f"upgrade: Schema is up to date at version {version}.")
+        return []
+
+    for migration in pending:
+        logger.info(f"upgrade: Applying migration {migration.VERSION} ({migration.DESCRIPTION}).")
+        with engine.begin() as connection:
+            migration.upgrade(connection)
+            connection.execute(insert(schema_version).values(
+                version=migration.VERSION,
+                description=migration.DESCRIPTION,
+                applied_at=datetime.now(timezone.utc).replace(tzinfo=None),
+            ))
+
+    logger.info(f"upgrade: Schema upgraded from version {version} to {pending[-1].VERSION}.")
+    return [migration.VERSION for migration in pending]
+
+
+def main():
+    """
+    Command line entry point for the schema migrations of the configured db.
+    Ex:
+    >>> python -m db_service.migrate
+    >>> python -m db_service.migrate --status
+    """
+    parser = argparse.ArgumentParser(description="Apply the pending schema migrations.")
+    parser.add_argument("--target", type=int, default=None, help="defaults to the latest version")
+    parser.add_argument("--status", action="store_true", help="only print the current and pending versions")
+    args = parser.parse_args()
+
+    if args.status:
+        version = current_version(engine)
+        pending = [migration.VERSION for migration in load_migrations() if migration.VERSION > version]
+        print(f"Current version: {version}, pending: {pending or 'none'}")
+        return
+
+    applied = upgrade(engine, target=args.target)
+    print(f"Applied migrations: {applied or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    Column,
+    Date,
+    Float,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    UniqueConstraint,
+)
+
+VERSION = 1
+DESCRIPTION = "stock, stock_price_history, trades and results tables"
+
+# snapshot of the models at this version, later model changes get their own migration
+metadata = MetaData()
+
+STOCK_FLOAT_COLUMNS = [
+    "price", "marketCap", "numSharesAvail", "yearlyLowPrice", "yearlyHighPrice", "fiftyDayMA",
+    "twoHundredDayMA", "acquirersMultiple", "currentRatio", "enterpriseValue", "eps", "evToEBITDA",
+    "evToRev", "peRatioTrail", "peRatioForward", "priceToSales", "priceToBook", "dividendYield",
+    "dividendRate",
+]
+STOCK_FLOAT_COLUMNS_AFTER_EX_DIV = [
+    "payoutRatio", "bookValPerShare", "cash", "cashPerShare", "cashToMarketCap", "cashToDebt", "debt",
+    "debtToMarketCap", "debtToEquityRatio", "returnOnAssets", "returnOnEquity", "ebitda",
+    "ebitdaPerShare", "earningsGrowth", "grossProfit", "grossProfitPerShare", "netIncome",
+    "netIncomePerShare", "operatingMargin", "profitMargin", "revenue", "revenueGrowth",
+    "revenuePerShare", "fcf", "fcfToMarketCap", "fcfPerShare", "fcfToEV", "ocf", "ocfToRevenueRatio",
+    "ocfToMarketCap", "ocfPerShare", "ocfToEV",
+]
+
+Table(
+    "stock",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("code", String, unique=True, nullable=True),
+    Column("country", String, nullable=True),
+    *[Column(name, Float, nullable=True) for name in STOCK_FLOAT_COLUMNS],
+    Column("exDivDate", String, nullable=True),
+    *[Column(name, Float, nullable=True) for name in STOCK_FLOAT_COLUMNS_AFTER_EX_DIV],
+)
+
+Table(
+    "stock_price_history",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("code", String(8), nullable=True),
+    Column("country", String(5), nullable=True),
+    Column("date", Date, nullable=True),
+    Column("open_price", Float, nullable=True),
+    Column("high_price", Float, nullable=True),
+    Column("low_price", Float, nullable=True),
+    Column("close_price", Float, nullable=True),
+    Column("volume", BigInteger, nullable=True),
+    UniqueConstraint("code", "date", name="uix_stock_date"),
+)
+
+Table(
+    "trades",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("code", String(8), nullable=True),
+    Column("country", String(5), nullable=True),
+    Column("date", Date, nullable=True),
+    Column("close_price", Float, nullable=True),
+    Column("buy_signal", Float, nullable=True),
+    Column("buy_price", Float, nullable=True),
+    Column("sell_signal", Float, nullable=True),
+    Column("sell_price", Float, nullable=True),
+    UniqueConstraint("code", "date", name="uix_trades_date"),
+)
+
+Table(
+    "results",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("code", String(8), unique=True, nullable=True),
+    Column("country", String(5), nullable=True),
+    Column("initial_investment", Float, nullable=True),
+    Column("buy_sell_pairs_timestamp", JSON, nullable=True),
+    Column("profit_loss_shares", JSON, nullable=True),
+    Column("strategy_roi", Float, nullable=True),
+    Column("total_profit", Float, nullable=True),
+    Column("total_profit_per_trade", JSON, nullable=True),
+    Column("total_number_of_trades", Integer, nullable=True),
+    Column("number_profit_trades", Integer, nullable=True),
+    Column("number_loss_trades", Integer, nullable=True),
+    Column("pct_win", Float, nullable=True),
+    Column("pct_loss", Float, nullable=True),
+    Column("greatest_profit", Float, nullable=True),
+    Column("greatest_loss", Float, nullable=True),
+)
+
+
+def upgrade(connection) -> None:
+    """
+    Creates the tables. Tables that already exist (a db created before migrations were
+    versioned) are left as they are, so such a db is adopted at this version.
+    """
+    metadata.create_all(connection, checkfirst=True)
@@ -0,0 +1,27 @@
+from sqlalchemy import Index, MetaData, Table
+
+VERSION = 2
+DESCRIPTION = "covering indexes for the price and trade reads by code ordered by date"
+
+# columns after (code, date) are carried in the index so the reads never visit the table rows
+INDEXES = {
+    "stock_price_history": (
+        "ix_stock_price_history_covering",
+        ["code", "date", "open_price", "high_price", "low_price", "close_price", "volume", "country"],
+    ),
+    "trades": (
+        "ix_trades_covering",
+        ["code", "date", "close_price", "buy_signal", "buy_price", "sell_signal", "sell_price", "country"],
+    ),
+}
+
+
+def upgrade(connection) -> None:
+    """
+    Creates the covering indexes of get_price_frame / get_stock_price (stock_price_history)
+    and get_trades_for_code (trades).
+    """
+    metadata = MetaData()
+    for table_name, (index_name, columns) in INDEXES.items():
+        table = Table(table_name, metadata, autoload_with=connection)
+        Index(index_name, *[table.c[column] for column in columns]).create(connection, checkfirst=True)
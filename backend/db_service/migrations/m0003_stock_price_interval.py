@@ -0,0 +1,72 @@
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    Date,
+    Float,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    UniqueConstraint,
+    inspect,
+)
+
+VERSION = 3
+DESCRIPTION = "time_interval column of stock_price_history, part of its unique key and covering index"
+
+COVERING_INDEX = "ix_stock_price_history_covering"
+COVERING_COLUMNS = ["code", "time_interval", "date", "open_price", "high_price", "low_price", "close_price", "volume", "country"]
+
+# snapshot of stock_price_history at this version
+metadata = MetaData()
+
+stock_price_history = Table(
+    "stock_price_history",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("code", String(8), nullable=True),
+    Column("country", String(5), nullable=True),
+    Column("time_interval", String(5), nullable=False, server_default="1d"),
+    Column("date", Date, nullable=True),
+    Column("open_price", Float, nullable=True),
+    Column("high_price", Float, nullable=True),
+    Column("low_price", Float, nullable=True),
+    Column("close_price", Float, nullable=True),
+    Column("volume", BigInteger, nullable=True),
+    UniqueConstraint("code", "time_interval", "date", name="uix_stock_interval_date"),
+)
+covering_index = Index(COVERING_INDEX, *[stock_price_history.c[column] for column in COVERING_COLUMNS])
+
+COPIED_COLUMNS = "id, code, country, date, open_price, high_price, low_price, close_price, volume"
+
+
+def upgrade(connection) -> None:
+    """
+    Adds the time_interval of each bar to stock_price_history, so bars of different intervals
+    no longer collide on (code, date). Existing rows were written as daily bars and get '1d'.
+    SQLite cannot alter constraints, so there the table is rebuilt and its rows copied over.
+    A db whose table already has the column (created from the models) is left as it is.
+    """
+    columns = {column["name"] for column in inspect(connection).get_columns("stock_price_history")}
+    if "time_interval" in columns:
+        return
+
+    connection.exec_driver_sql(f"DROP INDEX IF EXISTS {COVERING_INDEX}")
+
+    if connection.dialect.name == "sqlite":
+        connection.exec_driver_sql("ALTER TABLE stock_price_history RENAME TO stock_price_history_v2")
+        metadata.create_all(connection)
+        connection.exec_driver_sql(
+            f"INSERT INTO stock_price_history ({COPIED_COLUMNS}, time_interval) "
+            f"SELECT {COPIED_COLUMNS}, '1d' FROM stock_price_history_v2"
+        )
+        connection.exec_driver_sql("DROP TABLE stock_price_history_v2")
+        return
+
+    connection.exec_driver_sql("ALTER TABLE stock_price_history ADD COLUMN time_interval VARCHAR(5) DEFAULT '1d' NOT NULL")
+    connection.exec_driver_sql("ALTER TABLE stock_price_history DROP CONSTRAINT uix_stock_date")
+    connection.exec_driver_sql(
+        "ALTER TABLE stock_price_history ADD CONSTRAINT uix_stock_interval_date UNIQUE (code, time_interval, date)"
+    )
+    covering_index.create(connection)
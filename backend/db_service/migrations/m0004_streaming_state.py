@@ -0,0 +1,26 @@
+from sqlalchemy import JSON, Column, Date, Integer, MetaData, String, Table, UniqueConstraint
+
+VERSION = 4
+DESCRIPTION = "streaming_state table of the strategies advanced one bar at a time"
+
+# snapshot of streaming_state at this version
+metadata = MetaData()
+
+Table(
+    "streaming_state",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("code", String(8), nullable=False),
+    Column("country", String(5), nullable=True),
+    Column("strategy", String(16), nullable=False),
+    Column("last_date", Date, nullable=True),
+    Column("state", JSON, nullable=False),
+    UniqueConstraint("code", "strategy", name="uix_streaming_state_strategy"),
+)
+
+
+def upgrade(connection) -> None:
+    """
+    Creates the streaming_state table, one row of indicator state per stock code and strategy.
+    """
+    metadata.create_all(connection, checkfirst=True)
@@ -0,0 +1,25 @@
+from sqlalchemy import Column, Date, Integer, MetaData, String, Table, UniqueConstraint
+
+VERSION = 5
+DESCRIPTION = "stock_price_coverage table of the periods downloaded into stock_price_history"
+
+# snapshot of stock_price_coverage at this version
+metadata = MetaData()
+
+Table(
+    "stock_price_coverage",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("code", String(8), nullable=False),
+    Column("time_interval", String(5), nullable=False),
+    Column("covered_from", Date, nullable=True),
+    UniqueConstraint("code", "time_interval", name="uix_stock_price_coverage"),
+)
+
+
+def upgrade(connection) -> None:
+    """
+    Creates the stock_price_coverage table, one row per stock code and interval. Prices stored
+    before it existed have no row until their period is downloaded again.
+    """
+    metadata.create_all(connection, checkfirst=True)
@@ -0,0 +1,21 @@
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Date,
+    UniqueConstraint,
+)
+from models.base import Base
+
+class StockPriceCoverageModel(Base):
+    __tablename__ = "stock_price_coverage"
+
+    id = Column(Integer, primary_key=True)
+    code = Column(String(8), nullable=False)
+    time_interval = Column(String(5), nullable=False)
+    # earliest period start downloaded into stock_price_history, NULL for 'max' (the provider's first bar)
+    covered_from = Column(Date, nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint('code', 'time_interval', name='uix_stock_price_coverage'),
+    )
@@ -6,6 +6,7 @@ from sqlalchemy import (
     Date,
     BigInteger,
     UniqueConstraint,
+    Index,
 )
 from models.base import Base
 
@@ -15,6 +16,7 @@ class StockPriceModel(Base):
     id = Column(Integer, primary_key=True)
     code = Column(String(8), nullable=True)
     country = Column(String(5), nullable=True)
+    time_interval = Column(String(5), nullable=False, default="1d", server_default="1d")
     date = Column(Date, nullable=True)
     open_price = Column(Float, nullable=True)
     high_price = Column(Float, nullable=True)
@@ -22,5 +24,9 @@ class StockPriceModel(Base):
     close_price = Column(Float, nullable=True)
     volume = Column(BigInteger, nullable=True)
 
-    # Composite unique constraint to ensure no duplicate entries for a stock on a given date
-    __table_args__ = (UniqueConstraint('code', 'date', name='uix_stock_date'),)
\ No newline at end of file
+    # Composite unique constraint to ensure no duplicate entries for a stock and interval on a given date (migration 3)
+    __table_args__ = (
+        UniqueConstraint('code', 'time_interval', 'date', name='uix_stock_interval_date'),
+        # covering index of the reads by code and interval ordered by date (migrations 2 and 3)
+        Index('ix_stock_price_history_covering', 'code', 'time_interval', 'date', 'open_price', 'high_price', 'low_price', 'close_price', 'volume', 'country'),
+    )
\ No newline at end of file
@@ -5,6 +5,7 @@ from sqlalchemy import (
     Float,
     Date,
     UniqueConstraint,
+    Index,
 )
 from models.base import Base
 
@@ -21,4 +22,8 @@ class StrategyModel(Base):
     sell_signal = Column(Float, nullable=True)
     sell_price = Column(Float, nullable=True)
 
-    __table_args__ = (UniqueConstraint('code', 'date', name='uix_trades_date'),)
+    __table_args__ = (
+        UniqueConstraint('code', 'date', name='uix_trades_date'),
+        # covering index of the reads by code ordered by date (migration 2)
+        Index('ix_trades_covering', 'code', 'date', 'close_price', 'buy_signal', 'buy_price', 'sell_signal', 'sell_price', 'country'),
+    )
@@ -0,0 +1,24 @@
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Date,
+    JSON,
+    UniqueConstraint,
+)
+from models.base import Base
+
+class StreamingStateModel(Base):
+    __tablename__ = "streaming_state"
+
+    id = Column(Integer, primary_key=True)
+    code = Column(String(8), nullable=False)
+    country = Column(String(5), nullable=True)
+    strategy = Column(String(16), nullable=False)
+    last_date = Column(Date, nullable=True)
+    # StreamingStrategy.to_dict(): parameters, indicator states and the last signal conditions
+    state = Column(JSON, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint('code', 'strategy', name='uix_streaming_state_strategy'),
+    )
@@ -13,10 +13,11 @@ stock_price_bp = Blueprint("stock_price", __name__)
 def get_stock_prices(code):
     """
     API endpoint to get all stock price data for a stock from the database.
+    The interval is given by the 'time_interval' query parameter (defaults to 1d).
     """
     try:
         logger.info("Executing GET /api/stock_price/<string:code> endpoint.")
-        result = stockPriceDB_Client.get_stock_price(code)
+        result = stockPriceDB_Client.get_stock_price(code, request.args.get("time_interval", "1d"))
         logger.info(f"Received GET /api/stock_price/<string:code> with output: {result}")
 
         if result is not None:
@@ -65,6 +66,68 @@ def add_stock_prices():
         return jsonify({"error": "Unexpected error occurred", "details": str(e)}), HTTPStatus.INTERNAL_SERVER_ERROR
 
 
+@stock_price_bp.route("/batch", methods=["POST"])
+def add_batch_stock_prices():
+    """
+    API endpoint to add stock price data for a list of stock codes.
+    """
+    try:
+        logger.info("Executing POST /api/stock_price/batch endpoint.")
+        data = request.get_json()
+        logger.info(f"Received POST /api/stock_price/batch with output: {data}")
+
+        if not data:
+            logger.error("Error: Invalid or missing JSON data.")
+            return jsonify({"error": "Invalid or missing JSON data"}), HTTPStatus.BAD_REQUEST
+
+        result = stockPriceDB_Client.add_batch_stock_price(data)
+        logger.info(f"Result from stockPriceDB_Client.add_batch_stock_price: {result}")
+
+        logger.info(f"Processed stock price batch for codes {data.get('codes')}")
+        return jsonify({"message": "Processed stock price batch", "results": result}), HTTPStatus.CREATED
+
+    except ValueError as ve:
+        logger.error(f"Type Error: ValueError. Error: {str(ve)}")
+        return jsonify({"error": str(ve)}), HTTPStatus.BAD_REQUEST
+
+    except Exception as e:
+        logger.error(f"Type Error: {type(str(e))}. Error: {str(e)}")
+        return jsonify({"error": "Unexpected error occurred", "details": str(e)}), HTTPStatus.INTERNAL_SERVER_ERROR
+
+
+@stock_price_bp.route("/sync", methods=["POST"])
+def sync_stock_prices():
+    """
+    API endpoint to incrementally refresh stock price data for a given stock code.
+    """
+    try:
+        logger.info("Executing POST /api/stock_price/sync endpoint.")
+        data = request.get_json()
+        logger.info(f"Received POST /api/stock_price/sync with output: {data}")
+
+        if not data:
+            logger.error("Error: Invalid or missing JSON data.")
+            return jsonify({"error": "Invalid or missing JSON data"}), HTTPStatus.BAD_REQUEST
+
+        result = stockPriceDB_Client.sync_stock_price(data)
+        logger.info(f"Result from stockPriceDB_Client.sync_stock_price: {result}")
+
+        logger.info(f"Synced stock prices for code {data.get('code')}")
+        return jsonify({
+            "message": f"Synced stock prices for code {data.get('code')}",
+            "rows_added": result["rows_added"],
+            "latest_date": result["latest_date"].strftime('%Y-%m-%d') if result["latest_date"] else None,
+        }), HTTPStatus.OK
+
+    except ValueError as ve:
+        logger.error(f"Type Error: ValueError. Error: {str(ve)}")
+        return jsonify({"error": str(ve)}), HTTPStatus.BAD_REQUEST
+
+    except Exception as e:
+        logger.error(f"Type Error: {type(str(e))}. Error: {str(e)}")
+        return jsonify({"error": "Unexpected error occurred", "details": str(e)}), HTTPStatus.INTERNAL_SERVER_ERROR
+
+
 @stock_price_bp.route("/", methods=["DELETE"])
 def delete_all_stock_price_histories():
     """
@@ -74,6 +74,35 @@ def add_stock():
         return jsonify({"error": "Unexpected error occurred", "details": str(e)}), HTTPStatus.INTERNAL_SERVER_ERROR
 
 
+@stock_bp.route("/batch", methods=["POST"])
+def add_batch_stocks():
+    """
+    API endpoint to add a list of stocks to the database.
+    """
+    try:
+        logger.info("Executing POST /api/stock/batch endpoint.")
+        data = request.get_json()
+        logger.info(f"Received POST /api/stock/batch with output: {data}")
+
+        if not data:
+            logger.error("Error: Invalid or missing JSON data.")
+            return jsonify({"error": "Invalid or missing JSON data"}), HTTPStatus.BAD_REQUEST
+
+        result = stockDB_Client.add_batch_stocks(json_data=data)
+        logger.info(f"Result from stockDB_Client.add_batch_stocks: {result}")
+
+        logger.info("Processed stock batch")
+        return jsonify({"message": "Processed stock batch", "results": result}), HTTPStatus.OK
+
+    except ValueError as ve:
+        logger.error(f"Type Error: ValueError. Error: {str(ve)}")
+        return jsonify({"error": str(ve)}), HTTPStatus.BAD_REQUEST
+
+    except Exception as e:
+        logger.error(f"Type Error: {type(str(e))}. Error: {str(e)}")
+        return jsonify({"error": "Unexpected error occurred", "details": str(e)}), HTTPStatus.INTERNAL_SERVER_ERROR
+
+
 @stock_bp.route("/", methods=["DELETE"])
 def delete_all_stocks():
     """
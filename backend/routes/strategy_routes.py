@@ -78,6 +78,207 @@ def add_strategy():
         return jsonify({"error": "Unexpected error occurred", "details": str(e)}), HTTPStatus.INTERNAL_SERVER_ERROR
 
 
+@strategy_bp.route("/sweep", methods=["POST"])
+def sweep_strategy():
+    """
+    API endpoint to rank a strategy's window parameters for a stock code.
+    """
+    try:
+        logger.info("Executing POST /api/strategy/sweep endpoint.")
+        data = request.get_json()
+        logger.info(f"Received POST /api/strategy/sweep with output: {data}")
+
+        if not data:
+            logger.error("Error: Invalid or missing JSON data.")
+            return jsonify({"error": "Invalid or missing JSON data"}), HTTPStatus.BAD_REQUEST
+
+        result = strategyDB_Client.sweep_strategy_for_code(json_data=data)
+        logger.info(f"Parameter sweep evaluated for {data.get('code')}")
+
+        return jsonify(result), HTTPStatus.OK
+
+    except ValueError as ve:
+        logger.error(f"Type Error: ValueError. Error: {str(ve)}")
+        return jsonify({"error": f"{str(ve)}"}), HTTPStatus.BAD_REQUEST
+
+    except Exception as e:
+        logger.error(f"Type Error: {type(str(e))}. Error: {str(e)}")
+        return jsonify({"error": "Unexpected error occurred", "details": str(e)}), HTTPStatus.INTERNAL_SERVER_ERROR
+
+
+@strategy_bp.route("/walk_forward", methods=["POST"])
+def walk_forward_strategy():
+    """
+    API endpoint to run a walk-forward optimisation of a strategy for a stock code.
+    """
+    try:
+        logger.info("Executing POST /api/strategy/walk_forward endpoint.")
+        data = request.get_json()
+        logger.info(f"Received POST /api/strategy/walk_forward with output: {data}")
+
+        if not data:
+            logger.error("Error: Invalid or missing JSON data.")
+            return jsonify({"error": "Invalid or missing JSON data"}), HTTPStatus.BAD_REQUEST
+
+        result = strategyDB_Client.walk_forward_for_code(json_data=data)
+        logger.info(f"Walk-forward optimisation evaluated for {data.get('code')}")
+
+        return jsonify(result), HTTPStatus.OK
+
+    except ValueError as ve:
+        logger.error(f"Type Error: ValueError. Error: {str(ve)}")
+        return jsonify({"error": f"{str(ve)}"}), HTTPStatus.BAD_REQUEST
+
+    except Exception as e:
+        logger.error(f"Type Error: {type(str(e))}. Error: {str(e)}")
+        return jsonify({"error": "Unexpected error occurred", "details": str(e)}), HTTPStatus.INTERNAL_SERVER_ERROR
+
+
+@strategy_bp.route("/compare", methods=["POST"])
+def compare_strategies():
+    """
+    API endpoint to compare every strategy side by side for a stock code.
+    """
+    try:
+        logger.info("Executing POST /api/strategy/compare endpoint.")
+        data = request.get_json()
+        logger.info(f"Received POST /api/strategy/compare with output: {data}")
+
+        if not data:
+            logger.error("Error: Invalid or missing JSON data.")
+            return jsonify({"error": "Invalid or missing JSON data"}), HTTPStatus.BAD_REQUEST
+
+        result = strategyDB_Client.compare_strategies_for_code(json_data=data)
+        logger.info(f"Strategies compared for {data.get('code')}")
+
+        return jsonify(result), HTTPStatus.OK
+
+    except ValueError as ve:
+        logger.error(f"Type Error: ValueError. Error: {str(ve)}")
+        return jsonify({"error": f"{str(ve)}"}), HTTPStatus.BAD_REQUEST
+
+    except Exception as e:
+        logger.error(f"Type Error: {type(str(e))}. Error: {str(e)}")
+        return jsonify({"error": "Unexpected error occurred", "details": str(e)}), HTTPStatus.INTERNAL_SERVER_ERROR
+
+
+@strategy_bp.route("/universe", methods=["POST"])
+def backtest_universe():
+    """
+    API endpoint to rank every stored stock by a strategy's results.
+    """
+    try:
+        logger.info("Executing POST /api/strategy/universe endpoint.")
+        data = request.get_json()
+        logger.info(f"Received POST /api/strategy/universe with output: {data}")
+
+        if not data:
+            logger.error("Error: Invalid or missing JSON data.")
+            return jsonify({"error": "Invalid or missing JSON data"}), HTTPStatus.BAD_REQUEST
+
+        result = strategyDB_Client.backtest_universe(json_data=data)
+        logger.info(f"Universe backtest evaluated for {result['tickers']} codes")
+
+        return jsonify(result), HTTPStatus.OK
+
+    except ValueError as ve:
+        logger.error(f"Type Error: ValueError. Error: {str(ve)}")
+        return jsonify({"error": f"{str(ve)}"}), HTTPStatus.BAD_REQUEST
+
+    except Exception as e:
+        logger.error(f"Type Error: {type(str(e))}. Error: {str(e)}")
+        return jsonify({"error": "Unexpected error occurred", "details": str(e)}), HTTPStatus.INTERNAL_SERVER_ERROR
+
+
+@strategy_bp.route("/portfolio", methods=["POST"])
+def portfolio_backtest():
+    """
+    API endpoint to simulate a portfolio trading a strategy across stored stocks.
+    """
+    try:
+        logger.info("Executing POST /api/strategy/portfolio endpoint.")
+        data = request.get_json()
+        logger.info(f"Received POST /api/strategy/portfolio with output: {data}")
+
+        if not data:
+            logger.error("Error: Invalid or missing JSON data.")
+            return jsonify({"error": "Invalid or missing JSON data"}), HTTPStatus.BAD_REQUEST
+
+        result = strategyDB_Client.portfolio_backtest(json_data=data)
+        logger.info(f"Portfolio simulated for {len(result['codes'])} codes")
+
+        return jsonify(result), HTTPStatus.OK
+
+    except ValueError as ve:
+        logger.error(f"Type Error: ValueError. Error: {str(ve)}")
+        return jsonify({"error": f"{str(ve)}"}), HTTPStatus.BAD_REQUEST
+
+    except Exception as e:
+        logger.error(f"Type Error: {type(str(e))}. Error: {str(e)}")
+        return jsonify({"error": "Unexpected error occurred", "details": str(e)}), HTTPStatus.INTERNAL_SERVER_ERROR
+
+
+@strategy_bp.route("/stream", methods=["POST"])
+def refresh_streaming_strategy():
+    """
+    API endpoint to advance the streaming state of a strategy for a stock code by its latest bars.
+    """
+    try:
+        logger.info("Executing POST /api/strategy/stream endpoint.")
+        data = request.get_json()
+        logger.info(f"Received POST /api/strategy/stream with output: {data}")
+
+        if not data:
+            logger.error("Error: Invalid or missing JSON data.")
+            return jsonify({"error": "Invalid or missing JSON data"}), HTTPStatus.BAD_REQUEST
+
+        result = strategyDB_Client.refresh_streaming_signals(json_data=data)
+        logger.info(f"Streaming {data.get('strategy')} for {data.get('code')} advanced by {len(result['results'])} bars")
+
+        return jsonify(result), HTTPStatus.OK
+
+    except ValueError as ve:
+        logger.error(f"Type Error: ValueError. Error: {str(ve)}")
+        return jsonify({"error": f"{str(ve)}"}), HTTPStatus.BAD_REQUEST
+
+    except Exception as e:
+        logger.error(f"Type Error: {type(str(e))}. Error: {str(e)}")
+        return jsonify({"error": "Unexpected error occurred", "details": str(e)}), HTTPStatus.INTERNAL_SERVER_ERROR
+
+
+@strategy_bp.route("/monte_carlo", methods=["POST"])
+def monte_carlo_strategy():
+    """
+    API endpoint to resample the stored trades of a stock code's strategy.
+    """
+    try:
+        logger.info("Executing POST /api/strategy/monte_carlo endpoint.")
+        data = request.get_json()
+        logger.info(f"Received POST /api/strategy/monte_carlo with output: {data}")
+
+        if not data:
+            logger.error("Error: Invalid or missing JSON data.")
+            return jsonify({"error": "Invalid or missing JSON data"}), HTTPStatus.BAD_REQUEST
+
+        result = strategyDB_Client.monte_carlo_for_code(json_data=data)
+
+        if result is not None:
+            logger.info("Trades resampled. Returning HTTP 200 Ok status.")
+            return jsonify(result), HTTPStatus.OK
+
+        else:
+            logger.info(f"No strategy results were found for the given code {data.get('code')}")
+            return jsonify({'error': f"No strategy results were found for the given code {data.get('code')}"}), HTTPStatus.NOT_FOUND
+
+    except ValueError as ve:
+        logger.error(f"Type Error: ValueError. Error: {str(ve)}")
+        return jsonify({"error": f"{str(ve)}"}), HTTPStatus.BAD_REQUEST
+
+    except Exception as e:
+        logger.error(f"Type Error: {type(str(e))}. Error: {str(e)}")
+        return jsonify({"error": "Unexpected error occurred", "details": str(e)}), HTTPStatus.INTERNAL_SERVER_ERROR
+
+
 @strategy_bp.route("/<string:code>", methods=["DELETE"])
 def delete_strategy(code):
     try:
@@ -9,6 +9,7 @@ class StockPriceSchema(SQLAlchemySchema):
     id = auto_field()
     code = auto_field()
     country = auto_field()
+    time_interval = auto_field()
     date = auto_field()
     open_price = auto_field()
     high_price = auto_field()
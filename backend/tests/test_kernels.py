@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+import pytest
+from ta.momentum import RSIIndicator
+from ta.trend import MACD
+
+from yf_service.strategy import kernels
+
+RTOL = 1e-9
+
+
+def random_walk(n_rows: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n_rows)))
+
+
+# tickers x bars
+CLOSE = np.vstack([random_walk(500, seed) for seed in range(4)])
+
+
+def test_ema_matches_pandas():
+    close = CLOSE[0].copy()
+    close[:3] = np.nan
+    for span, min_periods in [(1, 0), (12, 0), (26, 26), (200, 10)]:
+        expected = pd.Series(close).ewm(span=span, adjust=False, min_periods=min_periods).mean().to_numpy()
+        np.testing.assert_allclose(kernels.ema(close, span=span, min_periods=min_periods), expected, rtol=RTOL)
+
+
+def test_ema_batches_tickers_and_windows():
+    by_ticker = kernels.ema(CLOSE, span=12)
+    by_window = kernels.ema(CLOSE[0], span=[5, 12, 26])
+
+    assert by_ticker.shape == CLOSE.shape
+    assert by_window.shape == (3, CLOSE.shape[1])
+    for row, close in zip(by_ticker, CLOSE):
+        np.testing.assert_allclose(row, pd.Series(close).ewm(span=12, adjust=False).mean(), rtol=RTOL)
+    for row, span in zip(by_window, [5, 12, 26]):
+        np.testing.assert_allclose(row, pd.Series(CLOSE[0]).ewm(span=span, adjust=False).mean(), rtol=RTOL)
+
+
+@pytest.mark.parametrize("min_periods", [1, 20])
+def test_rolling_mean_matches_pandas(min_periods):
+    close = CLOSE.copy()
+    close[:, ::37] = np.nan
+    windows = [1, 5, 20, 50]
+
+    by_ticker = kernels.rolling_mean(close, window=20, min_periods=min_periods)
+    min_periods_by_window = [min(min_periods, window) for window in windows]
+    by_window = kernels.rolling_mean(close[0], window=windows, min_periods=min_periods_by_window)
+
+    for row, series in zip(by_ticker, close):
+        expected = pd.Series(series).rolling(20, min_periods=min_periods).mean()
+        np.testing.assert_allclose(row, expected, rtol=RTOL)
+    for row, window, window_min_periods in zip(by_window, windows, min_periods_by_window):
+        expected = pd.Series(close[0]).rolling(window, min_periods=window_min_periods).mean()
+        np.testing.assert_allclose(row, expected, rtol=RTOL)
+
+
+def test_rsi_matches_ta():
+    windows = [2, 14, 30]
+
+    by_ticker = kernels.rsi(CLOSE, window=14)
+    by_window = kernels.rsi(CLOSE[0], window=windows)
+
+    np.testing.assert_allclose(kernels.rsi(CLOSE[0], window=14), by_ticker[0], rtol=RTOL)
+    for row, close in zip(by_ticker, CLOSE):
+        np.testing.assert_allclose(row, RSIIndicator(pd.Series(close), window=14).rsi(), rtol=RTOL)
+    for row, window in zip(by_window, windows):
+        np.testing.assert_allclose(row, RSIIndicator(pd.Series(CLOSE[0]), window=window).rsi(), rtol=RTOL)
+
+
+def test_macd_matches_ta():
+    slow, fast = [26, 35], [12, 5]
+
+    by_ticker = kernels.macd(CLOSE, window_slow=26, window_fast=12, window_signal=9)
+    by_window = kernels.macd(CLOSE[0], window_slow=slow, window_fast=fast, window_signal=9)
+
+    for ticker, close in enumerate(CLOSE):
+        expected = MACD(pd.Series(close), window_slow=26, window_fast=12, window_sign=9)
+        for result, line in zip(by_ticker, (expected.macd(), expected.macd_signal(), expected.macd_diff())):
+            np.testing.assert_allclose(result[ticker], line, rtol=RTOL, atol=1e-10)
+    for row, (window_slow, window_fast) in enumerate(zip(slow, fast)):
+        expected = MACD(pd.Series(CLOSE[0]), window_slow=window_slow, window_fast=window_fast, window_sign=9)
+        for result, line in zip(by_window, (expected.macd(), expected.macd_signal(), expected.macd_diff())):
+            np.testing.assert_allclose(result[row], line, rtol=RTOL, atol=1e-10)
+
+
+@pytest.mark.parametrize("kernel", [
+    lambda: kernels.rolling_mean(CLOSE, window=0),
+    lambda: kernels.rsi(CLOSE, window=[14, 0]),
+    lambda: kernels.macd(CLOSE, window_slow=26, window_fast=0, window_signal=9),
+    lambda: kernels.ema(CLOSE, span=0.5),
+])
+def test_windows_below_one_raise(kernel):
+    with pytest.raises(ValueError):
+        kernel()
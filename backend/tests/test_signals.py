@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from yf_service.strategy.benchmark import baseline_signals
+from yf_service.strategy.handler import StrategyHandler
+from yf_service.strategy.signals import rising_edge
+from yf_service.strategy.trades import Trades
+
+CONDITIONS = {
+    "empty": [],
+    "single_true": [True],
+    "single_false": [False],
+    "all_true": [True] * 50,
+    "all_false": [False] * 50,
+    "alternating": [True, False] * 25,
+    "runs": [True, True, False, True, True, True, False, False, True],
+}
+
+
+def random_walk(n_rows: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return (100 * np.exp(np.cumsum(rng.normal(0, 0.01, n_rows)))).round(2)
+
+
+def with_flat_stretches(close: np.ndarray) -> np.ndarray:
+    close = close.copy()
+    for start in range(50, len(close) - 60, 150):
+        close[start:start + 60] = close[start]
+    return close
+
+
+SERIES = {
+    "empty": np.array([]),
+    "single_row": np.array([100.0]),
+    "flat": np.full(300, 100.0),
+    **{f"random_{seed}": random_walk(600, seed) for seed in range(3)},
+    **{f"random_flat_{seed}": with_flat_stretches(random_walk(600, seed)) for seed in range(3)},
+}
+
+
+@pytest.mark.parametrize("condition", CONDITIONS.values(), ids=CONDITIONS.keys())
+def test_rising_edge_matches_baseline_on_edge_cases(condition):
+    assert np.array_equal(rising_edge(condition), baseline_signals(condition))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_rising_edge_matches_baseline_on_random_conditions(seed):
+    rng = np.random.default_rng(seed)
+    condition = pd.Series(rng.random(int(rng.integers(0, 2000))) < rng.uniform(0.05, 0.95))
+
+    assert np.array_equal(rising_edge(condition), baseline_signals(condition))
+
+
+@pytest.mark.parametrize("name", SERIES)
+@pytest.mark.parametrize("strategy_name", sorted(StrategyHandler.strategy_map))
+def test_trades_match_baseline(strategy_name, name):
+    close = SERIES[name]
+    data = pd.DataFrame(
+        {"Close": close, "Volume": np.full(len(close), 1e6)},
+        index=pd.date_range("2020-01-01", periods=len(close), name="Date"),
+    )
+    strategy = StrategyHandler(data=data).get_strategy(strategy_name=strategy_name)
+    trades = Trades(strategy)
+
+    buy_signal = baseline_signals(strategy.buy_condition)
+    sell_signal = baseline_signals(strategy.sell_condition)
+
+    assert np.array_equal(trades.buy_signal, buy_signal)
+    assert np.array_equal(trades.sell_signal, sell_signal)
+    assert np.array_equal(trades.buy_price, np.where(buy_signal, close, 0.0))
+    assert np.array_equal(trades.sell_price, np.where(sell_signal, close, 0.0))
+    assert trades._data.index.equals(data.index)
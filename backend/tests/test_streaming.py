@@ -0,0 +1,66 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from yf_service.strategy.handler import StrategyHandler
+from yf_service.strategy.streaming import RollingMeanState, create_streaming_strategy, load_streaming_strategy
+from yf_service.strategy.trades import Trades
+
+
+def random_walk(n_rows: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, n_rows)))
+    # flat stretches, where a drifting rolling sum would flip MA_fast >= MA_slow
+    for _ in range(6):
+        start = int(rng.integers(0, n_rows))
+        close[start:start + int(rng.integers(2, 80))] = close[start]
+    return close
+
+
+def price_frame(seed: int, n_rows: int = 400) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {"Close": random_walk(n_rows, seed), "Volume": rng.integers(1, 1_000_000, n_rows).astype(float)},
+        index=pd.date_range("2020-01-01", periods=n_rows, name="Date"),
+    )
+
+
+@pytest.mark.parametrize("window", [1, 2, 5, 26])
+@pytest.mark.parametrize("seed", range(5))
+def test_rolling_mean_matches_pandas(window, seed):
+    values = random_walk(300, seed)
+    values[::17] = np.nan
+
+    state = RollingMeanState(window, min_periods=1)
+    means = []
+    for position, value in enumerate(values):
+        if position % 50 == 0:
+            state = RollingMeanState.from_dict(json.loads(json.dumps(state.to_dict())))
+        means.append(state.update(value))
+
+    expected = pd.Series(values).rolling(window, min_periods=1).mean().to_numpy()
+    np.testing.assert_array_equal(np.array(means), expected)
+
+
+def test_rolling_mean_rejects_empty_window():
+    with pytest.raises(ValueError):
+        RollingMeanState(0)
+
+
+@pytest.mark.parametrize("strategy_name", ["MA", "MACD", "RSI", "VW_MACD"])
+@pytest.mark.parametrize("seed", range(20))
+def test_signals_match_trades(strategy_name, seed):
+    data = price_frame(seed)
+    trades = Trades(StrategyHandler(data=data).get_strategy(strategy_name=strategy_name))
+
+    # advanced in two refreshes, the second from the saved state and a frame overlapping the first
+    streaming = create_streaming_strategy(strategy_name)
+    first = streaming.update_frame(data.iloc[:250])
+    streaming = load_streaming_strategy(json.loads(json.dumps(streaming.to_dict())))
+    second = streaming.update_frame(data.iloc[200:])
+    bars = pd.concat([first, second])
+
+    np.testing.assert_array_equal(bars["BuySignal"].to_numpy(bool), trades.buy_signal)
+    np.testing.assert_array_equal(bars["SellSignal"].to_numpy(bool), trades.sell_signal)
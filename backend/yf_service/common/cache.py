@@ -0,0 +1,258 @@
+import hashlib
+import os
+import pickle
+import re
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+import pandas as pd
+
+from setup_logging.setup_logging import logger
+from yf_service.common.config import Cache_Config
+
+
+class PriceCache:
+    """
+    Persistent OHLCV cache keyed by ticker and interval.
+
+    Each entry holds the bars downloaded for a ticker / interval, the earliest date that
+    was requested for it, and when its latest bars were last refreshed. A request for a
+    period that the entry already covers is served from the entry. Once the interval's
+    TTL has expired only the missing tail is downloaded and merged in.
+
+    Entries are pickled to PRICE_CACHE_DIR and evicted least recently used once their files
+    add up to more than PRICE_CACHE_MAX_BYTES. Recency is the file's mtime, touched on every
+    read, so worker processes sharing the directory evict in the same order. The most recent
+    entries are also kept in memory.
+    """
+
+    def __init__(self,
+                 cache_dir: str = Cache_Config.PRICE_CACHE_DIR,
+                 max_bytes: int = Cache_Config.PRICE_CACHE_MAX_BYTES,
+                 max_memory_entries: int = Cache_Config.PRICE_CACHE_MAX_MEMORY_ENTRIES,
+                 ttl: dict = Cache_Config.PRICE_CACHE_TTL):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_memory_entries = max_memory_entries
+        self.ttl = ttl
+
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks = {}
+
+    def get(self, ticker: str, time_period: str, time_interval: str, download) -> pd.DataFrame:
+        """
+        Returns bars for ticker over time_period, downloading only what the cache is missing.
+        download(start=None) must return a yfinance DataFrame for the full period,
+        or for the bars from start onwards when start is given.
+        """
+        key = self._key(ticker, time_interval)
+
+        with self._key_lock(key):
+            now = pd.Timestamp.now()
+            entry = self._load(key)
+            requested_start = period_start(time_period, now)
+
+            if entry is None or not self._covers(entry, requested_start):
+                logger.info(f"PriceCache miss: {ticker} | {time_period} | {time_interval}")
+                data = download(start=None)
+                if data is None or data.empty:
+                    return data
+
+                if entry is not None:
+                    data = self._merge(entry["data"], data)
+                entry = {"data": data, "start": requested_start, "refreshed_at": time.time()}
+                self._save(key, entry)
+
+            elif time.time() - entry["refreshed_at"] > self.ttl.get(time_interval, 3600):
+                last_bar = entry["data"].index[-1]
+                logger.info(f"PriceCache stale: refreshing {ticker} | {time_interval} from {last_bar}")
+                tail = download(start=last_bar)
+
+                if tail is not None and not tail.empty:
+                    entry["data"] = self._merge(entry["data"], tail)
+                entry["refreshed_at"] = time.time()
+                self._save(key, entry)
+
+            else:
+                logger.info(f"PriceCache hit: {ticker} | {time_period} | {time_interval}")
+
+            return self._slice(entry["data"], time_period).copy()
+
+    def clear(self):
+        """
+        Removes every entry from memory and disk.
+        """
+        with self._lock:
+            self._memory.clear()
+            for path in self._entry_paths():
+                self._remove(path)
+
+    @staticmethod
+    def _key(ticker: str, time_interval: str) -> str:
+        return hashlib.sha1(f"{ticker.upper()}|{time_interval}".encode()).hexdigest()
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        """
+        One lock per key so concurrent requests for the same ticker share one download.
+        """
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    @staticmethod
+    def _covers(entry: dict, requested_start) -> bool:
+        if entry["start"] is None:
+            return True
+        return requested_start is not None and entry["start"] <= requested_start
+
+    @staticmethod
+    def _merge(cached: pd.DataFrame, new: pd.DataFrame) -> pd.DataFrame:
+        """
+        Appends new bars to the cached bars. Overlapping bars are replaced by the new download.
+        """
+        merged = pd.concat([cached, new])
+        merged = merged[~merged.index.duplicated(keep="last")]
+        return merged.sort_index()
+
+    @staticmethod
+    def _slice(data: pd.DataFrame, time_period: str) -> pd.DataFrame:
+        """
+        Returns the bars of data that fall within time_period of its latest bar.
+        """
+        start = period_start(time_period, data.index[-1])
+        if start is None:
+            return data
+
+        if data.index.tz is not None and start.tz is None:
+            start = start.tz_localize(data.index.tz)
+        return data[data.index >= start]
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.pkl")
+
+    def _entry_paths(self) -> list:
+        if not os.path.isdir(self.cache_dir):
+            return []
+        return [os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir) if name.endswith(".pkl")]
+
+    def _load(self, key: str):
+        path = self._path(key)
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+
+        if entry is not None:
+            # memory hits are recent uses too, or the hottest entries would be evicted from disk first
+            self._touch(path)
+            return entry
+
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, "rb") as f:
+                entry = pickle.load(f)
+            self._touch(path)
+        except Exception as e:
+            logger.error(f"PriceCache failed to read {path}: {e}")
+            return None
+
+        self._remember(key, entry)
+        return entry
+
+    def _save(self, key: str, entry: dict):
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        path = self._path(key)
+        # unique across the threads and worker processes sharing cache_dir
+        tmp_path = f"{path}.{os.getpid()}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+        self._remember(key, entry)
+        self._evict(keep=path)
+
+    def _remember(self, key: str, entry: dict):
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+
+    def _evict(self, keep: str = None):
+        """
+        Removes the least recently used entries on disk until their files add up to at most
+        max_bytes. The entry at keep, just written, is never removed.
+        """
+        entries = []
+        for path in self._entry_paths():
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue  # evicted by another process
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+
+            key = os.path.basename(path)[:-len(".pkl")]
+            logger.info(f"PriceCache evicting {key} ({size} bytes)")
+            with self._lock:
+                self._memory.pop(key, None)
+            self._remove(path)
+            total -= size
+
+    @staticmethod
+    def _touch(path: str):
+        # marks the entry as recently used for disk eviction
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def _remove(path: str):
+        # another process sharing cache_dir may have removed it first
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def period_start(time_period: str, now: pd.Timestamp):
+    """
+    Returns the earliest timestamp covered by a yfinance period relative to now.
+    Returns None for 'max'.
+
+    NOTE:
+    >>> time_period   : 1d,5d,1mo,3mo,6mo,1y,2y,5y,10y,ytd,max
+    """
+    if time_period == "max":
+        return None
+
+    if time_period == "ytd":
+        return pd.Timestamp(year=now.year, month=1, day=1, tz=now.tz)
+
+    match = re.fullmatch(r"(\d+)(d|mo|y)", time_period or "")
+    if not match:
+        raise ValueError(f"Unsupported time period '{time_period}'.")
+
+    number, unit = int(match.group(1)), match.group(2)
+    if unit == "d":
+        # yfinance counts trading days for day periods
+        return now.normalize() - pd.offsets.BDay(number - 1)
+    if unit == "mo":
+        return now - pd.DateOffset(months=number)
+    return now - pd.DateOffset(years=number)
+
+
+price_cache = PriceCache()
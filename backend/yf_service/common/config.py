@@ -0,0 +1,61 @@
+import os
+
+class Cache_Config:
+    """
+    Class responsible for the local OHLCV and indicator cache config.
+    Values can be overridden with environment variables.
+    """
+    cache_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "price_cache")
+    PRICE_CACHE_ENABLED = os.environ.get("PRICE_CACHE_ENABLED", "true").lower() == "true"
+    PRICE_CACHE_DIR = os.environ.get("PRICE_CACHE_DIR", cache_path)
+
+    # LRU bounds: total size of the entry files on disk (bytes) and entries kept deserialised in memory
+    PRICE_CACHE_MAX_BYTES = int(os.environ.get("PRICE_CACHE_MAX_BYTES", 1024 * 1024 * 1024))
+    PRICE_CACHE_MAX_MEMORY_ENTRIES = int(os.environ.get("PRICE_CACHE_MAX_MEMORY_ENTRIES", 32))
+
+    # seconds before the latest bars of an entry are refreshed from yfinance
+    PRICE_CACHE_TTL = {
+        "1m": 60,
+        "2m": 60,
+        "5m": 120,
+        "15m": 300,
+        "30m": 300,
+        "60m": 900,
+        "90m": 900,
+        "1h": 900,
+        "1d": 3600,
+        "5d": 6 * 3600,
+        "1wk": 6 * 3600,
+        "1mo": 24 * 3600,
+        "3mo": 24 * 3600,
+    }
+
+    # memory cap for indicator arrays shared between strategies (bytes)
+    INDICATOR_CACHE_MAX_BYTES = int(os.environ.get("INDICATOR_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+
+
+class Profiling_Config:
+    """
+    Class responsible for the diagnostics config.
+    Values can be overridden with environment variables.
+    """
+    # trace allocations with tracemalloc and log the peak memory of each strategy pipeline stage
+    PROFILE_MEMORY = os.environ.get("PROFILE_MEMORY", "false").lower() == "true"
+
+
+class Price_Store_Config:
+    """
+    Class responsible for the columnar (Parquet) price store config.
+    Values can be overridden with environment variables.
+    """
+    store_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "price_store")
+    # read and write time series through the store instead of stock_price_history rows
+    PRICE_STORE_ENABLED = os.environ.get("PRICE_STORE_ENABLED", "false").lower() == "true"
+    PRICE_STORE_DIR = os.environ.get("PRICE_STORE_DIR", store_path)
+
+    # snappy decodes ~2x faster than zstd on price columns, which barely compress either way
+    PRICE_STORE_COMPRESSION = os.environ.get("PRICE_STORE_COMPRESSION", "snappy")
+    # bars per Parquet row group, the granularity at which date filters skip data (~4 years of daily bars)
+    PRICE_STORE_ROW_GROUP_SIZE = int(os.environ.get("PRICE_STORE_ROW_GROUP_SIZE", 1024))
+    # threads reading tickers in parallel for multi-ticker loads
+    PRICE_STORE_READ_THREADS = int(os.environ.get("PRICE_STORE_READ_THREADS", min(8, os.cpu_count() or 1)))
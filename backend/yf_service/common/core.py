@@ -1,16 +1,21 @@
 import yfinance as yf
+import numpy as np
 import pandas as pd
 
 from setup_logging.setup_logging import logger
+from yf_service.common.cache import price_cache
+from yf_service.common.config import Cache_Config
 
 
 def get_yf_stock_data(
     ticker: str, 
     time_period: str = "1y", 
-    time_interval: str = "1d"
+    time_interval: str = "1d",
+    use_cache: bool = Cache_Config.PRICE_CACHE_ENABLED
 ) -> pd.DataFrame:
     """
     Retrieve stock data using Yahoo Finance API.
+    Single ticker requests are served through the local OHLCV cache when use_cache is set.
 
     NOTE:
     >>> ticker        : "stock1" or "stock1 stock2 stockn"
@@ -21,9 +26,38 @@ def get_yf_stock_data(
     if not isinstance(ticker, str):
         return None
 
+    if use_cache and len(ticker.split()) == 1:
+        try:
+            return price_cache.get(
+                ticker=ticker,
+                time_period=time_period,
+                time_interval=time_interval,
+                download=lambda start: download_yf_stock_data(ticker, time_period, time_interval, start=start),
+            )
+
+        except Exception as e:
+            logger.error(f"get_yf_stock_data cache error: {e}")
+
+    return download_yf_stock_data(ticker, time_period, time_interval)
+
+
+def download_yf_stock_data(
+    ticker: str,
+    time_period: str = "1y",
+    time_interval: str = "1d",
+    start=None
+) -> pd.DataFrame:
+    """
+    Downloads stock data from Yahoo Finance, bypassing the cache.
+    If start is given, only bars from start onwards are downloaded instead of the full period.
+    """
+
     try:
         logger.info("Download data")
-        data = yf.download(tickers=ticker, period=time_period, interval=time_interval)
+        if start is None:
+            data = yf.download(tickers=ticker, period=time_period, interval=time_interval)
+        else:
+            data = yf.download(tickers=ticker, start=start, interval=time_interval)
         
         logger.info("Convert to pandas DataFrame")
         df = pd.DataFrame(data)
@@ -35,7 +69,7 @@ def get_yf_stock_data(
         return df
 
     except Exception as e:
-        logger.error(f"get_yf_stock_data error: {e}")
+        logger.error(f"download_yf_stock_data error: {e}")
         return None
 
 
@@ -44,3 +78,43 @@ def round_result(result):
     Rounds result to 2 dp.
     """
     return round(result, 2)
+
+
+def get_column_values(df: pd.DataFrame, column: str) -> np.ndarray:
+    """
+    Returns the values of a column as a 1-D numpy array.
+    yfinance returns (Price, Ticker) columns, so df[column] may be a single ticker DataFrame.
+    """
+    values = df[column]
+
+    if isinstance(values, pd.DataFrame):
+        values = values.iloc[:, 0]
+
+    return values.to_numpy()
+
+
+def get_column_series(df: pd.DataFrame, column: str) -> pd.Series:
+    """
+    Returns a column as a 1-D pandas Series indexed like df.
+    """
+    return pd.Series(get_column_values(df, column), index=df.index, name=column)
+
+
+def get_ticker_frame(df: pd.DataFrame, ticker: str) -> pd.DataFrame:
+    """
+    Returns the OHLCV columns of a single ticker with flat column names.
+    Handles both plain frames and yfinance (Price, Ticker) MultiIndex frames.
+    Returns an empty frame if a multi ticker frame does not contain the ticker.
+    """
+    if not isinstance(df.columns, pd.MultiIndex):
+        return df
+
+    tickers = df.columns.get_level_values(-1)
+    matches = [name for name in tickers.unique() if str(name).upper() == ticker.upper()]
+    if matches:
+        return df.xs(matches[0], axis=1, level=-1)
+
+    if tickers.nunique() == 1:
+        return df.droplevel(-1, axis=1)
+
+    return pd.DataFrame(index=df.index, columns=df.columns.get_level_values(0).unique())
@@ -0,0 +1,372 @@
+import os
+import shutil
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from urllib.parse import quote, unquote
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from setup_logging.setup_logging import logger
+from yf_service.common.config import Price_Store_Config
+
+try:
+    import fcntl
+except ImportError:  # Windows, where writes are only serialised within one process
+    fcntl = None
+
+PRICE_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+SCHEMA = pa.schema([
+    ("Date", pa.timestamp("ns")),
+    ("Open", pa.float64()),
+    ("High", pa.float64()),
+    ("Low", pa.float64()),
+    ("Close", pa.float64()),
+    ("Volume", pa.int64()),
+])
+
+
+class PriceStore:
+    """
+    Columnar OHLCV store with one Parquet dataset per ticker and interval.
+
+    Bars are partitioned hive style as PRICE_STORE_DIR/interval=<interval>/code=<code>/data.parquet,
+    sorted by date and compressed (snappy by default). Row groups hold PRICE_STORE_ROW_GROUP_SIZE
+    bars and carry min / max date statistics, so a read from a start date skips the row groups
+    before it. Files are memory mapped on read and replaced atomically on write, so readers never
+    see a partly written file.
+
+    Bars from the last date of data.parquet onwards (e.g. a daily sync) are merged into a small
+    tail.parquet next to it instead, so an append costs O(tail) rather than O(history). The tail is
+    compacted into data.parquet once it holds a row group of bars. Reads combine both files, with
+    the tail's bar taking precedence on the date they share.
+
+    Writers of a dataset are serialised by a lock file under PRICE_STORE_DIR/.locks, so worker
+    processes sharing the store (e.g. the price-store volume) merge their bars one at a time.
+
+    Timestamps are stored tz-naive, in the exchange's local time for intraday bars.
+    """
+
+    def __init__(self,
+                 store_dir: str = Price_Store_Config.PRICE_STORE_DIR,
+                 compression: str = Price_Store_Config.PRICE_STORE_COMPRESSION,
+                 row_group_size: int = Price_Store_Config.PRICE_STORE_ROW_GROUP_SIZE,
+                 read_threads: int = Price_Store_Config.PRICE_STORE_READ_THREADS):
+        self.store_dir = store_dir
+        self.compression = compression
+        self.row_group_size = row_group_size
+        self.read_threads = read_threads
+
+        self._lock = threading.Lock()
+        self._key_locks = {}
+
+    def read(self, code: str, time_interval: str = "1d", start=None, end=None) -> pd.DataFrame:
+        """
+        Returns the stored bars of code between start and end (inclusive, either may be None)
+        as a DataFrame with flat Open / High / Low / Close / Volume columns and a DatetimeIndex,
+        the same frame StockPriceDB_Client.get_price_frame returns. Returns None if nothing is stored.
+        """
+        start = self._timestamp(start) if start is not None else None
+        end = self._timestamp(end) if end is not None else None
+
+        data, data_last = self._read_table(self._path(code, time_interval), start, end)
+        tail, _ = self._read_table(self._tail_path(code, time_interval), start, end)
+
+        if tail is not None and data_last is not None:
+            # a compaction in progress can leave bars in the tail that data.parquet already holds
+            tail = tail.filter(pc.greater_equal(tail.column("Date"), pa.scalar(data_last, pa.timestamp("ns"))))
+            if data is not None and tail.num_rows and data.num_rows and data.column("Date")[-1] == tail.column("Date")[0]:
+                data = data.slice(0, data.num_rows - 1)
+
+        tables = [table for table in (data, tail) if table is not None and table.num_rows]
+        if not tables:
+            return None
+
+        return self._frame(pa.concat_tables(tables) if len(tables) > 1 else tables[0])
+
+    def read_many(self, codes: list, time_interval: str = "1d", start=None, end=None) -> dict:
+        """
+        Reads many tickers at once across read_threads threads ({code: DataFrame or None}).
+        pyarrow releases the GIL while it decodes, so the files are read in parallel.
+        """
+        if len(codes) <= 1 or self.read_threads <= 1:
+            return {code: self.read(code, time_interval, start, end) for code in codes}
+
+        with ThreadPoolExecutor(max_workers=self.read_threads) as executor:
+            frames = executor.map(lambda code: self.read(code, time_interval, start, end), codes)
+            return dict(zip(codes, frames))
+
+    def write(self, code: str, time_interval: str, prices: pd.DataFrame) -> int:
+        """
+        Merges the bars of prices (flat OHLCV columns, DatetimeIndex) into the dataset of code.
+        Existing bars on the same timestamps are replaced. Returns the number of bars written.
+
+        Bars from the last date of data.parquet onwards go to the tail, which is compacted into
+        data.parquet once it reaches row_group_size bars. Bars before it rewrite data.parquet.
+        """
+        new = self._normalise(prices)
+        if new.empty:
+            return 0
+
+        path = self._path(code, time_interval)
+        tail_path = self._tail_path(code, time_interval)
+
+        with self._dataset_lock(code, time_interval):
+            data_last = self._date_range(path)[1]
+
+            if data_last is not None and new.index[0] >= data_last:
+                tail = self._merge(self._read_frame(tail_path), new)
+                tail = tail[tail.index >= data_last]
+                if len(tail) < self.row_group_size:
+                    self._write_file(tail_path, tail)
+                    logger.info(f"PriceStore appended {len(new)} bars of {code} | {time_interval} ({len(tail)} in the tail)")
+                    return len(new)
+
+            merged = self._merge(self._read_frame(path), self._read_frame(tail_path), new)
+            self._write_file(path, merged)
+            if os.path.exists(tail_path):
+                os.remove(tail_path)
+
+        logger.info(f"PriceStore wrote {len(new)} bars of {code} | {time_interval} ({len(merged)} stored)")
+        return len(new)
+
+    def date_range(self, code: str, time_interval: str = "1d") -> tuple:
+        """
+        Returns the (earliest, latest) stored dates of code, both None if nothing is stored.
+        Read from the row group statistics, no bars are decoded.
+        """
+        dates = [
+            date
+            for path in (self._path(code, time_interval), self._tail_path(code, time_interval))
+            for date in self._date_range(path)
+            if date is not None
+        ]
+        if not dates:
+            return None, None
+
+        return min(dates).date(), max(dates).date()
+
+    def codes(self, time_interval: str = "1d") -> list:
+        """
+        Returns every code with stored bars for time_interval, in alphabetical order.
+        """
+        interval_dir = self._interval_dir(time_interval)
+        if not os.path.isdir(interval_dir):
+            return []
+
+        return sorted(
+            unquote(name[len("code="):])
+            for name in os.listdir(interval_dir)
+            if name.startswith("code=") and (
+                os.path.exists(os.path.join(interval_dir, name, "data.parquet"))
+                or os.path.exists(os.path.join(interval_dir, name, "tail.parquet"))
+            )
+        )
+
+    def delete(self, code: str, time_interval: str = "1d"):
+        """
+        Removes the dataset of code from disk.
+        """
+        with self._dataset_lock(code, time_interval):
+            shutil.rmtree(os.path.dirname(self._path(code, time_interval)), ignore_errors=True)
+
+    def clear(self):
+        """
+        Removes every dataset from disk.
+        """
+        with self._lock:
+            if os.path.isdir(self.store_dir):
+                for name in os.listdir(self.store_dir):
+                    if name.startswith("interval="):
+                        shutil.rmtree(os.path.join(self.store_dir, name))
+
+    @contextmanager
+    def _dataset_lock(self, code: str, time_interval: str):
+        """
+        Holds the dataset of code exclusively, across the threads of this process and the other
+        processes writing to store_dir, so concurrent writes of the same ticker are merged one
+        at a time. The lock files live outside the datasets, which delete() removes.
+        """
+        with self._lock:
+            key_lock = self._key_locks.setdefault((code, time_interval), threading.Lock())
+
+        with key_lock:
+            if fcntl is None:
+                yield
+                return
+
+            lock_dir = os.path.join(self.store_dir, ".locks")
+            os.makedirs(lock_dir, exist_ok=True)
+            lock_name = f"{quote(time_interval, safe='')}.{quote(code, safe='')}.lock"
+            with open(os.path.join(lock_dir, lock_name), "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read_table(self, path: str, start, end) -> tuple:
+        """
+        Returns the (table, last date) of the file at path: the bars between start and end
+        (None if there are none) and the file's latest date from its statistics.
+        Both are None if the file does not exist.
+        """
+        try:
+            parquet_file = pq.ParquetFile(path, memory_map=True)
+        except FileNotFoundError:
+            return None, None  # no such file, or a tail removed by a compaction
+
+        last = self._date_range(parquet_file)[1]
+        row_groups = self._row_groups(parquet_file.metadata, start, end)
+        if not row_groups:
+            return None, last
+
+        table = parquet_file.read_row_groups(row_groups, use_threads=False)
+        # the first / last row groups read can still hold bars outside start - end
+        if start is not None:
+            table = table.filter(pc.greater_equal(table.column("Date"), pa.scalar(start, pa.timestamp("ns"))))
+        if end is not None:
+            table = table.filter(pc.less_equal(table.column("Date"), pa.scalar(end, pa.timestamp("ns"))))
+
+        return table, last
+
+    def _read_frame(self, path: str) -> pd.DataFrame:
+        table, _ = self._read_table(path, None, None)
+        return self._frame(table) if table is not None else None
+
+    def _write_file(self, path: str, frame: pd.DataFrame) -> None:
+        """
+        Writes frame to path through a temporary file, so the file is replaced atomically.
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # unique across the threads and processes writing to the store
+        tmp_path = f"{path}.{os.getpid()}.{uuid.uuid4().hex}.tmp"
+        pq.write_table(
+            self._table(frame),
+            tmp_path,
+            compression=self.compression,
+            row_group_size=self.row_group_size,
+            # prices do not repeat, plain / byte stream split encodings are smaller and decode faster
+            use_dictionary=False,
+            column_encoding={column: "BYTE_STREAM_SPLIT" for column in PRICE_COLUMNS[:-1]},
+        )
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _date_range(source) -> tuple:
+        """
+        Returns the (earliest, latest) Timestamps of a Parquet file (a path or an open ParquetFile)
+        from its row group statistics, both None if the file does not exist or is empty.
+        """
+        if isinstance(source, str):
+            try:
+                source = pq.ParquetFile(source, memory_map=True)
+            except FileNotFoundError:
+                return None, None
+
+        metadata = source.metadata
+        if metadata.num_rows == 0:
+            return None, None
+
+        first = metadata.row_group(0).column(0).statistics
+        last = metadata.row_group(metadata.num_row_groups - 1).column(0).statistics
+        if first is None or last is None or not first.has_min_max or not last.has_min_max:
+            dates = source.read(columns=["Date"], use_threads=False).column("Date").to_numpy()
+            return pd.Timestamp(dates[0]), pd.Timestamp(dates[-1])
+
+        return pd.Timestamp(first.min), pd.Timestamp(last.max)
+
+    @staticmethod
+    def _row_groups(metadata, start, end) -> list:
+        """
+        Returns the row groups whose min / max date statistics overlap start - end, i.e. the
+        date predicate is pushed down to the row groups and only those are decoded.
+        """
+        row_groups = []
+        for i in range(metadata.num_row_groups):
+            statistics = metadata.row_group(i).column(0).statistics
+            if statistics is not None and statistics.has_min_max:
+                if start is not None and pd.Timestamp(statistics.max) < start:
+                    continue
+                if end is not None and pd.Timestamp(statistics.min) > end:
+                    continue
+            row_groups.append(i)
+        return row_groups
+
+    def _interval_dir(self, time_interval: str) -> str:
+        return os.path.join(self.store_dir, f"interval={quote(time_interval, safe='')}")
+
+    def _path(self, code: str, time_interval: str) -> str:
+        return os.path.join(self._interval_dir(time_interval), f"code={quote(code, safe='')}", "data.parquet")
+
+    def _tail_path(self, code: str, time_interval: str) -> str:
+        return os.path.join(os.path.dirname(self._path(code, time_interval)), "tail.parquet")
+
+    @staticmethod
+    def _timestamp(value) -> pd.Timestamp:
+        timestamp = pd.Timestamp(value)
+        return timestamp.tz_localize(None) if timestamp.tz is not None else timestamp
+
+    @staticmethod
+    def _normalise(prices: pd.DataFrame) -> pd.DataFrame:
+        """
+        Returns the bars of prices with a close price, a tz-naive index and the stored dtypes.
+        """
+        frame = prices[PRICE_COLUMNS].dropna(subset=["Close"])
+        index = pd.DatetimeIndex(frame.index)
+        if index.tz is not None:
+            index = index.tz_localize(None)
+
+        return pd.DataFrame(
+            {
+                "Open": frame["Open"].to_numpy(dtype=float),
+                "High": frame["High"].to_numpy(dtype=float),
+                "Low": frame["Low"].to_numpy(dtype=float),
+                "Close": frame["Close"].to_numpy(dtype=float),
+                "Volume": frame["Volume"].fillna(0).to_numpy(dtype="int64"),
+            },
+            index=index.rename("Date"),
+        )
+
+    @staticmethod
+    def _merge(*frames) -> pd.DataFrame:
+        """
+        Concatenates stored frames (None for a missing file), later frames replacing the bars of
+        earlier ones on the same timestamps, sorted by date.
+        """
+        merged = pd.concat([frame for frame in frames if frame is not None])
+        return merged[~merged.index.duplicated(keep="last")].sort_index()
+
+    @staticmethod
+    def _frame(table: pa.Table) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "Open": table.column("Open").to_numpy(),
+                "High": table.column("High").to_numpy(),
+                "Low": table.column("Low").to_numpy(),
+                "Close": table.column("Close").to_numpy(),
+                "Volume": table.column("Volume").to_numpy().astype(float),
+            },
+            index=pd.DatetimeIndex(table.column("Date").to_numpy(), name="Date"),
+        )
+
+    @staticmethod
+    def _table(frame: pd.DataFrame) -> pa.Table:
+        return pa.Table.from_arrays(
+            [
+                pa.array(frame.index.to_numpy(dtype="datetime64[ns]"), type=pa.timestamp("ns")),
+                *[pa.array(frame[column].to_numpy(dtype=float)) for column in PRICE_COLUMNS[:-1]],
+                pa.array(frame["Volume"].to_numpy(dtype=np.int64)),
+            ],
+            schema=SCHEMA,
+        )
+
+
+price_store = PriceStore()
@@ -0,0 +1,55 @@
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+from setup_logging.setup_logging import logger
+from yf_service.common.config import Profiling_Config
+
+MIB = 1024 * 1024
+
+
+@contextmanager
+def memory_stage(stage: str, enabled: bool = None, report: dict = None):
+    """
+    Measures the peak memory allocated while the block runs and logs it with the stage name.
+    When report is given the measurement is also stored in it under the stage name.
+    Does nothing unless enabled (defaults to PROFILE_MEMORY), as tracing slows allocations down.
+    Ex:
+    >>> with memory_stage("trades"):
+    >>>     trades = Trades(strategy)
+    >>> memory trades: peak 1.52 MiB, retained 0.48 MiB in 0.0031s
+    """
+    if enabled is None:
+        enabled = Profiling_Config.PROFILE_MEMORY
+
+    if not enabled:
+        yield
+        return
+
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    before, _ = tracemalloc.get_traced_memory()
+    start = time.perf_counter()
+
+    try:
+        yield
+    finally:
+        current, peak = tracemalloc.get_traced_memory()
+        seconds = time.perf_counter() - start
+        if started:
+            tracemalloc.stop()
+
+        measurement = {
+            "peak_mib": round((peak - before) / MIB, 3),
+            "retained_mib": round((current - before) / MIB, 3),
+            "seconds": round(seconds, 4),
+        }
+        if report is not None:
+            report[stage] = measurement
+
+        logger.info(
+            f"memory {stage}: peak {measurement['peak_mib']} MiB, "
+            f"retained {measurement['retained_mib']} MiB in {measurement['seconds']}s"
+        )
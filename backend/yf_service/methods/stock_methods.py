@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 from sqlalchemy.exc import IntegrityError
 
 from db_service.db import DB_Client
@@ -5,6 +7,9 @@ from models.stock_model import StockModel
 from setup_logging.setup_logging import logger
 from yf_service.stats.utils.controller import StockController
 
+# upper bound on concurrent fundamentals downloads for batch requests
+MAX_FETCH_WORKERS = 16
+
 class StockDB_Client(DB_Client):
     def __init__(self):
         super().__init__()
@@ -45,62 +50,7 @@ class StockDB_Client(DB_Client):
             stock_obj = StockController(code, country)
             logger.info("Received output from StockController(code, country).")
             
-            new_stock = StockModel(
-                code=stock_obj.si.ticker,
-                country=stock_obj.si.country,
-                price=getattr(stock_obj.si.stockPriceMetrics, 'price', None),
-                marketCap=getattr(stock_obj.si.stockPriceMetrics, 'marketCap', None),
-                numSharesAvail=getattr(stock_obj.si.stockPriceMetrics, 'numSharesAvail', None),
-                yearlyLowPrice=getattr(stock_obj.si.stockPriceMetrics, 'yearlyLowPrice', None),
-                yearlyHighPrice=getattr(stock_obj.si.stockPriceMetrics, 'yearlyHighPrice', None),
-                fiftyDayMA=getattr(stock_obj.si.stockPriceMetrics, 'fiftyDayMA', None),
-                twoHundredDayMA=getattr(stock_obj.si.stockPriceMetrics, 'twoHundredDayMA', None),
-                acquirersMultiple=getattr(stock_obj.si.valueMetrics, 'acquirersMultiple', None),
-                currentRatio=getattr(stock_obj.si.valueMetrics, 'currentRatio', None),
-                enterpriseValue=getattr(stock_obj.si.valueMetrics, 'enterpriseValue', None),
-                eps=getattr(stock_obj.si.valueMetrics, 'eps', None),
-                evToEBITDA=getattr(stock_obj.si.valueMetrics, 'evToEBITDA', None),
-                evToRev=getattr(stock_obj.si.valueMetrics, 'evToRev', None),
-                peRatioTrail=getattr(stock_obj.si.valueMetrics, 'peRatioTrail', None),
-                peRatioForward=getattr(stock_obj.si.valueMetrics, 'peRatioForward', None),
-                priceToSales=getattr(stock_obj.si.valueMetrics, 'priceToSales', None),
-                priceToBook=getattr(stock_obj.si.valueMetrics, 'priceToBook', None),
-                dividendYield=getattr(stock_obj.si.dividendMetrics, 'dividendYield', None),
-                dividendRate=getattr(stock_obj.si.dividendMetrics, 'dividendRate', None),
-                exDivDate=getattr(stock_obj.si.dividendMetrics, 'exDivDate', None),
-                payoutRatio=getattr(stock_obj.si.dividendMetrics, 'payoutRatio', None),
-                bookValPerShare=getattr(stock_obj.si.balanceSheetMetrics, 'bookValPerShare', None),
-                cash=getattr(stock_obj.si.balanceSheetMetrics, 'cash', None),
-                cashPerShare=getattr(stock_obj.si.balanceSheetMetrics, 'cashPerShare', None),
-                cashToMarketCap=getattr(stock_obj.si.balanceSheetMetrics, 'cashToMarketCap', None),
-                cashToDebt=getattr(stock_obj.si.balanceSheetMetrics, 'cashToDebt', None),
-                debt=getattr(stock_obj.si.balanceSheetMetrics, 'debt', None),
-                debtToMarketCap=getattr(stock_obj.si.balanceSheetMetrics, 'debtToMarketCap', None),
-                debtToEquityRatio=getattr(stock_obj.si.balanceSheetMetrics, 'debtToEquityRatio', None),
-                returnOnAssets=getattr(stock_obj.si.balanceSheetMetrics, 'returnOnAssets', None),
-                returnOnEquity=getattr(stock_obj.si.balanceSheetMetrics, 'returnOnEquity', None),
-                ebitda=getattr(stock_obj.si.incomeRelatedMetrics, 'ebitda', None),
-                ebitdaPerShare=getattr(stock_obj.si.incomeRelatedMetrics, 'ebitdaPerShare', None),
-                earningsGrowth=getattr(stock_obj.si.incomeRelatedMetrics, 'earningsGrowth', None),
-                grossProfit=getattr(stock_obj.si.incomeRelatedMetrics, 'grossProfit', None),
-                grossProfitPerShare=getattr(stock_obj.si.incomeRelatedMetrics, 'grossProfitPerShare', None),
-                netIncome=getattr(stock_obj.si.incomeRelatedMetrics, 'netIncome', None),
-                netIncomePerShare=getattr(stock_obj.si.incomeRelatedMetrics, 'netIncomePerShare', None),
-                operatingMargin=getattr(stock_obj.si.incomeRelatedMetrics, 'operatingMargin', None),
-                profitMargin=getattr(stock_obj.si.incomeRelatedMetrics, 'profitMargin', None),
-                revenue=getattr(stock_obj.si.incomeRelatedMetrics, 'revenue', None),
-                revenueGrowth=getattr(stock_obj.si.incomeRelatedMetrics, 'revenueGrowth', None),
-                revenuePerShare=getattr(stock_obj.si.incomeRelatedMetrics, 'revenuePerShare', None),
-                fcf=getattr(stock_obj.si.cashFlowMetrics, 'fcf', None),
-                fcfToMarketCap=getattr(stock_obj.si.cashFlowMetrics, 'fcfToMarketCap', None),
-                fcfPerShare=getattr(stock_obj.si.cashFlowMetrics, 'fcfPerShare', None),
-                fcfToEV=getattr(stock_obj.si.cashFlowMetrics, 'fcfToEV', None),
-                ocf=getattr(stock_obj.si.cashFlowMetrics, 'ocf', None),
-                ocfToRevenueRatio=getattr(stock_obj.si.cashFlowMetrics, 'ocfToRevenueRatio', None),
-                ocfToMarketCap=getattr(stock_obj.si.cashFlowMetrics, 'ocfToMarketCap', None),
-                ocfPerShare=getattr(stock_obj.si.cashFlowMetrics, 'ocfPerShare', None),
-                ocfToEV=getattr(stock_obj.si.cashFlowMetrics, 'ocfToEV', None)
-            )
+            new_stock = self._build_stock_model(stock_obj)
             
             self.session.add(new_stock)
             self.session.commit()
@@ -128,6 +78,133 @@ class StockDB_Client(DB_Client):
             raise e
 
 
+    def add_batch_stocks(self, json_data: dict) -> dict:
+        """
+        Adds many stocks to the database at once.
+        Fundamentals are fetched concurrently with a bounded thread pool and all successful
+        results are persisted in one transaction. Returns the status of each stock code.
+        """
+        try:
+            logger.info("add_batch_stocks: Adding a batch of stocks")
+            stocks = json_data.get("stocks")
+            max_workers = int(json_data.get("max_workers", MAX_FETCH_WORKERS))
+            logger.info(f"Received: {stocks} | {max_workers}")
+
+            if not stocks or not isinstance(stocks, list):
+                logger.error("'stocks' must be a list of {'stock': code, 'country': country} items.")
+                raise ValueError("'stocks' must be a list of {'stock': code, 'country': country} items.")
+
+            requested = {}
+            for item in stocks:
+                code = item.get("stock") if isinstance(item, dict) else None
+                country = item.get("country") if isinstance(item, dict) else None
+                if not code or not country:
+                    logger.error("Both 'stock' and 'country' are required for every item.")
+                    raise ValueError("Both 'stock' and 'country' are required for every item.")
+                requested[code] = country
+
+            existing_codes = {
+                code for (code,) in
+                self.session.query(StockModel.code).filter(StockModel.code.in_(list(requested)))
+            }
+            status = {code: "exists" for code in existing_codes}
+            to_fetch = {code: country for code, country in requested.items() if code not in existing_codes}
+
+            new_stocks = []
+            max_workers = max(1, min(max_workers, MAX_FETCH_WORKERS, len(to_fetch) or 1))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(StockController, code, country): code
+                    for code, country in to_fetch.items()
+                }
+                for future in as_completed(futures):
+                    code = futures[future]
+                    try:
+                        new_stocks.append(self._build_stock_model(future.result()))
+                        status[code] = "added"
+                    except Exception as e:
+                        logger.error(f"add_batch_stocks failed to fetch {code}: {e}")
+                        status[code] = f"error: {e}"
+
+            self.session.add_all(new_stocks)
+            self.session.commit()
+            logger.info(f"Added {len(new_stocks)} stocks to db.")
+            return {code: status[code] for code in requested}
+
+        except ValueError as ve:
+            self.session.rollback()
+            logger.error(f"add_batch_stocks ValueError: {ve}")
+            raise ve
+
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"add_batch_stocks error: {e}")
+            raise e
+
+
+    @staticmethod
+    def _build_stock_model(stock_obj: StockController) -> StockModel:
+        """
+        Builds a StockModel from the metrics collected by a StockController.
+        """
+        return StockModel(
+            code=stock_obj.si.ticker,
+            country=stock_obj.si.country,
+            price=getattr(stock_obj.si.stockPriceMetrics, 'price', None),
+            marketCap=getattr(stock_obj.si.stockPriceMetrics, 'marketCap', None),
+            numSharesAvail=getattr(stock_obj.si.stockPriceMetrics, 'numSharesAvail', None),
+            yearlyLowPrice=getattr(stock_obj.si.stockPriceMetrics, 'yearlyLowPrice', None),
+            yearlyHighPrice=getattr(stock_obj.si.stockPriceMetrics, 'yearlyHighPrice', None),
+            fiftyDayMA=getattr(stock_obj.si.stockPriceMetrics, 'fiftyDayMA', None),
+            twoHundredDayMA=getattr(stock_obj.si.stockPriceMetrics, 'twoHundredDayMA', None),
+            acquirersMultiple=getattr(stock_obj.si.valueMetrics, 'acquirersMultiple', None),
+            currentRatio=getattr(stock_obj.si.valueMetrics, 'currentRatio', None),
+            enterpriseValue=getattr(stock_obj.si.valueMetrics, 'enterpriseValue', None),
+            eps=getattr(stock_obj.si.valueMetrics, 'eps', None),
+            evToEBITDA=getattr(stock_obj.si.valueMetrics, 'evToEBITDA', None),
+            evToRev=getattr(stock_obj.si.valueMetrics, 'evToRev', None),
+            peRatioTrail=getattr(stock_obj.si.valueMetrics, 'peRatioTrail', None),
+            peRatioForward=getattr(stock_obj.si.valueMetrics, 'peRatioForward', None),
+            priceToSales=getattr(stock_obj.si.valueMetrics, 'priceToSales', None),
+            priceToBook=getattr(stock_obj.si.valueMetrics, 'priceToBook', None),
+            dividendYield=getattr(stock_obj.si.dividendMetrics, 'dividendYield', None),
+            dividendRate=getattr(stock_obj.si.dividendMetrics, 'dividendRate', None),
+            exDivDate=getattr(stock_obj.si.dividendMetrics, 'exDivDate', None),
+            payoutRatio=getattr(stock_obj.si.dividendMetrics, 'payoutRatio', None),
+            bookValPerShare=getattr(stock_obj.si.balanceSheetMetrics, 'bookValPerShare', None),
+            cash=getattr(stock_obj.si.balanceSheetMetrics, 'cash', None),
+            cashPerShare=getattr(stock_obj.si.balanceSheetMetrics, 'cashPerShare', None),
+            cashToMarketCap=getattr(stock_obj.si.balanceSheetMetrics, 'cashToMarketCap', None),
+            cashToDebt=getattr(stock_obj.si.balanceSheetMetrics, 'cashToDebt', None),
+            debt=getattr(stock_obj.si.balanceSheetMetrics, 'debt', None),
+            debtToMarketCap=getattr(stock_obj.si.balanceSheetMetrics, 'debtToMarketCap', None),
+            debtToEquityRatio=getattr(stock_obj.si.balanceSheetMetrics, 'debtToEquityRatio', None),
+            returnOnAssets=getattr(stock_obj.si.balanceSheetMetrics, 'returnOnAssets', None),
+            returnOnEquity=getattr(stock_obj.si.balanceSheetMetrics, 'returnOnEquity', None),
+            ebitda=getattr(stock_obj.si.incomeRelatedMetrics, 'ebitda', None),
+            ebitdaPerShare=getattr(stock_obj.si.incomeRelatedMetrics, 'ebitdaPerShare', None),
+            earningsGrowth=getattr(stock_obj.si.incomeRelatedMetrics, 'earningsGrowth', None),
+            grossProfit=getattr(stock_obj.si.incomeRelatedMetrics, 'grossProfit', None),
+            grossProfitPerShare=getattr(stock_obj.si.incomeRelatedMetrics, 'grossProfitPerShare', None),
+            netIncome=getattr(stock_obj.si.incomeRelatedMetrics, 'netIncome', None),
+            netIncomePerShare=getattr(stock_obj.si.incomeRelatedMetrics, 'netIncomePerShare', None),
+            operatingMargin=getattr(stock_obj.si.incomeRelatedMetrics, 'operatingMargin', None),
+            profitMargin=getattr(stock_obj.si.incomeRelatedMetrics, 'profitMargin', None),
+            revenue=getattr(stock_obj.si.incomeRelatedMetrics, 'revenue', None),
+            revenueGrowth=getattr(stock_obj.si.incomeRelatedMetrics, 'revenueGrowth', None),
+            revenuePerShare=getattr(stock_obj.si.incomeRelatedMetrics, 'revenuePerShare', None),
+            fcf=getattr(stock_obj.si.cashFlowMetrics, 'fcf', None),
+            fcfToMarketCap=getattr(stock_obj.si.cashFlowMetrics, 'fcfToMarketCap', None),
+            fcfPerShare=getattr(stock_obj.si.cashFlowMetrics, 'fcfPerShare', None),
+            fcfToEV=getattr(stock_obj.si.cashFlowMetrics, 'fcfToEV', None),
+            ocf=getattr(stock_obj.si.cashFlowMetrics, 'ocf', None),
+            ocfToRevenueRatio=getattr(stock_obj.si.cashFlowMetrics, 'ocfToRevenueRatio', None),
+            ocfToMarketCap=getattr(stock_obj.si.cashFlowMetrics, 'ocfToMarketCap', None),
+            ocfPerShare=getattr(stock_obj.si.cashFlowMetrics, 'ocfPerShare', None),
+            ocfToEV=getattr(stock_obj.si.cashFlowMetrics, 'ocfToEV', None)
+        )
+
+
     def delete_all_stocks(self) -> bool:
         """
         Removes all stocks from the database.
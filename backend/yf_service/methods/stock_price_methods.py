@@ -1,21 +1,61 @@
+import numpy as np
+import pandas as pd
+from sqlalchemy import func, select
+
+from db_service.bulk import bulk_insert, bulk_upsert
 from db_service.db import DB_Client
+from models.stock_price_coverage_model import StockPriceCoverageModel
 from models.stock_price_model import StockPriceModel
 from setup_logging.setup_logging import logger
-from yf_service.common.core import get_yf_stock_data
+from yf_service.common.cache import period_start
+from yf_service.common.config import Price_Store_Config
+from yf_service.common.core import download_yf_stock_data, get_ticker_frame, get_yf_stock_data
+from yf_service.common.price_store import price_store
+
+# intervals stored in stock_price_history, whose rows are keyed on (code, time_interval, date):
+# intraday bars would collapse onto their date
+STORED_TIME_INTERVALS = ["1d", "5d", "1wk", "1mo", "3mo"]
+CONFLICT_COLUMNS = ["code", "time_interval", "date"]
 
 class StockPriceDB_Client(DB_Client):
     def __init__(self):
         super().__init__()
 
-    def get_stock_price(self, code: str) -> dict:
+    def get_stock_price(self, code: str, time_interval: str = "1d") -> dict:
         """
-        Fetches all stock prices for a given stock code.
+        Fetches all stock prices of one interval for a given stock code.
         """
         try:
             logger.info("get_stock_price: Getting all stock prices")
+            if Price_Store_Config.PRICE_STORE_ENABLED:
+                df = price_store.read(code, time_interval)
+                if df is not None:
+                    logger.info(f"get_stock_price: Stock prices were fetched for {code} from the price store.")
+                    return {
+                        "code": code,
+                        "prices": [
+                            {
+                                "date": date,
+                                "open": open_price,
+                                "high": high_price,
+                                "low": low_price,
+                                "close": close_price,
+                                "volume": int(volume),
+                            }
+                            for date, open_price, high_price, low_price, close_price, volume in zip(
+                                df.index.strftime('%Y-%m-%d'),
+                                df["Open"].tolist(),
+                                df["High"].tolist(),
+                                df["Low"].tolist(),
+                                df["Close"].tolist(),
+                                df["Volume"].tolist(),
+                            )
+                        ],
+                    }
+
             prices = (
                 self.session.query(StockPriceModel)
-                .filter_by(code=code)
+                .filter_by(code=code, time_interval=time_interval)
                 .order_by(StockPriceModel.date)
                 .all()
             )
@@ -49,6 +89,7 @@ class StockPriceDB_Client(DB_Client):
     def add_individual_stock_price(self, json_data: dict) -> bool:
         """
         Adds individual stock price data to the database for a given stock code.
+        If 'upsert' is set, existing prices are updated in place instead of returning False.
         """
         try:
             logger.info("add_individual_stock_price: Adding individual stock price")
@@ -56,11 +97,12 @@ class StockPriceDB_Client(DB_Client):
             country = json_data.get("country")
             time_period = json_data.get("time_period")
             time_interval = json_data.get("time_interval")
-            logger.info(f"Received: {code} | {country} | {time_period} | {time_interval}")
+            upsert = bool(json_data.get("upsert", False))
+            logger.info(f"Received: {code} | {country} | {time_period} | {time_interval} | {upsert}")
 
             logger.info("Checking for existing stock price")
-            existing_stock_price = self.session.query(StockPriceModel).filter_by(code=code).first()
-            if existing_stock_price:
+            existing_stock_price = self.session.query(StockPriceModel).filter_by(code=code, time_interval=time_interval).first()
+            if existing_stock_price and not upsert:
                 logger.info(f"Stock prices found for {code}")
                 return False
 
@@ -69,6 +111,8 @@ class StockPriceDB_Client(DB_Client):
                 logger.error("Missing required fields: 'code', 'country', 'time_period', or 'time_interval'.")
                 raise ValueError("Missing required fields: 'code', 'country', 'time_period', or 'time_interval'.")
 
+            self._check_time_interval(time_interval)
+
             logger.info("Retrieving stock prices.")
             df = get_yf_stock_data(ticker=code, time_period=time_period, time_interval=time_interval)
 
@@ -84,26 +128,28 @@ class StockPriceDB_Client(DB_Client):
                 logger.error("All columns in the data must have the same length.")
                 raise ValueError("All columns in the data must have the same length.")
 
-            existing_stock_price = self.session.query(StockPriceModel).filter_by(code=code).first()
-            logger.info(f"Output from quering StockPriceModel to check if code already exists: {existing_stock_price}")
-
-            if not existing_stock_price:
-                logger.info(f"Adding stock prices for {code} to db.")
-                for index, row in df.iterrows():
-                    new_price = StockPriceModel(
-                        code=code,
-                        country=country,
-                        date=index.date(),
-                        open_price=row['Open'].iloc[0],
-                        high_price=row['High'].iloc[0],
-                        low_price=row['Low'].iloc[0],
-                        close_price=row['Close'].iloc[0],
-                        volume=float(row['Volume'].iloc[0])
-                    )
-                    self.session.add(new_price)
-                logger.info(f"Added stock prices for {code} to db.")
+            written = False
+            if upsert:
+                logger.info(f"Upserting stock prices for {code} to db.")
+                bulk_upsert(self.session, StockPriceModel, self._price_rows(code, country, df, time_interval), conflict_columns=CONFLICT_COLUMNS)
+                written = True
+                logger.info(f"Upserted stock prices for {code} to db.")
+
+            else:
+                existing_stock_price = self.session.query(StockPriceModel).filter_by(code=code, time_interval=time_interval).first()
+                logger.info(f"Output from quering StockPriceModel to check if code already exists: {existing_stock_price}")
 
+                if not existing_stock_price:
+                    logger.info(f"Adding stock prices for {code} to db.")
+                    bulk_insert(self.session, StockPriceModel, self._price_rows(code, country, df, time_interval))
+                    written = True
+                    logger.info(f"Added stock prices for {code} to db.")
+
+            if written:
+                self._record_coverage(code, time_interval, time_period)
             self.session.commit()
+            if written:
+                self._store_prices(code, time_interval, df)
             return True
 
         except ValueError as ve:
@@ -117,6 +163,398 @@ class StockPriceDB_Client(DB_Client):
             raise Exception(f"Failed to add stock price data: {e}")
 
 
+    def add_batch_stock_price(self, json_data: dict) -> dict:
+        """
+        Adds stock price data for many stock codes at once.
+        Codes are downloaded 'batch_size' at a time with a single yfinance call per batch,
+        split per ticker and persisted together in one transaction.
+        Returns the status of each code.
+        """
+        try:
+            logger.info("add_batch_stock_price: Adding stock prices for a batch of codes")
+            codes = json_data.get("codes")
+            country = json_data.get("country")
+            time_period = json_data.get("time_period")
+            time_interval = json_data.get("time_interval")
+            upsert = bool(json_data.get("upsert", False))
+            batch_size = int(json_data.get("batch_size", 50))
+            logger.info(f"Received: {codes} | {country} | {time_period} | {time_interval} | {upsert} | {batch_size}")
+
+            if not codes or not isinstance(codes, list) or not country or not time_period or not time_interval:
+                logger.error("Missing required fields: 'codes', 'country', 'time_period', or 'time_interval'.")
+                raise ValueError("Missing required fields: 'codes', 'country', 'time_period', or 'time_interval'.")
+
+            if batch_size < 1:
+                raise ValueError("'batch_size' must be a positive integer.")
+
+            self._check_time_interval(time_interval)
+
+            codes = list(dict.fromkeys(code.strip() for code in codes))
+            status = {}
+
+            if not upsert:
+                logger.info("Checking for existing stock prices")
+                existing_codes = {
+                    code for (code,) in
+                    self.session.query(StockPriceModel.code)
+                    .filter(StockPriceModel.code.in_(codes), StockPriceModel.time_interval == time_interval)
+                    .distinct()
+                }
+                status.update({code: "exists" for code in existing_codes})
+                codes = [code for code in codes if code not in existing_codes]
+
+            rows = []
+            written = []
+            for batch_start in range(0, len(codes), batch_size):
+                batch = codes[batch_start:batch_start + batch_size]
+                logger.info(f"Retrieving stock prices for {batch}.")
+                df = get_yf_stock_data(ticker=" ".join(batch), time_period=time_period, time_interval=time_interval, use_cache=False)
+
+                for code in batch:
+                    code_rows = self._price_rows(code, country, df, time_interval) if df is not None else []
+                    status[code] = len(code_rows) if code_rows else "no data"
+                    rows.extend(code_rows)
+                    if code_rows:
+                        written.append((code, df))
+
+            if upsert:
+                bulk_upsert(self.session, StockPriceModel, rows, conflict_columns=CONFLICT_COLUMNS)
+            else:
+                bulk_insert(self.session, StockPriceModel, rows)
+            for code, _ in written:
+                self._record_coverage(code, time_interval, time_period)
+
+            self.session.commit()
+            for code, df in written:
+                self._store_prices(code, time_interval, df)
+            logger.info(f"Added {len(rows)} stock prices for {len(codes)} codes.")
+            return status
+
+        except ValueError as ve:
+            self.session.rollback()
+            logger.error(f"add_batch_stock_price ValueError: {ve}")
+            raise ve
+
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"add_batch_stock_price error: {e}")
+            raise Exception(f"Failed to add batch stock price data: {e}")
+
+
+    def sync_stock_price(self, json_data: dict) -> dict:
+        """
+        Incrementally refreshes stock price data for a given stock code.
+        Only bars on or after the latest stored date of the interval are downloaded. The latest
+        stored bar is updated in place and newer bars are appended. If nothing is stored yet, the
+        full 'time_period' is downloaded. Intraday intervals raise ValueError, as bars are stored
+        one per date.
+        """
+        try:
+            logger.info("sync_stock_price: Syncing stock price")
+            code = json_data.get("code")
+            country = json_data.get("country")
+            time_period = json_data.get("time_period")
+            time_interval = json_data.get("time_interval")
+            logger.info(f"Received: {code} | {country} | {time_period} | {time_interval}")
+
+            if not code or not country or not time_interval:
+                logger.error("Missing required fields: 'code', 'country' or 'time_interval'.")
+                raise ValueError("Missing required fields: 'code', 'country' or 'time_interval'.")
+
+            self._check_time_interval(time_interval)
+
+            latest_date = self.get_latest_date(code, time_interval)
+            logger.info(f"Latest stored date for {code}: {latest_date}")
+
+            if latest_date is None:
+                if not time_period:
+                    logger.error(f"No stock prices stored for {code}, 'time_period' is required.")
+                    raise ValueError(f"No stock prices stored for {code}, 'time_period' is required.")
+
+                df = get_yf_stock_data(ticker=code, time_period=time_period, time_interval=time_interval)
+            else:
+                df = download_yf_stock_data(ticker=code, time_interval=time_interval, start=latest_date)
+
+            if df is None:
+                raise ValueError(f"Failed to download stock prices for {code}.")
+
+            rows = self._price_rows(code, country, df, time_interval)
+            if latest_date is not None:
+                rows = [row for row in rows if row["date"] >= latest_date]
+            rows_added = sum(1 for row in rows if latest_date is None or row["date"] > latest_date)
+
+            bulk_upsert(self.session, StockPriceModel, rows, conflict_columns=CONFLICT_COLUMNS)
+            if latest_date is None:
+                self._record_coverage(code, time_interval, time_period)
+            self.session.commit()
+            self._store_prices(code, time_interval, df)
+
+            logger.info(f"Synced stock prices for {code}: {rows_added} rows added.")
+            return {
+                "code": code,
+                "rows_added": rows_added,
+                "latest_date": max((row["date"] for row in rows), default=latest_date),
+            }
+
+        except ValueError as ve:
+            self.session.rollback()
+            logger.error(f"sync_stock_price ValueError: {ve}")
+            raise ve
+
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"sync_stock_price error: {e}")
+            raise Exception(f"Failed to sync stock price data: {e}")
+
+
+    def get_latest_date(self, code: str, time_interval: str = "1d"):
+        """
+        Returns the latest stored price date for a given stock code, or None if nothing is stored.
+        """
+        return self.get_date_range(code, time_interval)[1]
+
+
+    def get_date_range(self, code: str, time_interval: str = "1d") -> tuple:
+        """
+        Returns the (earliest, latest) stored price dates of one interval for a given stock code.
+        Both are None if nothing is stored.
+        """
+        if Price_Store_Config.PRICE_STORE_ENABLED:
+            first_date, last_date = price_store.date_range(code, time_interval)
+            if last_date is not None:
+                return first_date, last_date
+
+        return (
+            self.session.query(func.min(StockPriceModel.date), func.max(StockPriceModel.date))
+            .filter(StockPriceModel.code == code, StockPriceModel.time_interval == time_interval)
+            .one()
+        )
+
+
+    def get_codes(self, time_interval: str = "1d") -> list:
+        """
+        Returns every stock code with stored prices of time_interval, in alphabetical order.
+        """
+        return list(self.session.execute(
+            select(StockPriceModel.code)
+            .where(StockPriceModel.time_interval == time_interval)
+            .distinct()
+            .order_by(StockPriceModel.code)
+        ).scalars())
+
+
+    def get_country(self, code: str):
+        """
+        Returns the country stored with the prices of a given stock code, or None if nothing is stored.
+        """
+        return self.session.execute(
+            select(StockPriceModel.country)
+            .where(StockPriceModel.code == code, StockPriceModel.country.is_not(None))
+            .limit(1)
+        ).scalar()
+
+
+    def get_covered_from(self, code: str, time_interval: str = "1d") -> tuple:
+        """
+        Returns (recorded, covered_from) for the prices of one interval of a given stock code:
+        whether a full period download was recorded, and the earliest period start downloaded,
+        None for 'max'. Tickers listed after that start, or with gaps in their bars, are covered
+        from it all the same, as the provider has nothing earlier.
+        """
+        coverage = (
+            self.session.query(StockPriceCoverageModel)
+            .filter_by(code=code, time_interval=time_interval)
+            .first()
+        )
+        if coverage is None:
+            return False, None
+        return True, coverage.covered_from
+
+
+    def get_price_frame(self, code: str, start=None, time_interval: str = "1d") -> pd.DataFrame:
+        """
+        Loads stored prices of one interval for a given stock code (from start onwards, if given)
+        into a DataFrame with flat Open / High / Low / Close / Volume columns and a DatetimeIndex.
+        The price store is read first when enabled, stock_price_history otherwise.
+        Returns None if no prices are stored.
+        """
+        try:
+            logger.info(f"get_price_frame: Loading stored prices for {code} from {start}")
+            if Price_Store_Config.PRICE_STORE_ENABLED:
+                df = price_store.read(code, time_interval, start=start)
+                if df is not None:
+                    return df
+
+            return self._db_price_frame(code, start=start, time_interval=time_interval)
+
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"get_price_frame error: {e}")
+            raise Exception(f"Failed to load stock prices for code {code}: {e}")
+
+
+    def _db_price_frame(self, code: str, start=None, time_interval: str = "1d") -> pd.DataFrame:
+        """
+        Loads the stock_price_history rows of a given stock code into a price frame, see get_price_frame.
+        """
+        query = (
+            select(
+                StockPriceModel.date,
+                StockPriceModel.open_price,
+                StockPriceModel.high_price,
+                StockPriceModel.low_price,
+                StockPriceModel.close_price,
+                StockPriceModel.volume,
+            )
+            .where(StockPriceModel.code == code, StockPriceModel.time_interval == time_interval)
+            .order_by(StockPriceModel.date)
+        )
+        if start is not None:
+            query = query.where(StockPriceModel.date >= start)
+
+        rows = self.session.execute(query).all()
+        if not rows:
+            logger.info(f"get_price_frame: No stored prices for {code}.")
+            return None
+
+        dates, opens, highs, lows, closes, volumes = zip(*rows)
+        return pd.DataFrame(
+            {
+                "Open": np.array(opens, dtype=float),
+                "High": np.array(highs, dtype=float),
+                "Low": np.array(lows, dtype=float),
+                "Close": np.array(closes, dtype=float),
+                "Volume": np.array(volumes, dtype=float),
+            },
+            index=pd.DatetimeIndex(dates, name="Date"),
+        )
+
+
+    def get_price_frames(self, codes: list, start=None, time_interval: str = "1d") -> dict:
+        """
+        Loads the stored prices of many stock codes ({code: DataFrame or None}), see get_price_frame.
+        With the price store enabled the codes are read from it together, and only codes it does
+        not hold are loaded from stock_price_history.
+        """
+        frames = {}
+        if Price_Store_Config.PRICE_STORE_ENABLED:
+            logger.info(f"get_price_frames: Loading {len(codes)} codes from the price store from {start}")
+            frames = {code: df for code, df in price_store.read_many(codes, time_interval, start=start).items() if df is not None}
+
+        for code in codes:
+            if code not in frames:
+                frames[code] = self.get_price_frame(code, start=start, time_interval=time_interval)
+        return frames
+
+
+    def store_price_frame(self, code: str, country: str, df: pd.DataFrame, time_interval: str = "1d", time_period: str = None) -> int:
+        """
+        Upserts a downloaded yfinance DataFrame for a given stock code and commits.
+        When df holds the full time_period, the period is recorded as covered (see get_covered_from).
+        Returns the number of rows written.
+        """
+        try:
+            rows = self._price_rows(code, country, df, time_interval)
+            bulk_upsert(self.session, StockPriceModel, rows, conflict_columns=CONFLICT_COLUMNS)
+            if time_period:
+                self._record_coverage(code, time_interval, time_period)
+            self.session.commit()
+            self._store_prices(code, time_interval, df)
+            return len(rows)
+
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"store_price_frame error: {e}")
+            raise Exception(f"Failed to store stock prices for code {code}: {e}")
+
+
+    def _store_prices(self, code: str, time_interval: str, df: pd.DataFrame) -> None:
+        """
+        Writes the bars of a given stock code in a yfinance DataFrame to the price store, if enabled.
+        Called after the db commit, so the store never holds bars the db does not. If the write
+        fails the dataset is dropped: reads fall back to the db and the next write rebuilds it.
+        """
+        if not Price_Store_Config.PRICE_STORE_ENABLED:
+            return
+
+        try:
+            if price_store.date_range(code, time_interval)[1] is None:
+                # first write of a code: the dataset starts from the committed rows of the interval,
+                # which include these bars and any stored before the price store was enabled
+                stored = self._db_price_frame(code, time_interval=time_interval)
+                if stored is not None:
+                    price_store.write(code, time_interval, stored)
+                    return
+
+            price_store.write(code, time_interval, get_ticker_frame(df, code))
+
+        except Exception as e:
+            logger.error(f"_store_prices error, dropping the price store dataset of {code} | {time_interval}: {e}")
+            price_store.delete(code, time_interval)
+
+
+    def _record_coverage(self, code: str, time_interval: str, time_period: str) -> None:
+        """
+        Records in the session that time_period of a given stock code has been downloaded, unless an
+        earlier start is already recorded. Committed together with the prices.
+        """
+        start = period_start(time_period, pd.Timestamp.now())
+        covered_from = start.date() if start is not None else None
+
+        recorded, recorded_from = self.get_covered_from(code, time_interval)
+        if recorded and (recorded_from is None or (covered_from is not None and recorded_from <= covered_from)):
+            return
+
+        bulk_upsert(
+            self.session,
+            StockPriceCoverageModel,
+            [{"code": code, "time_interval": time_interval, "covered_from": covered_from}],
+            conflict_columns=["code", "time_interval"],
+        )
+
+
+    @staticmethod
+    def _check_time_interval(time_interval: str) -> None:
+        """
+        Raises ValueError for intervals stock_price_history does not store.
+        """
+        if time_interval not in STORED_TIME_INTERVALS:
+            logger.error(f"Unsupported time_interval '{time_interval}', choose one of {STORED_TIME_INTERVALS}.")
+            raise ValueError(f"Unsupported time_interval '{time_interval}', choose one of {STORED_TIME_INTERVALS}.")
+
+
+    @staticmethod
+    def _price_rows(code: str, country: str, df: pd.DataFrame, time_interval: str = "1d") -> list:
+        """
+        Builds StockPriceModel rows straight from the OHLCV columns of a yfinance DataFrame.
+        Bars without a close price (e.g. non-trading days in multi-ticker downloads) are skipped.
+        """
+        prices = get_ticker_frame(df, code).dropna(subset=["Close"])
+        columns = zip(
+            prices.index.date,
+            prices["Open"].to_numpy(dtype=float).tolist(),
+            prices["High"].to_numpy(dtype=float).tolist(),
+            prices["Low"].to_numpy(dtype=float).tolist(),
+            prices["Close"].to_numpy(dtype=float).tolist(),
+            prices["Volume"].fillna(0).to_numpy(dtype="int64").tolist(),
+        )
+
+        return [
+            {
+                "code": code,
+                "country": country,
+                "time_interval": time_interval,
+                "date": date,
+                "open_price": open_price,
+                "high_price": high_price,
+                "low_price": low_price,
+                "close_price": close_price,
+                "volume": volume,
+            }
+            for date, open_price, high_price, low_price, close_price, volume in columns
+        ]
+
+
     def delete_all_stock_price(self) -> int:
         """
         Deletes all stock price data from the database.
@@ -124,7 +562,10 @@ class StockPriceDB_Client(DB_Client):
         try:
             logger.info("delete_all_stock_price: Deleting all stock prices")
             rows_deleted = self.session.query(StockPriceModel).delete()
+            self.session.query(StockPriceCoverageModel).delete()
             self.session.commit()
+            if Price_Store_Config.PRICE_STORE_ENABLED:
+                price_store.clear()
 
             logger.info(f"Deleted {rows_deleted} rows.")
             return rows_deleted
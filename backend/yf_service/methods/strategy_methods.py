@@ -1,11 +1,26 @@
+import pandas as pd
+from sqlalchemy.exc import IntegrityError
+
+from db_service.bulk import bulk_insert
 from db_service.db import DB_Client
 from models.result_model import ResultsModel
 from models.strategy_model import StrategyModel
+from models.streaming_state_model import StreamingStateModel
 from setup_logging.setup_logging import logger
+from yf_service.common.cache import period_start
 from yf_service.common.core import get_yf_stock_data
+from yf_service.common.profiling import memory_stage
+from yf_service.methods.stock_price_methods import stockPriceDB_Client
 from yf_service.strategy.results import Results
 from yf_service.strategy.trades import Trades
 from yf_service.strategy.handler import StrategyHandler
+from yf_service.strategy.monte_carlo import simulate_trade_sequences
+from yf_service.strategy.portfolio import run_portfolio_backtest
+from yf_service.strategy.compare import compare_strategies
+from yf_service.strategy.sweep import run_parameter_sweep
+from yf_service.strategy.streaming import create_streaming_strategy, load_streaming_strategy
+from yf_service.strategy.universe import run_universe_backtest
+from yf_service.strategy.walk_forward import run_walk_forward
 
 class StrategyDB_Client(DB_Client):
     def __init__(self):
@@ -78,6 +93,52 @@ class StrategyDB_Client(DB_Client):
             logger.error(f"get_results_for_code error: {e}")
             raise Exception(f"Failed to get strategy results: {e}")
 
+    def monte_carlo_for_code(self, json_data: dict):
+        """
+        Resamples the per-trade profits of the stored results for a code and returns percentile
+        bands of total profit, ROI and max drawdown. Returns None if no results are stored.
+        """
+        try:
+            logger.info("monte_carlo_for_code: Resampling strategy trades")
+            code = json_data.get('code')
+            n_sims = int(json_data.get('n_sims', 10000))
+            method = json_data.get('method', 'bootstrap')
+            seed = json_data.get('seed')
+            chunk_size = json_data.get('chunk_size')
+            logger.info(f"Received: {code} | {n_sims} | {method} | {seed} | {chunk_size}")
+
+            if not code:
+                logger.info("Missing required field: 'code'.")
+                raise ValueError("Missing required field: 'code'.")
+
+            result = self.session.query(ResultsModel).filter_by(code=code).first()
+            if not result:
+                logger.info(f"monte_carlo_for_code: No results fetched for {code}.")
+                return None
+
+            report = simulate_trade_sequences(
+                profits=result.total_profit_per_trade,
+                n_sims=n_sims,
+                method=method,
+                seed=int(seed) if seed is not None else None,
+                chunk_size=int(chunk_size) if chunk_size else None,
+                initial_investment=result.initial_investment
+            )
+            logger.info(f"Simulated {n_sims} trade sequences for {code}.")
+
+            report['code'] = code
+            return report
+
+        except (ValueError, TypeError) as ve:
+            self.session.rollback()
+            logger.error(f"monte_carlo_for_code ValueError: {ve}")
+            raise ValueError(str(ve))
+
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"monte_carlo_for_code error: {e}")
+            raise Exception(f"Failed to simulate strategy trades: {e}")
+
     def add_strategy_for_code(self, json_data: dict) -> bool:
         try:
             logger.info("add_strategy_for_code: Adding individual strategy")
@@ -88,7 +149,8 @@ class StrategyDB_Client(DB_Client):
             time_interval = json_data.get('time_interval')
             window_slow = json_data.get('window_slow')
             window_fast = json_data.get('window_fast')
-            logger.info(f"Received: {code} | {country} | {strategy_name} | {time_period} | {time_interval} | {window_slow} | {window_fast} ")
+            refresh = bool(json_data.get('refresh', False))
+            logger.info(f"Received: {code} | {country} | {strategy_name} | {time_period} | {time_interval} | {window_slow} | {window_fast} | {refresh}")
 
             logger.info("Checking for existing strategy and results.")
             existing_strategy = self.session.query(StrategyModel).filter_by(code=code).first()
@@ -109,49 +171,39 @@ class StrategyDB_Client(DB_Client):
                 window_fast = int(window_fast)
 
             logger.info("Retrieving stock data.")
-            df = get_yf_stock_data(
-                ticker=code, 
-                time_period=time_period, 
-                time_interval=time_interval
-            )
+            with memory_stage("load_stock_data"):
+                df = self.load_stock_data(
+                    code=code,
+                    country=country,
+                    time_period=time_period,
+                    time_interval=time_interval,
+                    refresh=refresh
+                )
 
             logger.info("Determining strategy")
-            handler = StrategyHandler(data=df)
-            strategy = handler.get_strategy(
-                strategy_name=strategy_name,
-                window_slow=window_slow,
-                window_fast=window_fast
-            )
+            with memory_stage("strategy"):
+                handler = StrategyHandler(data=df)
+                strategy = handler.get_strategy(
+                    strategy_name=strategy_name,
+                    window_slow=window_slow,
+                    window_fast=window_fast
+                )
 
             logger.info("Checking for strategy existence")
-            trades = Trades(strategy)
+            with memory_stage("trades"):
+                trades = Trades(strategy)
             existing_strategy = self.session.query(StrategyModel).filter_by(code=code).first()
             logger.info(f"Output from quering StrategyModel to check if strategy already exists: {existing_strategy}")
             
             if not existing_strategy:
                 logger.info(f"Adding strategy for {code} to db.")
-                for index, row in trades._data.iterrows():
-                    cl = float(row['Close'].iloc[0])
-                    bs = row['BuySignal'].iloc[0]
-                    bp = row['BuyPrice'].iloc[0]
-                    ss = row['SellSignal'].iloc[0]
-                    sp = row['SellPrice'].iloc[0]
-
-                    new_strategy_entry = StrategyModel(
-                        code=code,
-                        country=country,
-                        date=index.date(),
-                        close_price=cl,
-                        buy_signal=bs,
-                        buy_price=bp,
-                        sell_signal=ss,
-                        sell_price=sp
-                    )
-                    self.session.add(new_strategy_entry)
+                with memory_stage("store_trades"):
+                    bulk_insert(self.session, StrategyModel, self._trade_rows(code, country, trades))
                 logger.info(f"Added strategy for {code} to db.")
 
             logger.info("Checking for results existence")
-            results = Results(trades)
+            with memory_stage("results"):
+                results = Results(trades)
             existing_results = self.session.query(ResultsModel).filter_by(code=code).first()
             logger.info(f"Output from quering ResultsModel to check if strategy already exists: {existing_results}")
             
@@ -184,12 +236,474 @@ class StrategyDB_Client(DB_Client):
             self.session.rollback()
             logger.error(f"add_strategy_for_code ValueError: {ve}")
             raise ve
+
+        except IntegrityError as ie:
+            # a concurrent request stored the strategy for this code first
+            self.session.rollback()
+            logger.info(f"add_strategy_for_code IntegrityError, strategy already added: {ie.orig}")
+            return False
         
         except Exception as e:
             self.session.rollback()
             logger.error(f"add_strategy_for_code error: {e}")
             raise Exception(f"Failed to add strategy data: {e}")
         
+    def load_stock_data(self,
+                        code: str,
+                        country: str,
+                        time_period: str,
+                        time_interval: str,
+                        refresh: bool = False) -> pd.DataFrame:
+        """
+        Returns stock data for a strategy, reading the daily bars of stock_price_history.
+        The network is only used for what the store is missing: the whole period if the
+        stored history starts too late, or the bars after the latest stored date.
+        Downloaded bars are persisted so later runs are served locally, under the given
+        country or else the country already stored for the code. A period is served locally once a
+        download from its start or earlier is recorded, whatever date the first stored bar has.
+        With refresh, the full period is downloaded again and upserted.
+        Other intervals are always downloaded.
+        """
+        if time_interval != "1d":
+            logger.info(f"load_stock_data: {time_interval} bars are not served from the store, downloading.")
+            return get_yf_stock_data(ticker=code, time_period=time_period, time_interval=time_interval, use_cache=not refresh)
+
+        now = pd.Timestamp.now()
+        start = period_start(time_period, now)
+        first_date, last_date = stockPriceDB_Client.get_date_range(code, time_interval)
+        country = country or stockPriceDB_Client.get_country(code)
+
+        recorded, covered_from = stockPriceDB_Client.get_covered_from(code, time_interval)
+        if recorded:
+            covers_start = first_date is not None and (
+                covered_from is None or (start is not None and covered_from <= start.date())
+            )
+        else:
+            # prices stored before coverage was recorded: their history may begin a few days after
+            # start due to weekends and holidays. 'max' has no known start, so it is downloaded.
+            covers_start = (
+                first_date is not None
+                and start is not None
+                and first_date <= (start + pd.Timedelta(days=5)).date()
+            )
+
+        needs_download = refresh or not covers_start
+        needs_sync = not needs_download and last_date < (now.normalize() - pd.offsets.BDay(1)).date()
+        if (needs_download or needs_sync) and not country:
+            logger.error(f"'country' is required to store the prices of {code}.")
+            raise ValueError(f"'country' is required to store the prices of {code}.")
+
+        if needs_download:
+            logger.info(f"load_stock_data: Downloading {time_period} of {code} into the store.")
+            df = get_yf_stock_data(ticker=code, time_period=time_period, time_interval=time_interval, use_cache=not refresh)
+            if df is None or df.empty:
+                raise ValueError(f"No stock data found for {code}.")
+            stockPriceDB_Client.store_price_frame(code, country, df, time_interval, time_period=time_period)
+
+        elif needs_sync:
+            logger.info(f"load_stock_data: Syncing {code} after {last_date}.")
+            stockPriceDB_Client.sync_stock_price({"code": code, "country": country, "time_interval": time_interval})
+
+        else:
+            logger.info(f"load_stock_data: Serving {code} from stored prices.")
+
+        return stockPriceDB_Client.get_price_frame(code, start=start.date() if start is not None else None, time_interval=time_interval)
+
+    def sweep_strategy_for_code(self, json_data: dict) -> dict:
+        """
+        Evaluates a strategy over ranges of window_slow / window_fast / window_signal on a
+        single download of the stock data and returns the Results metrics of each
+        combination, ranked by strategy_roi. Nothing is persisted.
+        """
+        try:
+            logger.info("sweep_strategy_for_code: Sweeping strategy parameters")
+            code = json_data.get('code')
+            country = json_data.get('country')
+            strategy_name = json_data.get('strategy')
+            time_period = json_data.get('time_period')
+            time_interval = json_data.get('time_interval')
+            window_slow = json_data.get('window_slow')
+            window_fast = json_data.get('window_fast')
+            window_signal = json_data.get('window_signal')
+            max_workers = int(json_data.get('max_workers', 1))
+            logger.info(f"Received: {code} | {strategy_name} | {time_period} | {time_interval} | {window_slow} | {window_fast} | {window_signal} | {max_workers}")
+
+            if not code or not strategy_name or not time_period or not time_interval or not window_slow or not window_fast:
+                logger.info("Missing required fields: 'code', 'strategy_name', 'time_period', 'time_interval', 'window_slow' or 'window_fast'.")
+                raise ValueError("Missing required fields: 'code', 'strategy_name', 'time_period', 'time_interval', 'window_slow' or 'window_fast'.")
+
+            logger.info("Retrieving stock data.")
+            df = self.load_stock_data(
+                code=code,
+                country=country,
+                time_period=time_period,
+                time_interval=time_interval,
+                refresh=bool(json_data.get('refresh', False))
+            )
+            if df is None or df.empty:
+                raise ValueError(f"No stock data found for {code}.")
+
+            logger.info("Running parameter sweep.")
+            ranked = run_parameter_sweep(
+                data=df,
+                strategy_name=strategy_name,
+                window_slow=window_slow,
+                window_fast=window_fast,
+                window_signal=window_signal,
+                max_workers=max_workers
+            )
+            logger.info(f"Evaluated parameter sweep for {code}: {len(ranked)} combinations with trades.")
+
+            return {
+                'code': code,
+                'strategy': strategy_name,
+                'results': ranked
+            }
+
+        except (ValueError, KeyError) as ve:
+            logger.error(f"sweep_strategy_for_code ValueError: {ve}")
+            raise ValueError(str(ve))
+
+        except Exception as e:
+            logger.error(f"sweep_strategy_for_code error: {e}")
+            raise Exception(f"Failed to sweep strategy: {e}")
+
+    def walk_forward_for_code(self, json_data: dict) -> dict:
+        """
+        Runs a walk-forward optimisation of a strategy's windows on the stock data and returns
+        the per-fold params, the out-of-sample metrics and the stitched out-of-sample equity
+        curve. Nothing is persisted.
+        """
+        try:
+            logger.info("walk_forward_for_code: Walk-forward optimisation")
+            code = json_data.get('code')
+            country = json_data.get('country')
+            strategy_name = json_data.get('strategy')
+            time_period = json_data.get('time_period')
+            time_interval = json_data.get('time_interval')
+            window_slow = json_data.get('window_slow')
+            window_fast = json_data.get('window_fast')
+            window_signal = json_data.get('window_signal')
+            train_size = int(json_data.get('train_size', 252))
+            test_size = int(json_data.get('test_size', 63))
+            metric = json_data.get('metric', 'strategy_roi')
+            max_workers = int(json_data.get('max_workers', 1))
+            logger.info(f"Received: {code} | {strategy_name} | {time_period} | {time_interval} | {window_slow} | {window_fast} | {window_signal} | {train_size} | {test_size} | {metric} | {max_workers}")
+
+            if not code or not strategy_name or not time_period or not time_interval or not window_slow or not window_fast:
+                logger.info("Missing required fields: 'code', 'strategy_name', 'time_period', 'time_interval', 'window_slow' or 'window_fast'.")
+                raise ValueError("Missing required fields: 'code', 'strategy_name', 'time_period', 'time_interval', 'window_slow' or 'window_fast'.")
+
+            logger.info("Retrieving stock data.")
+            df = self.load_stock_data(
+                code=code,
+                country=country,
+                time_period=time_period,
+                time_interval=time_interval,
+                refresh=bool(json_data.get('refresh', False))
+            )
+            if df is None or df.empty:
+                raise ValueError(f"No stock data found for {code}.")
+
+            logger.info("Running walk-forward optimisation.")
+            report = run_walk_forward(
+                data=df,
+                strategy_name=strategy_name,
+                window_slow=window_slow,
+                window_fast=window_fast,
+                window_signal=window_signal,
+                train_size=train_size,
+                test_size=test_size,
+                metric=metric,
+                max_workers=max_workers
+            )
+            logger.info(f"Walk-forward for {code}: {len(report['folds'])} folds, out-of-sample roi {report['out_of_sample']['strategy_roi']}.")
+
+            report['code'] = code
+            return report
+
+        except (ValueError, KeyError) as ve:
+            logger.error(f"walk_forward_for_code ValueError: {ve}")
+            raise ValueError(str(ve))
+
+        except Exception as e:
+            logger.error(f"walk_forward_for_code error: {e}")
+            raise Exception(f"Failed to run walk-forward optimisation: {e}")
+
+    def compare_strategies_for_code(self, json_data: dict) -> dict:
+        """
+        Evaluates every strategy on a single load of the stock data and returns their
+        Results side by side. Nothing is persisted, so comparisons do not conflict with
+        the strategy stored for the code.
+        """
+        try:
+            logger.info("compare_strategies_for_code: Comparing strategies")
+            code = json_data.get('code')
+            country = json_data.get('country')
+            time_period = json_data.get('time_period')
+            time_interval = json_data.get('time_interval')
+            strategies = json_data.get('strategies')
+            params = {
+                key: json_data.get(key)
+                for key in ('window_slow', 'window_fast', 'window_signal')
+                if json_data.get(key) is not None
+            }
+            logger.info(f"Received: {code} | {country} | {time_period} | {time_interval} | {strategies} | {params}")
+
+            if not code or not time_period or not time_interval:
+                logger.info("Missing required fields: 'code', 'time_period' or 'time_interval'.")
+                raise ValueError("Missing required fields: 'code', 'time_period' or 'time_interval'.")
+
+            logger.info("Retrieving stock data.")
+            df = self.load_stock_data(
+                code=code,
+                country=country,
+                time_period=time_period,
+                time_interval=time_interval,
+                refresh=bool(json_data.get('refresh', False))
+            )
+            if df is None or df.empty:
+                raise ValueError(f"No stock data found for {code}.")
+
+            logger.info("Evaluating strategies.")
+            results = compare_strategies(
+                data=df,
+                params=params,
+                strategy_params=json_data.get('params'),
+                strategy_names=strategies
+            )
+            logger.info(f"Compared {len(results)} strategies for {code}.")
+
+            return {
+                'code': code,
+                'time_period': time_period,
+                'time_interval': time_interval,
+                'results': results
+            }
+
+        except (ValueError, TypeError, KeyError) as ve:
+            logger.error(f"compare_strategies_for_code ValueError: {ve}")
+            raise ValueError(str(ve))
+
+        except Exception as e:
+            logger.error(f"compare_strategies_for_code error: {e}")
+            raise Exception(f"Failed to compare strategies: {e}")
+
+    def backtest_universe(self, json_data: dict) -> dict:
+        """
+        Runs a strategy over every stock with stored prices (or the given 'codes') across a
+        process pool and returns the Results metrics of each ticker, ranked by strategy_roi,
+        with per-ticker timings. Only stored prices are used and nothing is persisted.
+        """
+        try:
+            logger.info("backtest_universe: Backtesting strategy over stored universe")
+            strategy_name = json_data.get('strategy')
+            time_period = json_data.get('time_period') or "max"
+            codes = json_data.get('codes') or stockPriceDB_Client.get_codes()
+            max_workers = json_data.get('max_workers')
+            params = {
+                key: int(json_data[key])
+                for key in ('window_slow', 'window_fast', 'window_signal')
+                if json_data.get(key) is not None
+            }
+            logger.info(f"Received: {strategy_name} | {time_period} | {len(codes)} codes | {params} | {max_workers}")
+
+            if not strategy_name:
+                logger.info("Missing required field: 'strategy'.")
+                raise ValueError("Missing required field: 'strategy'.")
+
+            frames = self._stored_frames(codes, time_period)
+
+            report = run_universe_backtest(
+                frames=frames,
+                strategy_name=strategy_name,
+                params=params,
+                max_workers=int(max_workers) if max_workers else None
+            )
+            logger.info(f"Backtested {strategy_name} on {report['tickers']} codes in {report['seconds']}s with {report['workers']} workers.")
+            return report
+
+        except (ValueError, TypeError) as ve:
+            logger.error(f"backtest_universe ValueError: {ve}")
+            raise ValueError(str(ve))
+
+        except Exception as e:
+            logger.error(f"backtest_universe error: {e}")
+            raise Exception(f"Failed to backtest universe: {e}")
+
+    def portfolio_backtest(self, json_data: dict) -> dict:
+        """
+        Simulates a portfolio trading a strategy's signals across every stock with stored
+        prices (or the given 'codes'), with capital allocated across the open positions.
+        Returns the portfolio metrics with its equity, exposure and drawdown per date.
+        Only stored prices are used and nothing is persisted.
+        """
+        try:
+            logger.info("portfolio_backtest: Simulating strategy portfolio")
+            strategy_name = json_data.get('strategy')
+            time_period = json_data.get('time_period') or "max"
+            codes = json_data.get('codes') or stockPriceDB_Client.get_codes()
+            allocation = json_data.get('allocation', 'equal')
+            initial_capital = float(json_data.get('initial_capital', 10000))
+            cost_bps = float(json_data.get('cost_bps', 0))
+            max_workers = int(json_data.get('max_workers', 1))
+            params = {
+                key: int(json_data[key])
+                for key in ('window_slow', 'window_fast', 'window_signal')
+                if json_data.get(key) is not None
+            }
+            logger.info(f"Received: {strategy_name} | {time_period} | {len(codes)} codes | {params} | {allocation} | {initial_capital} | {cost_bps}")
+
+            if not strategy_name:
+                logger.info("Missing required field: 'strategy'.")
+                raise ValueError("Missing required field: 'strategy'.")
+
+            report = run_portfolio_backtest(
+                frames=self._stored_frames(codes, time_period),
+                strategy_name=strategy_name,
+                params=params,
+                initial_capital=initial_capital,
+                allocation=allocation,
+                cost_bps=cost_bps,
+                max_workers=max_workers
+            )
+            logger.info(f"Portfolio of {len(report['codes'])} codes: return {report['total_return_pct']}%, max drawdown {report['max_drawdown_pct']}%.")
+            return report
+
+        except (ValueError, TypeError) as ve:
+            logger.error(f"portfolio_backtest ValueError: {ve}")
+            raise ValueError(str(ve))
+
+        except Exception as e:
+            logger.error(f"portfolio_backtest error: {e}")
+            raise Exception(f"Failed to simulate portfolio: {e}")
+
+    def refresh_streaming_signals(self, json_data: dict) -> dict:
+        """
+        Advances the streaming state of a strategy for a stock code by the daily bars stored
+        since its last refresh and returns the indicators and signals of those bars.
+        The prices are synced first. The first refresh (or one with new window parameters, or
+        'reset') starts the state from the stored 'time_period'. Today's bar can still change,
+        so it is left for a later refresh. The state is saved in streaming_state.
+        """
+        try:
+            logger.info("refresh_streaming_signals: Refreshing streaming strategy")
+            code = json_data.get('code')
+            country = json_data.get('country')
+            strategy_name = json_data.get('strategy')
+            time_period = json_data.get('time_period')
+            reset = bool(json_data.get('reset', False))
+            params = {
+                key: int(json_data[key])
+                for key in ('window_slow', 'window_fast', 'window_signal')
+                if json_data.get(key) is not None
+            }
+            logger.info(f"Received: {code} | {country} | {strategy_name} | {time_period} | {params} | {reset}")
+
+            if not code or not strategy_name:
+                logger.info("Missing required fields: 'code' or 'strategy'.")
+                raise ValueError("Missing required fields: 'code' or 'strategy'.")
+
+            existing_state = self.session.query(StreamingStateModel).filter_by(code=code, strategy=strategy_name).first()
+            country = country or (existing_state.country if existing_state else None) or stockPriceDB_Client.get_country(code)
+
+            stored_params = existing_state.state["params"] if existing_state else {}
+            restart = reset or existing_state is None or any(stored_params.get(key) != value for key, value in params.items())
+
+            if restart:
+                if not time_period:
+                    logger.info(f"'time_period' is required to start streaming {strategy_name} for {code}.")
+                    raise ValueError(f"'time_period' is required to start streaming {strategy_name} for {code}.")
+
+                logger.info(f"Starting streaming {strategy_name} for {code} from {time_period} of stored prices.")
+                strategy = create_streaming_strategy(strategy_name, **{**stored_params, **params})
+                self.load_stock_data(code=code, country=country, time_period=time_period, time_interval="1d")
+                start = period_start(time_period, pd.Timestamp.now())
+                start = start.date() if start is not None else None
+            else:
+                logger.info(f"Advancing streaming {strategy_name} for {code} after {existing_state.last_date}.")
+                strategy = load_streaming_strategy(existing_state.state)
+                start = existing_state.last_date
+
+            stockPriceDB_Client.sync_stock_price({"code": code, "country": country, "time_interval": "1d"})
+            df = stockPriceDB_Client.get_price_frame(code, start=start, time_interval="1d")
+            if df is None:
+                raise ValueError(f"No stock data found for {code}.")
+
+            bars = strategy.update_frame(df[df.index < pd.Timestamp.now().normalize()])
+            logger.info(f"Streaming {strategy_name} for {code} advanced by {len(bars)} bars.")
+
+            last_date = pd.Timestamp(strategy.last_date).date() if strategy.last_date else None
+            if existing_state is None:
+                existing_state = StreamingStateModel(code=code, strategy=strategy_name)
+                self.session.add(existing_state)
+            existing_state.country = country
+            existing_state.last_date = last_date
+            existing_state.state = strategy.to_dict()
+            self.session.commit()
+
+            return {
+                'code': code,
+                'country': country,
+                'strategy': strategy_name,
+                'params': strategy.to_dict()['params'],
+                'last_date': last_date.strftime('%Y-%m-%d') if last_date else None,
+                'bars': strategy.bars,
+                'results': [
+                    {
+                        'date': date.strftime('%Y-%m-%d'),
+                        **{key: None if pd.isna(value) else value for key, value in row.items()},
+                    }
+                    for date, row in zip(bars.index, bars.to_dict('records'))
+                ],
+            }
+
+        except (ValueError, TypeError) as ve:
+            self.session.rollback()
+            logger.error(f"refresh_streaming_signals ValueError: {ve}")
+            raise ValueError(str(ve))
+
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"refresh_streaming_signals error: {e}")
+            raise Exception(f"Failed to refresh streaming strategy: {e}")
+
+    @staticmethod
+    def _stored_frames(codes: list, time_period: str) -> dict:
+        """
+        Loads the stored prices of each code over time_period ({code: DataFrame or None}).
+        """
+        start = period_start(time_period, pd.Timestamp.now())
+        return stockPriceDB_Client.get_price_frames(codes, start=start.date() if start is not None else None)
+
+    @staticmethod
+    def _trade_rows(code: str, country: str, trades: Trades) -> list:
+        """
+        Builds StrategyModel rows straight from the trades arrays.
+        """
+        columns = zip(
+            trades.index.date,
+            trades.close.tolist(),
+            trades.buy_signal.astype(float).tolist(),
+            trades.buy_price.tolist(),
+            trades.sell_signal.astype(float).tolist(),
+            trades.sell_price.tolist(),
+        )
+
+        return [
+            {
+                "code": code,
+                "country": country,
+                "date": date,
+                "close_price": close_price,
+                "buy_signal": buy_signal,
+                "buy_price": buy_price,
+                "sell_signal": sell_signal,
+                "sell_price": sell_price,
+            }
+            for date, close_price, buy_signal, buy_price, sell_signal, sell_price in columns
+        ]
+
     def delete_strategy_for_code(self, code: str):
         try:
             logger.info("delete_strategy_for_code: Deleting strategy and result")
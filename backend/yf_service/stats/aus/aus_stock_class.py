@@ -52,7 +52,7 @@ from yf_service.stats.aus.aus_stock_methods import (
     getTrailingDividendRate,
     getTrailingDividendYield,
 )
-from yf_service.stats.aus.websites import yahooFinancePriceData, yahooFinanceData
+from yf_service.stats.aus.websites import yahooFinancePageData
 
 
 class StockPriceMetrics:
@@ -139,8 +139,7 @@ class AusStockClass:
     def __init__(self, ticker: str):
         self.country = "aus"
         self.ticker = ticker
-        self.yf_data_price = yahooFinancePriceData(self.ticker)
-        self.yf_data = yahooFinanceData(self.ticker)
+        self.yf_data_price, self.yf_data = yahooFinancePageData(self.ticker)
 
         # Initialize metric classes
         self.stockPriceMetrics = StockPriceMetrics(self.yf_data_price, self.yf_data)
@@ -1,67 +1,93 @@
-import pandas as pd
-import requests
-from bs4 import BeautifulSoup as bs
-
-
-def getYahooFinanceStockURL(stockTicker):
-    """
-    Returns information about stock from Yahoo Finance website
-    """
-    return f"https://au.finance.yahoo.com/quote/{stockTicker}.AX/key-statistics?p={stockTicker}.AX"
-
-
-def getMarketWatchStockURL(stockTicker):
-    """
-    Returns information about stock from Market Watch website
-    """
-
-    return f"https://www.marketwatch.com/investing/stock/{stockTicker}?countrycode=au&mod=over_search"
-
-
-def yahooFinanceData(stockTicker):
-    """
-    Returns all stock data as soup from Yahoo Finance Website
-    """
-
-    try:
-        stockURL = getYahooFinanceStockURL(stockTicker)
-
-        r = requests.get(
-            stockURL,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-            },
-        )
-    except Exception as e:
-        print(f"error in yahooFinanceData(): {stockTicker}")
-        print(e)
-        return None
-    else:
-        return pd.read_html(r.text)
-
-
-def yahooFinancePriceData(stockTicker):
-    """
-    Returns html elements containing price data.
-    """
-
-    try:
-        stockURL = getYahooFinanceStockURL(stockTicker)
-
-        response = requests.get(
-            url=stockURL,
-            headers={
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-            },
-        )
-
-        html_content = response.text
-        soup = bs(html_content, 'html.parser')
-        element = soup.find('fin-streamer', {'data-test': 'qsp-price'})
-
-    except Exception as e:
-        print(f"error in yahooFinancePriceData(): {stockTicker}")
-        print(e)
-        return None
-    else:
-        return element['value']
+import pandas as pd
+import requests
+from bs4 import BeautifulSoup as bs
+
+
+def getYahooFinanceStockURL(stockTicker):
+    """
+    Returns information about stock from Yahoo Finance website
+    """
+    return f"https://au.finance.yahoo.com/quote/{stockTicker}.AX/key-statistics?p={stockTicker}.AX"
+
+
+def getMarketWatchStockURL(stockTicker):
+    """
+    Returns information about stock from Market Watch website
+    """
+
+    return f"https://www.marketwatch.com/investing/stock/{stockTicker}?countrycode=au&mod=over_search"
+
+
+YAHOO_FINANCE_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+}
+
+
+def createSession(poolSize=10):
+    """
+    Returns a requests session with a pooled keep-alive connection adapter
+    """
+    session = requests.Session()
+    session.headers.update(YAHOO_FINANCE_HEADERS)
+
+    adapter = requests.adapters.HTTPAdapter(pool_connections=poolSize, pool_maxsize=poolSize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    return session
+
+
+# shared across tickers so repeated scrapes reuse open connections
+yahooFinanceSession = createSession()
+
+
+def yahooFinancePage(stockTicker):
+    """
+    Returns the html of the Yahoo Finance key-statistics page
+    """
+
+    try:
+        stockURL = getYahooFinanceStockURL(stockTicker)
+        response = yahooFinanceSession.get(stockURL)
+    except Exception as e:
+        print(f"error in yahooFinancePage(): {stockTicker}")
+        print(e)
+        return None
+    else:
+        return response.text
+
+
+def parseYahooFinanceData(html_content):
+    """
+    Returns all stock data tables from the Yahoo Finance page html
+    """
+    return pd.read_html(html_content)
+
+
+def parseYahooFinancePriceData(html_content):
+    """
+    Returns the price from the Yahoo Finance page html
+    """
+    soup = bs(html_content, 'html.parser')
+    element = soup.find('fin-streamer', {'data-test': 'qsp-price'})
+    return element['value']
+
+
+def yahooFinancePageData(stockTicker):
+    """
+    Downloads the Yahoo Finance page once and returns both the price and the stock data tables.
+    Both are None if the page cannot be downloaded, and the price is None if the page has none.
+    Errors parsing the tables are raised.
+    """
+    html_content = yahooFinancePage(stockTicker)
+    if html_content is None:
+        return None, None
+
+    try:
+        price = parseYahooFinancePriceData(html_content)
+    except Exception as e:
+        print(f"error in yahooFinancePageData() price: {stockTicker}")
+        print(e)
+        price = None
+
+    return price, parseYahooFinanceData(html_content)
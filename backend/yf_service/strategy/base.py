@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+
+from yf_service.common.core import get_column_values
+
+
+class Strategy:
+    """
+    Base class for strategies.
+
+    A strategy owns the arrays it produces instead of writing columns into the caller's
+    DataFrame: the close prices it read, its indicator columns and the Buy / Sell conditions.
+    Trades and Results only read these arrays, so no stage copies the full frame.
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        self.index = data.index
+        self.close = get_column_values(data, "Close").astype(float, copy=False)
+        self.indicators = {}
+        self.buy_condition = np.zeros(len(self.index), dtype=bool)
+        self.sell_condition = np.zeros(len(self.index), dtype=bool)
+
+    def set_conditions(self, buy_condition, sell_condition):
+        self.buy_condition = np.asarray(buy_condition, dtype=bool)
+        self.sell_condition = np.asarray(sell_condition, dtype=bool)
+
+    @property
+    def _df(self) -> pd.DataFrame:
+        """
+        Returns the strategy output as a DataFrame (Close, indicator columns and conditions).
+        Built on demand for inspection, the pipeline itself works on the arrays.
+        """
+        columns = {"Close": self.close}
+        columns.update(self.indicators)
+        columns["BuyCondition"] = self.buy_condition
+        columns["SellCondition"] = self.sell_condition
+        return pd.DataFrame(columns, index=self.index)
@@ -0,0 +1,93 @@
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from yf_service.strategy.handler import StrategyHandler
+from yf_service.strategy.signals import rising_edge
+from yf_service.strategy.trades import Trades
+
+ROW_COUNTS = [1_000, 10_000, 100_000, 1_000_000]
+
+
+def baseline_signals(condition) -> np.ndarray:
+    """
+    The per-row loop Trades.determine_signals ran before rising_edge: only the first True after
+    a run of False values is kept. The reference the vectorized signals are checked and timed against.
+    """
+    found_true = False
+    result = []
+
+    for value in condition:
+        if value and not found_true:
+            result.append(True)
+            found_true = True
+        elif not value:
+            result.append(False)
+            found_true = False  # reset flag when a False is encountered
+        else:
+            result.append(False)
+
+    return np.array(result, dtype=bool)
+
+
+def measure(n_rows: int, repeats: int = 5, seed: int = 0) -> dict:
+    """
+    Times the signals of an MA strategy on a random walk of n_rows bars and returns the best of
+    repeats runs (ms) of each:
+    >>> loop       : baseline_signals on the buy and sell conditions
+    >>> vectorized : rising_edge on the buy and sell conditions
+    >>> trades     : Trades(strategy), i.e. the signals and the prices at each signal
+    """
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n_rows)))
+    data = pd.DataFrame(
+        {"Close": close, "Volume": np.full(n_rows, 1e6)},
+        index=pd.date_range("2000-01-01", periods=n_rows, freq="min"),
+    )
+    strategy = StrategyHandler(data=data).get_strategy(strategy_name="MA")
+    conditions = (strategy.buy_condition, strategy.sell_condition)
+
+    runs = {
+        "loop": lambda: [baseline_signals(condition) for condition in conditions],
+        "vectorized": lambda: [rising_edge(condition) for condition in conditions],
+        "trades": lambda: Trades(strategy),
+    }
+
+    report = {}
+    for name, run in runs.items():
+        seconds = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            run()
+            seconds.append(time.perf_counter() - start)
+        report[name] = round(1000 * min(seconds), 3)
+
+    if not all(np.array_equal(baseline_signals(condition), rising_edge(condition)) for condition in conditions):
+        raise AssertionError(f"rising_edge differs from the baseline loop on {n_rows} rows.")
+
+    report["speedup"] = round(report["loop"] / report["vectorized"], 1)
+    return report
+
+
+def main():
+    """
+    Command line entry point for the signal benchmark, baseline loop vs vectorized.
+    Ex:
+    >>> python -m yf_service.strategy.benchmark
+    >>> python -m yf_service.strategy.benchmark --rows 1000 50000 --repeats 10
+    """
+    parser = argparse.ArgumentParser(description="Benchmark Trades signal detection, baseline loop vs vectorized.")
+    parser.add_argument("--rows", type=int, nargs="*", default=ROW_COUNTS)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'loop ms':>12} {'vectorized ms':>14} {'speedup':>8} {'trades ms':>10}")
+    for n_rows in args.rows:
+        report = measure(n_rows, repeats=args.repeats)
+        print(f"{n_rows:>10} {report['loop']:>12} {report['vectorized']:>14} {report['speedup']:>7}x {report['trades']:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from yf_service.strategy.handler import StrategyHandler
+from yf_service.strategy.results import Results, count_completed_trades
+from yf_service.strategy.sweep import RESULT_METRICS
+from yf_service.strategy.trades import Trades
+
+
+def compare_strategies(data: pd.DataFrame,
+                       params: dict = None,
+                       strategy_params: dict = None,
+                       strategy_names: list = None) -> dict:
+    """
+    Evaluates every strategy in StrategyHandler.strategy_map (or strategy_names) on the same
+    price frame concurrently and returns their Results metrics keyed by strategy name.
+
+    params are applied to every strategy that accepts them and strategy_params
+    ({strategy_name: {...}}) override them per strategy. Strategies fall back to their own
+    default windows. Strategies keep their outputs in arrays of their own, so they all read
+    the same Close / Volume frame without writing into it.
+    Ex:
+    >>> {"MA": {"params": {"window_slow": 26, "window_fast": 12}, "strategy_roi": 4.2, ...},
+    >>>  "RSI": {"params": {...}, "error": "No completed trades."}, ...}
+    """
+    strategy_names = strategy_names or list(StrategyHandler.strategy_map)
+    unsupported = [name for name in strategy_names if name not in StrategyHandler.strategy_map]
+    if unsupported:
+        raise ValueError(f"Strategy '{unsupported[0]}' is not supported.")
+
+    jobs = {
+        name: _strategy_params(name, params or {}, (strategy_params or {}).get(name, {}))
+        for name in strategy_names
+    }
+
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        futures = {
+            name: executor.submit(evaluate_strategy, data, name, kwargs)
+            for name, kwargs in jobs.items()
+        }
+        return {name: future.result() for name, future in futures.items()}
+
+
+def evaluate_strategy(data: pd.DataFrame, strategy_name: str, params: dict) -> dict:
+    """
+    Runs Strategy -> Trades -> Results for one strategy.
+    """
+    strategy = StrategyHandler(data=data).get_strategy(strategy_name=strategy_name, **params)
+
+    trades = Trades(strategy)
+
+    row = {"params": params}
+    if not count_completed_trades(trades):
+        row["error"] = "No completed trades."
+        return row
+
+    results = Results(trades)
+    row.update({metric: getattr(results, metric) for metric in RESULT_METRICS})
+    row["buy_sell_pairs_timestamp"] = results.buy_sell_pairs_timestamp
+    row["profit_loss_shares"] = results.profit_loss_shares
+    return row
+
+
+def _strategy_params(strategy_name: str, params: dict, overrides: dict) -> dict:
+    """
+    Returns the window parameters the strategy accepts, with its defaults filled in.
+    """
+    signature = inspect.signature(StrategyHandler.strategy_map[strategy_name])
+    merged = dict(params, **overrides)
+
+    return {
+        key: int(merged[key]) if merged.get(key) is not None else parameter.default
+        for key, parameter in signature.parameters.items()
+        if key != "data"
+    }
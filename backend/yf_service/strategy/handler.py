@@ -5,20 +5,20 @@ from yf_service.strategy.rsi import Strategy_RSI
 from yf_service.strategy.vw_macd import Strategy_VW_MACD
 
 class StrategyHandler:
+    # Mapping strategy names to their respective classes
+    strategy_map = {
+        "MA": Strategy_MA,
+        "MACD": Strategy_MACD,
+        "RSI": Strategy_RSI,
+        "VW_MACD": Strategy_VW_MACD
+    }
+
     def __init__(self, data: pd.DataFrame):
         """
         Initialize the handler with the data.
         """
         self.data = data
 
-        # Mapping strategy names to their respective classes
-        self.strategy_map = {
-            "MA": Strategy_MA,
-            "MACD": Strategy_MACD,
-            "RSI": Strategy_RSI,
-            "VW_MACD": Strategy_VW_MACD
-        }
-
     def get_strategy(self, strategy_name: str, **kwargs):
         """
         Returns the requested strategy instance.
@@ -0,0 +1,122 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from setup_logging.setup_logging import logger
+from yf_service.common.config import Cache_Config
+from yf_service.strategy import kernels
+
+
+class IndicatorCache:
+    """
+    In-memory LRU cache of indicator outputs shared by every strategy.
+
+    Entries are keyed by a fingerprint of the input series values, the indicator name
+    and its parameters, so identical EMAs, rolling means and RSIs are computed once and
+    reused across strategies, parameter sweeps and repeated requests. The least recently
+    used entries are evicted once the cached arrays exceed max_bytes.
+    """
+
+    def __init__(self, max_bytes: int = Cache_Config.INDICATOR_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        self._entries = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, values: np.ndarray, name: str, params: tuple, compute) -> np.ndarray:
+        """
+        Returns the cached output of compute() for these input values, name and params.
+        Cached arrays are read-only.
+        """
+        key = (fingerprint(values), name, params)
+
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        output = np.asarray(compute(), dtype=float)
+        output.flags.writeable = False
+
+        with self._lock:
+            if key not in self._entries and output.nbytes <= self.max_bytes:
+                self._entries[key] = output
+                self._nbytes += output.nbytes
+                self._evict()
+
+        return output
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    def _evict(self):
+        while self._nbytes > self.max_bytes and self._entries:
+            key, output = self._entries.popitem(last=False)
+            self._nbytes -= output.nbytes
+            logger.info(f"IndicatorCache evicting {key[1]}{key[2]}")
+
+
+def fingerprint(values: np.ndarray) -> str:
+    """
+    Returns a digest identifying the contents of a float array.
+    """
+    values = np.ascontiguousarray(values, dtype=float)
+    return hashlib.blake2b(values.tobytes(), digest_size=16).hexdigest() + str(values.shape)
+
+
+indicator_cache = IndicatorCache()
+
+
+def rolling_mean(series: pd.Series, window: int, min_periods: int = 1) -> pd.Series:
+    """
+    Returns the rolling mean of series over window bars.
+    """
+    output = indicator_cache.get_or_compute(
+        series.to_numpy(dtype=float), "rolling_mean", (window, min_periods),
+        lambda: series.rolling(window=window, min_periods=min_periods).mean().to_numpy(),
+    )
+    return pd.Series(output, index=series.index)
+
+
+def ema(series: pd.Series, span: int, min_periods: int = 0) -> pd.Series:
+    """
+    Returns the exponential moving average (adjust=False) of series with the given span.
+    """
+    output = indicator_cache.get_or_compute(
+        series.to_numpy(dtype=float), "ema", (span, min_periods),
+        # pandas' recurrence settles exactly on flat prices, which keeps MACD crossings stable
+        lambda: series.ewm(span=span, min_periods=min_periods, adjust=False).mean().to_numpy(),
+    )
+    return pd.Series(output, index=series.index)
+
+
+def macd(close: pd.Series, window_slow: int, window_fast: int, window_signal: int) -> tuple:
+    """
+    Returns the (macd, macd_signal, macd_diff) Series, built from cached EMAs.
+    Matches ta.trend.MACD with fillna=False.
+    """
+    macd_line = ema(close, window_fast, min_periods=window_fast) - ema(close, window_slow, min_periods=window_slow)
+    macd_signal = ema(macd_line, window_signal, min_periods=window_signal)
+    return macd_line, macd_signal, macd_line - macd_signal
+
+
+def rsi(close: pd.Series, window: int) -> pd.Series:
+    """
+    Returns the Relative Strength Index of close over window bars.
+    """
+    values = close.to_numpy(dtype=float)
+    output = indicator_cache.get_or_compute(
+        values, "rsi", (window,),
+        lambda: kernels.rsi(values, window=window),
+    )
+    return pd.Series(output, index=close.index)
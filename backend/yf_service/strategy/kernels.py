@@ -0,0 +1,208 @@
+import numpy as np
+
+# largest factor the blocked EMA scales a value by, which bounds the block length
+_EMA_MAX_SCALE = 1e100
+
+
+def ema(values, span=None, alpha=None, min_periods=0) -> np.ndarray:
+    """
+    Exponential moving average (adjust=False) of a float64 array along its last axis.
+    Matches pandas Series.ewm(span=span, adjust=False, min_periods=min_periods).mean()
+    within floating point tolerance.
+
+    values may be 1-D or 2-D (one series per row, e.g. many tickers), and span / alpha /
+    min_periods may be a scalar or one value per row. A 1-D series with several spans is
+    computed once per span (e.g. many windows over the same series). Leading NaNs are skipped
+    like pandas does; NaNs after the first value are not supported and raise ValueError.
+
+    NOTE: on long runs of identical values pandas settles exactly on the value while this
+    kernel stays within a few ulps of it, so signs of differences of EMAs (e.g. MACD crossings)
+    can differ on flat stretches. The strategies therefore keep pandas for price EMAs.
+    Ex:
+    >>> ema(close, span=12)
+    >>> ema(close, span=[12, 26, 50])
+    >>> ema(np.vstack([close_a, close_b]), span=12)
+    """
+    if alpha is None:
+        if span is None:
+            raise ValueError("Either span or alpha must be given.")
+        span = np.asarray(span, dtype=np.float64)
+        if (span < 1).any():
+            raise ValueError("span must be at least 1.")
+        alpha = 2 / (span + 1)
+
+    values, rows, alpha, min_periods = _batch(values, alpha, min_periods)
+    if ((alpha <= 0) | (alpha > 1)).any():
+        raise ValueError("alpha must be in (0, 1].")
+
+    n_rows, n = rows.shape
+    output = np.full((n_rows, n), np.nan)
+    if n == 0:
+        return _unbatch(output, values)
+
+    valid = ~np.isnan(rows)
+    has_value = valid.any(axis=1)
+    first = np.where(has_value, valid.argmax(axis=1), n)
+    positions = np.arange(n)
+    if (~valid & (positions >= first[:, None])).any():
+        raise ValueError("ema does not support missing values after the first value.")
+
+    # y[t] = decay * y[t-1] + alpha * x[t] with y[first] = x[first]:
+    # zero the leading NaNs and scale the first value so that alpha * x[first] == x[first]
+    x = np.where(valid, rows, 0.0)
+    rows_with_value = np.flatnonzero(has_value)
+    x[rows_with_value, first[rows_with_value]] /= alpha[rows_with_value]
+
+    output = _linear_recurrence(x, alpha)
+
+    nobs = positions - first[:, None] + 1
+    output[nobs < np.maximum(min_periods, 1)[:, None]] = np.nan
+    return _unbatch(output, values)
+
+
+def rolling_mean(values, window, min_periods=1) -> np.ndarray:
+    """
+    Rolling mean of a float64 array over window values along its last axis (1-D or 2-D), with
+    window / min_periods given as a scalar or one value per row like ema.
+    Matches pandas Series.rolling(window, min_periods=min_periods).mean() within floating point
+    tolerance, including NaN handling.
+    Ex:
+    >>> rolling_mean(close, window=[5, 20, 50])
+    """
+    _check_windows(window)
+    values, rows, window, min_periods = _batch(values, window, min_periods)
+    window = window.astype(np.int64)
+
+    valid = ~np.isnan(rows)
+    # cumulative sums are taken relative to the first value of each row to keep them small
+    first = valid.argmax(axis=1)
+    offset = np.where(valid.any(axis=1), rows[np.arange(len(rows)), first], 0.0)[:, None]
+    centred = np.where(valid, rows - offset, 0.0)
+
+    sums = _window_sum(centred, window)
+    counts = _window_sum(valid.astype(np.float64), window)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        output = sums / counts + offset
+    output[counts < np.maximum(min_periods, 1)[:, None]] = np.nan
+    return _unbatch(output, values)
+
+
+def rsi(close, window) -> np.ndarray:
+    """
+    Wilder Relative Strength Index of a float64 array along its last axis (1-D or 2-D), with
+    window given as a scalar or one value per row like ema.
+    Matches ta.momentum.RSIIndicator(close, window).rsi() within floating point tolerance.
+    """
+    _check_windows(window)
+    window = np.asarray(window, dtype=np.float64)
+    close = np.asarray(close, dtype=np.float64)
+
+    diff = np.full(close.shape, np.nan)
+    diff[..., 1:] = close[..., 1:] - close[..., :-1]
+    with np.errstate(invalid="ignore"):
+        up = np.where(diff > 0, diff, 0.0)
+        down = np.where(diff < 0, -diff, 0.0)
+
+    ema_up = ema(up, alpha=1 / window, min_periods=window)
+    ema_down = ema(down, alpha=1 / window, min_periods=window)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(ema_down == 0, 100.0, 100 - (100 / (1 + ema_up / ema_down)))
+
+
+def macd(close, window_slow, window_fast, window_signal) -> tuple:
+    """
+    Returns the (macd, macd_signal, macd_diff) arrays of a float64 array along its last axis
+    (1-D or 2-D), with each window given as a scalar or one value per row like ema.
+    Matches ta.trend.MACD with fillna=False within floating point tolerance.
+    Ex:
+    >>> macd(close, window_slow=[26, 35], window_fast=[12, 5], window_signal=9)
+    """
+    for window in (window_slow, window_fast, window_signal):
+        _check_windows(window)
+    close = np.asarray(close, dtype=np.float64)
+
+    macd_line = (
+        ema(close, span=window_fast, min_periods=window_fast)
+        - ema(close, span=window_slow, min_periods=window_slow)
+    )
+    macd_signal = ema(macd_line, span=window_signal, min_periods=window_signal)
+    return macd_line, macd_signal, macd_line - macd_signal
+
+
+def _check_windows(window):
+    if (np.asarray(window) < 1).any():
+        raise ValueError("window must be at least 1.")
+
+
+def _batch(values, param, min_periods) -> tuple:
+    """
+    Returns values as float64, its rows as a 2-D array and param / min_periods as one value per
+    row. A 1-D series with several params is repeated once per param.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    param = np.asarray(param, dtype=np.float64)
+    rows = np.atleast_2d(values)
+
+    n_rows = max(len(rows), param.size if param.ndim else 1)
+    if len(rows) != n_rows:
+        if len(rows) != 1:
+            raise ValueError(f"Got {param.size} parameters for {len(rows)} series.")
+        rows = np.broadcast_to(rows, (n_rows, rows.shape[1]))
+
+    param = np.broadcast_to(param, (n_rows,)).copy()
+    min_periods = np.broadcast_to(np.asarray(min_periods, dtype=np.float64), (n_rows,))
+    return values, rows, param, min_periods
+
+
+def _unbatch(output: np.ndarray, values: np.ndarray) -> np.ndarray:
+    # a single 1-D series with a single parameter keeps its 1-D shape
+    return output[0] if values.ndim == 1 and len(output) == 1 else output
+
+
+def _linear_recurrence(x: np.ndarray, alpha: np.ndarray) -> np.ndarray:
+    """
+    Computes y[t] = (1 - alpha) * y[t-1] + alpha * x[t] with y[-1] = 0 for each row of x.
+
+    The series is split into blocks. Within a block the recurrence is a cumulative sum of
+    x[t] / decay**t, scaled back by decay**t, and the value carried into each block is added
+    afterwards. Blocks are short enough that decay**-t stays below _EMA_MAX_SCALE.
+    """
+    n_rows, n = x.shape
+    decay = 1 - alpha
+    log_decay = np.log(np.where(decay > 0, decay, 1.0))
+
+    longest = np.inf if (log_decay == 0).all() else np.log(_EMA_MAX_SCALE) / -log_decay[log_decay < 0].min()
+    block = int(max(1, min(n, longest)))
+    n_blocks = -(-n // block)
+
+    padded = np.zeros((n_rows, n_blocks * block))
+    padded[:, :n] = x
+    padded = padded.reshape(n_rows, n_blocks, block)
+
+    steps = np.arange(block)
+    growth = np.exp(-log_decay[:, None] * steps)[:, None, :]
+    shrink = np.exp(log_decay[:, None] * steps)[:, None, :]
+
+    output = alpha[:, None, None] * np.cumsum(padded * growth, axis=-1) * shrink
+
+    # each block continues from the last value of the previous block
+    carry_decay = shrink[:, 0, :] * decay[:, None]
+    for i in range(1, n_blocks):
+        output[:, i, :] += carry_decay * output[:, i - 1, -1:]
+
+    output = output.reshape(n_rows, -1)[:, :n]
+    # alpha == 1 keeps only the current value
+    output[decay == 0] = x[decay == 0]
+    return output
+
+
+def _window_sum(values: np.ndarray, window: np.ndarray) -> np.ndarray:
+    """
+    Sums of each row of values over its last window[row] values.
+    """
+    sums = np.cumsum(values, axis=-1)
+    leaving = np.arange(values.shape[1]) - window[:, None]
+    previous = np.take_along_axis(sums, np.maximum(leaving, 0), axis=-1)
+    return sums - np.where(leaving >= 0, previous, 0.0)
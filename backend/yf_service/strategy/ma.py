@@ -1,21 +1,26 @@
 import pandas as pd
 
-class Strategy_MA:
+from yf_service.common.core import get_column_series
+from yf_service.strategy.base import Strategy
+from yf_service.strategy.indicators import rolling_mean
+
+class Strategy_MA(Strategy):
     def __init__(self,
                  data: pd.DataFrame,
                  window_slow=26,
                  window_fast=12):
+        super().__init__(data)
         
         # algorithm implementation
-        close_prices = data["Close"]
-        ma_fast = close_prices.rolling(window=window_fast, min_periods=1).mean()
-        ma_slow = close_prices.rolling(window=window_slow, min_periods=1).mean()
+        close_prices = get_column_series(data, "Close")
+        ma_fast = rolling_mean(close_prices, window=window_fast, min_periods=1)
+        ma_slow = rolling_mean(close_prices, window=window_slow, min_periods=1)
 
-        data["MA_fast"] = ma_fast
-        data["MA_slow"] = ma_slow
+        self.indicators["MA_fast"] = ma_fast.to_numpy()
+        self.indicators["MA_slow"] = ma_slow.to_numpy()
 
         # trading signals
-        data["BuyCondition"] = ma_fast >= ma_slow
-        data["SellCondition"] = ma_fast < ma_slow
-
-        self._df = data
+        self.set_conditions(
+            buy_condition=ma_fast >= ma_slow,
+            sell_condition=ma_fast < ma_slow,
+        )
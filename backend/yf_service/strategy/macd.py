@@ -1,32 +1,36 @@
 import pandas as pd
-from ta.trend import MACD
 
+from yf_service.common.core import get_column_series
+from yf_service.strategy.base import Strategy
+from yf_service.strategy.indicators import macd
 
-class Strategy_MACD:
+
+class Strategy_MACD(Strategy):
     def __init__(self,
                  data: pd.DataFrame,
                  window_slow=26,
                  window_fast=12,
                  window_signal=9):
+        super().__init__(data)
         
         # algorithm implementation
-        close_prices = data["Close"]
-        macd_obj = MACD(
+        close_prices = get_column_series(data, "Close")
+        macd_line, macd_signal, macd_diff = macd(
             close=close_prices,
             window_slow=window_slow,
             window_fast=window_fast,
-            window_sign=window_signal,
+            window_signal=window_signal,
         )
 
-        data["macd"] = macd_obj.macd()
-        data["macd_signal"] = macd_obj.macd_signal()
-        data["macd_diff"] = macd_obj.macd_diff()
+        self.indicators["macd"] = macd_line.to_numpy()
+        self.indicators["macd_signal"] = macd_signal.to_numpy()
+        self.indicators["macd_diff"] = macd_diff.to_numpy()
 
         # trading signals
-        data["BuyCondition"] = (data["macd_diff"] > 0) & (data["macd_diff"].shift(1) <= 0)
-        data["SellCondition"] = (data["macd_diff"] < 0) & (data["macd_diff"].shift(1) >= 0)
-
-        self._df = data
+        self.set_conditions(
+            buy_condition=(macd_diff > 0) & (macd_diff.shift(1) <= 0),
+            sell_condition=(macd_diff < 0) & (macd_diff.shift(1) >= 0),
+        )
 
     def get_signals(self):
-        return self._df[["macd", "macd_signal", "macd_diff", "BuySignal", "SellSignal"]]
+        return self._df[["macd", "macd_signal", "macd_diff", "BuyCondition", "SellCondition"]]
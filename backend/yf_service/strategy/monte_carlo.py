@@ -0,0 +1,100 @@
+import numpy as np
+
+from yf_service.strategy.results import Results
+
+METHODS = ["bootstrap", "permute"]
+PERCENTILES = [5, 25, 50, 75, 95]
+
+# upper bound on the number of simulated trade sequences per request
+MAX_SIMULATIONS = 1_000_000
+
+# memory budget for one chunk of simulated trade sequences (bytes)
+MAX_CHUNK_BYTES = 64 * 1024 * 1024
+
+
+def simulate_trade_sequences(profits,
+                             n_sims: int = 10000,
+                             method: str = "bootstrap",
+                             seed: int = None,
+                             chunk_size: int = None,
+                             initial_investment: float = Results.INITIAL_INVESTMENT,
+                             percentiles: list = PERCENTILES) -> dict:
+    """
+    Monte Carlo analysis of a strategy's per-trade profits (Results.total_profit_per_trade).
+
+    Each simulation is one resampled trade sequence:
+    >>> bootstrap : n_trades trades drawn with replacement
+    >>> permute   : the same trades in a random order (total profit is unchanged, drawdown is not)
+
+    Simulations are drawn as one (n_sims x n_trades) array per chunk. chunk_size bounds the
+    simulations held in memory at once and defaults to what fits in MAX_CHUNK_BYTES; the same
+    seed gives the same result for any chunk_size.
+
+    Returns the percentile bands of total profit, ROI and max drawdown (currency and pct of
+    the peak equity, where equity is initial_investment plus the running profit).
+    """
+    profits = np.asarray(profits, dtype=np.float64)
+    n_trades = profits.size
+    n_sims = int(n_sims)
+
+    if method not in METHODS:
+        raise ValueError(f"Unsupported method '{method}', choose one of {METHODS}.")
+    if n_trades == 0:
+        raise ValueError("No trades to resample.")
+    if not 1 <= n_sims <= MAX_SIMULATIONS:
+        raise ValueError(f"'n_sims' must be between 1 and {MAX_SIMULATIONS}.")
+
+    if chunk_size is None:
+        # the sampled profits, their running total and the running peak are held at once
+        chunk_size = MAX_CHUNK_BYTES // (3 * n_trades * profits.itemsize)
+    chunk_size = int(min(max(chunk_size, 1), n_sims))
+
+    rng = np.random.default_rng(seed)
+    total_profit = np.empty(n_sims)
+    max_drawdown = np.empty(n_sims)
+    max_drawdown_pct = np.empty(n_sims)
+
+    for start in range(0, n_sims, chunk_size):
+        rows = slice(start, min(start + chunk_size, n_sims))
+        size = rows.stop - rows.start
+
+        if method == "bootstrap":
+            samples = profits[rng.integers(0, n_trades, size=(size, n_trades))]
+        else:
+            samples = rng.permuted(np.broadcast_to(profits, (size, n_trades)), axis=1)
+
+        equity = initial_investment + np.cumsum(samples, axis=1)
+        peak = np.maximum(np.maximum.accumulate(equity, axis=1), initial_investment)
+        drawdown = equity - peak
+
+        total_profit[rows] = equity[:, -1] - initial_investment
+        worst = drawdown.argmin(axis=1)
+        max_drawdown[rows] = drawdown[np.arange(size), worst]
+        max_drawdown_pct[rows] = 100 * max_drawdown[rows] / peak[np.arange(size), worst]
+
+    roi = 100 * total_profit / initial_investment
+
+    return {
+        "method": method,
+        "n_sims": n_sims,
+        "n_trades": n_trades,
+        "seed": seed,
+        "chunk_size": chunk_size,
+        "percentiles": list(percentiles),
+        "total_profit": _bands(total_profit, percentiles),
+        "strategy_roi": _bands(roi, percentiles),
+        "max_drawdown": _bands(max_drawdown, percentiles),
+        "max_drawdown_pct": _bands(max_drawdown_pct, percentiles),
+        "probability_of_loss": round(float(np.mean(total_profit < 0)), 4),
+    }
+
+
+def _bands(values: np.ndarray, percentiles: list) -> dict:
+    """
+    Returns {percentile: value} rounded to 2 dp, with the mean.
+    Ex:
+    >>> {"p5": -120.5, "p50": 10.2, "p95": 180.0, "mean": 12.1}
+    """
+    bands = {f"p{percentile}": round(float(value), 2) for percentile, value in zip(percentiles, np.percentile(values, percentiles))}
+    bands["mean"] = round(float(values.mean()), 2)
+    return bands
@@ -0,0 +1,186 @@
+import inspect
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from yf_service.common.core import get_column_values
+from yf_service.strategy.handler import StrategyHandler
+from yf_service.strategy.sweep import MAX_PROCESS_WORKERS
+from yf_service.strategy.trades import Trades
+
+ALLOCATIONS = ["equal", "universe"]
+
+
+def build_signal_matrices(frames: dict, strategy_name: str, params: dict, max_workers: int = 1) -> tuple:
+    """
+    Runs a strategy on each ticker of frames ({code: DataFrame}) and aligns the results on the
+    union of their dates. Returns (dates, codes, close, buy, sell) where close is a float
+    (dates x tickers) matrix and buy / sell are the boolean BuySignal / SellSignal matrices.
+    Close prices are carried forward over dates a ticker did not trade, and are NaN before
+    its first bar. Tickers are split across at most MAX_PROCESS_WORKERS worker processes.
+    """
+    params = strategy_params(strategy_name, params)
+
+    items = [
+        (code, df.index, get_column_values(df, "Close").astype(float), get_column_values(df, "Volume").astype(float))
+        for code, df in frames.items()
+        if df is not None and not df.empty
+    ]
+    if not items:
+        raise ValueError("No price data for the requested codes.")
+
+    max_workers = max(1, min(max_workers, MAX_PROCESS_WORKERS, len(items)))
+    if max_workers > 1:
+        chunks = [items[i::max_workers] for i in range(max_workers) if items[i::max_workers]]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(ticker_signals, strategy_name, params, chunk) for chunk in chunks]
+            signals = [row for future in futures for row in future.result()]
+    else:
+        signals = ticker_signals(strategy_name, params, items)
+
+    signals = {code: (buy_signal, sell_signal) for code, buy_signal, sell_signal in signals}
+    codes = [code for code, _, _, _ in items]
+    dates = pd.DatetimeIndex(np.unique(np.concatenate([index.values for _, index, _, _ in items])), name="Date")
+
+    close = np.full((len(dates), len(codes)), np.nan)
+    buy = np.zeros((len(dates), len(codes)), dtype=bool)
+    sell = np.zeros((len(dates), len(codes)), dtype=bool)
+
+    # one column per ticker, filled at the rows of its own dates
+    for column, (code, index, ticker_close, _) in enumerate(items):
+        rows = dates.get_indexer(index)
+        close[rows, column] = ticker_close
+        buy[rows, column], sell[rows, column] = signals[code]
+
+    close = pd.DataFrame(close).ffill().to_numpy()
+    return dates, codes, close, buy, sell
+
+
+def strategy_params(strategy_name: str, params: dict) -> dict:
+    """
+    Returns the params the strategy accepts (e.g. drops window_signal for MA).
+    """
+    strategy_class = StrategyHandler.strategy_map.get(strategy_name)
+    if not strategy_class:
+        raise ValueError(f"Strategy '{strategy_name}' is not supported.")
+
+    accepted = inspect.signature(strategy_class).parameters
+    return {key: value for key, value in params.items() if key in accepted}
+
+
+def ticker_signals(strategy_name: str, params: dict, items: list) -> list:
+    """
+    Returns (code, buy_signal, sell_signal) for each (code, index, close, volume) item.
+    """
+    signals = []
+    for code, index, close, volume in items:
+        data = pd.DataFrame({"Close": close, "Volume": volume}, index=index)
+        trades = Trades(StrategyHandler(data=data).get_strategy(strategy_name=strategy_name, **params))
+        signals.append((code, trades.buy_signal, trades.sell_signal))
+    return signals
+
+
+def holdings(buy: np.ndarray, sell: np.ndarray) -> np.ndarray:
+    """
+    Returns a boolean (dates x tickers) matrix that is True while a position is held.
+    A position is opened at the close of a BuySignal and closed at the close of the next
+    SellSignal, the same pairing Results uses.
+    """
+    rows = np.arange(buy.shape[0])[:, None]
+    last_buy = np.maximum.accumulate(np.where(buy, rows, -1), axis=0)
+    last_sell = np.maximum.accumulate(np.where(sell, rows, -1), axis=0)
+    return last_buy > last_sell
+
+
+def simulate_portfolio(close: np.ndarray,
+                       buy: np.ndarray,
+                       sell: np.ndarray,
+                       initial_capital: float = 10000,
+                       allocation: str = "equal",
+                       cost_bps: float = 0.0) -> dict:
+    """
+    Simulates a portfolio from (dates x tickers) close prices and Buy / Sell signal matrices.
+
+    Allocation is rebalanced at every close:
+    >>> equal    : equity is split equally across the open positions, cash only when none are open
+    >>> universe : every ticker has a fixed 1 / n_tickers slot, unused slots are held in cash
+
+    Each day's return is the previous close's weights times the tickers' returns, less
+    cost_bps on the traded weight. Returns the equity, exposure, drawdown and number of open
+    positions per date as arrays.
+    """
+    if allocation not in ALLOCATIONS:
+        raise ValueError(f"Unsupported allocation '{allocation}', choose one of {ALLOCATIONS}.")
+
+    held = holdings(buy, sell) & ~np.isnan(close)
+    open_positions = held.sum(axis=1)
+
+    if allocation == "equal":
+        weights = held / np.maximum(open_positions, 1)[:, None]
+    else:
+        weights = held / held.shape[1]
+
+    returns = np.zeros_like(close)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        returns[1:] = close[1:] / close[:-1] - 1
+    returns[~np.isfinite(returns)] = 0.0
+
+    portfolio_returns = np.zeros(close.shape[0])
+    portfolio_returns[1:] = np.einsum("ij,ij->i", weights[:-1], returns[1:])
+
+    turnover = np.abs(np.diff(weights, axis=0, prepend=0.0)).sum(axis=1)
+    portfolio_returns -= turnover * cost_bps / 10000
+
+    equity = initial_capital * np.cumprod(1 + portfolio_returns)
+    drawdown = equity / np.maximum.accumulate(equity) - 1
+
+    return {
+        "equity": equity,
+        "exposure": weights.sum(axis=1),
+        "drawdown": drawdown,
+        "open_positions": open_positions,
+        "turnover": turnover,
+    }
+
+
+def run_portfolio_backtest(frames: dict,
+                           strategy_name: str,
+                           params: dict,
+                           initial_capital: float = 10000,
+                           allocation: str = "equal",
+                           cost_bps: float = 0.0,
+                           max_workers: int = 1) -> dict:
+    """
+    Builds the signal matrices of a strategy over frames ({code: DataFrame}) and simulates the
+    portfolio. Returns the summary metrics and the per-date equity, exposure and drawdown.
+    """
+    params = strategy_params(strategy_name, params)
+    dates, codes, close, buy, sell = build_signal_matrices(frames, strategy_name, params, max_workers=max_workers)
+    simulation = simulate_portfolio(close, buy, sell, initial_capital=initial_capital, allocation=allocation, cost_bps=cost_bps)
+
+    equity = simulation["equity"]
+    years = max((dates[-1] - dates[0]).days / 365.25, 1 / 365.25)
+
+    return {
+        "strategy": strategy_name,
+        "params": params,
+        "allocation": allocation,
+        "codes": codes,
+        "initial_capital": initial_capital,
+        "final_equity": round(float(equity[-1]), 2),
+        "total_return_pct": round(float(100 * (equity[-1] / initial_capital - 1)), 2),
+        "cagr_pct": round(float(100 * ((equity[-1] / initial_capital) ** (1 / years) - 1)), 2),
+        "max_drawdown_pct": round(float(100 * simulation["drawdown"].min()), 2),
+        "average_exposure_pct": round(float(100 * simulation["exposure"].mean()), 2),
+        "max_open_positions": int(simulation["open_positions"].max()),
+        "curve": [
+            {"date": date, "equity": round(value, 2), "exposure": round(exposure, 4), "drawdown": round(drawdown, 4)}
+            for date, value, exposure, drawdown in zip(
+                dates.strftime('%Y-%m-%d'),
+                equity.tolist(),
+                simulation["exposure"].tolist(),
+                simulation["drawdown"].tolist(),
+            )
+        ],
+    }
@@ -1,5 +1,4 @@
-import math
-import pandas as pd
+import numpy as np
 
 from yf_service.common.core import round_result
 
@@ -12,15 +11,22 @@ class Results:
     4. Number of profitable / loss trades
     5. Pct win / loss
     6. Greatest profit / loss
+
+    Buy / sell pairs are held as contiguous numpy arrays (one element per trade),
+    and every metric is computed from those arrays.
     """
-    
-    def __init__(self, strategy: pd.DataFrame):
+    INITIAL_INVESTMENT = 1000
+
+    def __init__(self, strategy):
         """
-        Initializes the Results object with strategy data.
+        Initializes the Results object with the signals and close prices of a Trades object.
         """
-        self.INITIAL_INVESTMENT = 1000
-        
-        self._data = strategy._data.copy()
+        self._trades = strategy
+        self.buy_idx, self.sell_idx = self.determine_buy_sell_indices()
+        self.buy_prices, self.sell_prices = self.determine_buy_sell_prices()
+        self.profits = self.determine_profit_per_trade_array()
+        self.cumulative_profits = np.cumsum(self.profits)
+
         self.buy_sell_pairs_timestamp = self.collect_buy_sell_pairs_datetime()
         self.buy_sell_pairs = self.determine_buy_sell_pairs()
         self.profit_loss_shares = self.determine_profit_loss_dependent_on_shares()
@@ -35,7 +41,33 @@ class Results:
         self.greatest_profit = self.determine_greatest_profit()
         self.greatest_loss = self.determine_greatest_loss()
 
-    
+
+    def determine_buy_sell_indices(self):
+        """
+        Pairs each sell signal with the most recent unmatched buy signal, see buy_sell_indices.
+        """
+        return buy_sell_indices(self._trades.buy_signal, self._trades.sell_signal)
+
+
+    def determine_buy_sell_prices(self):
+        """
+        Returns the close prices at each paired buy and sell signal.
+        """
+        close_prices = self._trades.close
+        return close_prices[self.buy_idx], close_prices[self.sell_idx]
+
+
+    def determine_profit_per_trade_array(self):
+        """
+        Determine profit / loss per trade multiplied by number of shares, rounded to 2 dp.
+        """
+        num_shares = np.floor(self.INITIAL_INVESTMENT / self.buy_prices)
+        profits = num_shares * (self.sell_prices - self.buy_prices)
+
+        # python round() per trade keeps stored results identical to the previous row-wise implementation
+        return np.array([round(profit, 2) for profit in profits.tolist()], dtype=float)
+
+
     def collect_buy_sell_pairs_datetime(self):
         """
         Collects date-time buy/sell pairs with their respective datetime timestamp.
@@ -47,122 +79,70 @@ class Results:
             (yyyy-mm-dd, buy_priceN, yyyy-mm-dd, sell_priceN)
         ]
         """
-        buy_sell_pairs = []
-        current_buy = None
-        
-        for index, row in self._data.iterrows():
-            date = index.date().strftime('%Y-%m-%d') # aid serialisation from json to str
-            close_price = row['Close'].iloc[0]
-            buy_signal = row['BuySignal'].iloc[0]
-            sell_signal = row['SellSignal'].iloc[0]
-            
-            # Check for a buy signal
-            if buy_signal:
-                current_buy = (date, close_price)
-            
-            # Check for a sell signal if there's a recorded buy
-            if sell_signal and current_buy:
-                buy_date, buy_price = current_buy
-                sell_date = date
-                sell_price = close_price
-                buy_sell_pairs.append((buy_date, buy_price, sell_date, sell_price))
-                current_buy = None
-        
-        return buy_sell_pairs
-    
-    
+        dates = self._trades.index
+        buy_dates = dates[self.buy_idx].strftime('%Y-%m-%d') # aid serialisation from json to str
+        sell_dates = dates[self.sell_idx].strftime('%Y-%m-%d')
+
+        return list(zip(buy_dates, self.buy_prices.tolist(), sell_dates, self.sell_prices.tolist()))
+
+
     def determine_buy_sell_pairs(self):
         """
         Identifies and returns a list of buy/sell pairs from the strategy data.
         """
-        pairs = []
-        
-        for _, buy_price, _, sell_price in self.buy_sell_pairs_timestamp:
-            pairs.append((buy_price, sell_price))
+        return list(zip(self.buy_prices.tolist(), self.sell_prices.tolist()))
 
-        return pairs
 
-    
     def determine_profit_loss_dependent_on_shares(self):
         """
         Determine profit / loss per trade multiplied by number of shares.
         Returns profit per trade and sell date.
         """
-        profit_per_trade_list = []
-        for _, buy_price, sell_date, sell_price in self.buy_sell_pairs_timestamp:
+        sell_dates = [sell_date for _, _, sell_date, _ in self.buy_sell_pairs_timestamp]
+        return list(zip(sell_dates, self.profits.tolist()))
 
-            num_shares = math.floor(self.INITIAL_INVESTMENT / buy_price)
-            profit_per_trade = round(num_shares * (sell_price - buy_price), 2)
-
-            profit_per_trade_list.append((sell_date, profit_per_trade))
-            
-        return profit_per_trade_list
-    
 
     def determine_strategy_roi(self):
         """
         Determines strategy Return on Investment for investment period as a pct of initial investment.
         """
-        total_profit = 0
-        for _, profit in self.profit_loss_shares:
+        strategy_roi = 100 * (self._total_profit() / self.INITIAL_INVESTMENT)
+        return round(strategy_roi, 2)
 
-            total_profit += profit
 
-        strategy_roi = 100 * (total_profit / self.INITIAL_INVESTMENT)
-        return round(strategy_roi, 2)
-    
-    
     def determine_total_profit(self):
         """
         Calculates the total profit or loss from all buy/sell pairs.
         """
-        total_profit = 0
-        for _, profit in self.profit_loss_shares:
-            total_profit += profit
-        
-        return round(total_profit, 2)
+        return round(self._total_profit(), 2)
+
 
-    
     def determine_total_profit_per_trade(self):
         """
         Calculates the profit or loss for each buy/sell pair.
         """
-        profit_per_trade_list = []
-        for _, profit in self.profit_loss_shares:
-            profit_per_trade_list.append(profit)
-        
-        return profit_per_trade_list
+        return self.profits.tolist()
 
 
     def determine_number_of_trades(self):
         """
         Determines the total number of buy/sell pairs (trades).
         """
-        return len(self.buy_sell_pairs)
+        return int(self.buy_idx.size)
 
 
     def determine_number_profit_trades(self):
         """
         Calculates the number of trades that resulted in a profit.
         """
-        num_profit = 0
-        for buy_price, sell_price in self.buy_sell_pairs:
-            if sell_price > buy_price:
-                num_profit += 1
-        
-        return num_profit
+        return int(np.count_nonzero(self.sell_prices > self.buy_prices))
 
 
     def determine_number_loss_trades(self):
         """
         Calculates the number of trades that resulted in a loss.
         """
-        num_loss = 0
-        for buy_price, sell_price in self.buy_sell_pairs:
-            if sell_price < buy_price:
-                num_loss += 1
-        
-        return num_loss
+        return int(np.count_nonzero(self.sell_prices < self.buy_prices))
 
 
     def determine_pct_win_from_strategy(self):
@@ -197,3 +177,42 @@ class Results:
         Identifies the largest loss from a single trade.
         """
         return round_result(min(self.total_profit_per_trade))
+
+
+    def _total_profit(self):
+        """
+        Returns the running total of profit after the last trade.
+        """
+        if self.cumulative_profits.size == 0:
+            return 0
+        return float(self.cumulative_profits[-1])
+
+
+def buy_sell_indices(buy_signal, sell_signal) -> tuple:
+    """
+    Pairs each sell signal with the most recent unmatched buy signal.
+    Returns the row positions of the buys and sells as two index arrays.
+
+    A buy stays open until the next sell signal. Later buy signals replace an open buy,
+    and sell signals without an open buy are ignored.
+    """
+    # most recent buy row at or before each row (-1 if no buy yet)
+    positions = np.arange(len(buy_signal))
+    last_buy = np.maximum.accumulate(np.where(buy_signal, positions, -1))
+
+    # a sell closes a trade only if it is the first sell after its buy
+    sell_idx = np.flatnonzero(sell_signal)
+    buy_idx = last_buy[sell_idx]
+    previous_buy_idx = np.concatenate(([-1], buy_idx[:-1]))
+    is_pair = (buy_idx >= 0) & (buy_idx != previous_buy_idx)
+
+    return buy_idx[is_pair], sell_idx[is_pair]
+
+
+def count_completed_trades(trades) -> int:
+    """
+    Returns the number of buy / sell pairs Results would build from a Trades object.
+    Results needs at least one, as its win / loss percentages and greatest profit / loss
+    are undefined without trades.
+    """
+    return int(buy_sell_indices(trades.buy_signal, trades.sell_signal)[0].size)
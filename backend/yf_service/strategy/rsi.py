@@ -1,23 +1,27 @@
 import pandas as pd
-from ta.momentum import RSIIndicator
 
+from yf_service.common.core import get_column_series
+from yf_service.strategy.base import Strategy
+from yf_service.strategy.indicators import rsi
 
-class Strategy_RSI:
+
+class Strategy_RSI(Strategy):
     def __init__(self,
                  data: pd.DataFrame,
                  window_slow=14,
                  window_fast=2):
+        super().__init__(data)
         
         # algorithm implementation
-        close_prices = data["Close"]
-        rsi_slow = RSIIndicator(close=close_prices, window=window_slow).rsi()
-        rsi_fast = RSIIndicator(close=close_prices, window=window_fast).rsi()
+        close_prices = get_column_series(data, "Close")
+        rsi_slow = rsi(close_prices, window=window_slow)
+        rsi_fast = rsi(close_prices, window=window_fast)
 
-        data["rsi_slow"] = rsi_slow
-        data["rsi_fast"] = rsi_fast
+        self.indicators["rsi_slow"] = rsi_slow.to_numpy()
+        self.indicators["rsi_fast"] = rsi_fast.to_numpy()
 
         # trading signals
-        data["BuyCondition"]  = data["rsi_fast"] > data["rsi_slow"]
-        data["SellCondition"] = data["rsi_fast"] < data["rsi_slow"]
-
-        self._df = data
+        self.set_conditions(
+            buy_condition=rsi_fast > rsi_slow,
+            sell_condition=rsi_fast < rsi_slow,
+        )
@@ -0,0 +1,17 @@
+import numpy as np
+
+
+def rising_edge(condition) -> np.ndarray:
+    """
+    Returns a boolean array that is True only on the first True of each run of True values.
+    Ex:
+    >>> condition : [True, True, False, True, True, False]
+    >>> output    : [True, False, False, True, False, False]
+    """
+    values = np.asarray(condition, dtype=bool)
+
+    previous = np.empty_like(values)
+    previous[..., :1] = False
+    previous[..., 1:] = values[..., :-1]
+
+    return values & ~previous
@@ -0,0 +1,524 @@
+import math
+from abc import ABC, abstractmethod
+
+import pandas as pd
+
+from yf_service.common.core import get_column_values
+
+
+class RollingMeanState:
+    """
+    Rolling mean over the last window values, advanced one value at a time.
+    Keeps a ring buffer of the window and replays pandas' roll_mean on it: the value leaving the
+    window is removed before the new one is added, each with its own Kahan compensation, and a
+    window of identical values returns that value. Each update is O(1) and the means are equal,
+    bit for bit, to pandas rolling(window, min_periods).mean() on the same values.
+    """
+
+    def __init__(self, window: int, min_periods: int = 1):
+        if window < 1:
+            raise ValueError(f"'window' must be at least 1, got {window}.")
+
+        self.window = window
+        self.min_periods = min_periods
+
+        self.buffer = [math.nan] * window
+        self.position = 0
+        self.nobs = 0
+        self.neg_ct = 0
+        self.total = 0.0
+        self.compensation_add = 0.0
+        self.compensation_remove = 0.0
+        self.num_consecutive_same_value = 0
+        self.prev_value = math.nan
+
+    def update(self, value: float) -> float:
+        value = float(value)
+
+        if self.window == 1:
+            # pandas restarts the sums of a window that shares no value with the previous one
+            self.nobs = self.neg_ct = self.num_consecutive_same_value = 0
+            self.total = self.compensation_add = self.compensation_remove = 0.0
+            self.prev_value = value
+        else:
+            self._remove(self.buffer[self.position])
+        self._add(value)
+
+        self.buffer[self.position] = value
+        self.position = (self.position + 1) % self.window
+
+        if self.nobs < max(self.min_periods, 1):
+            return math.nan
+
+        result = self.total / self.nobs
+        if self.num_consecutive_same_value >= self.nobs:
+            return self.prev_value
+        if self.neg_ct == 0 and result < 0 or self.neg_ct == self.nobs and result > 0:
+            return 0.0
+        return result
+
+    def _add(self, value: float):
+        if math.isnan(value):
+            return
+        self.nobs += 1
+        self.neg_ct += math.copysign(1, value) < 0
+        y = value - self.compensation_add
+        t = self.total + y
+        self.compensation_add = t - self.total - y
+        self.total = t
+
+        if value == self.prev_value:
+            self.num_consecutive_same_value += 1
+        else:
+            self.num_consecutive_same_value = 1
+        self.prev_value = value
+
+    def _remove(self, value: float):
+        if math.isnan(value):
+            return
+        self.nobs -= 1
+        self.neg_ct -= math.copysign(1, value) < 0
+        y = -value - self.compensation_remove
+        t = self.total + y
+        self.compensation_remove = t - self.total - y
+        self.total = t
+
+    def to_dict(self) -> dict:
+        return {
+            "window": self.window,
+            "min_periods": self.min_periods,
+            "buffer": [_to_json(value) for value in self.buffer],
+            "position": self.position,
+            "nobs": self.nobs,
+            "neg_ct": self.neg_ct,
+            "total": self.total,
+            "compensation_add": self.compensation_add,
+            "compensation_remove": self.compensation_remove,
+            "num_consecutive_same_value": self.num_consecutive_same_value,
+            "prev_value": _to_json(self.prev_value),
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict):
+        obj = cls(window=state["window"], min_periods=state["min_periods"])
+        obj.buffer = [_from_json(value) for value in state["buffer"]]
+        obj.position = state["position"]
+        obj.nobs = state["nobs"]
+        obj.neg_ct = state["neg_ct"]
+        obj.total = state["total"]
+        obj.compensation_add = state["compensation_add"]
+        obj.compensation_remove = state["compensation_remove"]
+        obj.num_consecutive_same_value = state["num_consecutive_same_value"]
+        obj.prev_value = _from_json(state["prev_value"])
+        return obj
+
+
+class EMAState:
+    """
+    Exponential moving average (adjust=False), advanced one value at a time.
+    Follows the same recurrence as pandas ewm(...).mean(), including leading and missing values.
+    """
+
+    def __init__(self, span: int = None, min_periods: int = 0, alpha: float = None):
+        if alpha is None:
+            alpha = 2 / (span + 1)
+
+        self.span = span
+        self.alpha = alpha
+        self.min_periods = min_periods
+
+        self.value = math.nan
+        self.old_weight = 1.0
+        self.nobs = 0
+
+    def update(self, value: float) -> float:
+        value = float(value)
+        is_observation = not math.isnan(value)
+        self.nobs += is_observation
+
+        if not math.isnan(self.value):
+            self.old_weight *= 1 - self.alpha
+            if is_observation:
+                if self.value != value:
+                    self.value = (self.old_weight * self.value + self.alpha * value) / (self.old_weight + self.alpha)
+                self.old_weight = 1.0
+        elif is_observation:
+            self.value = value
+
+        if self.nobs < max(self.min_periods, 1):
+            return math.nan
+        return self.value
+
+    def to_dict(self) -> dict:
+        return {
+            "span": self.span,
+            "alpha": self.alpha,
+            "min_periods": self.min_periods,
+            "value": _to_json(self.value),
+            "old_weight": self.old_weight,
+            "nobs": self.nobs,
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict):
+        obj = cls(span=state["span"], min_periods=state["min_periods"], alpha=state["alpha"])
+        obj.value = _from_json(state["value"])
+        obj.old_weight = state["old_weight"]
+        obj.nobs = state["nobs"]
+        return obj
+
+
+class RSIState:
+    """
+    Wilder Relative Strength Index, advanced one close at a time.
+    Matches ta.momentum.RSIIndicator(close, window).rsi() with fillna=False.
+    """
+
+    def __init__(self, window: int):
+        self.window = window
+        self.previous_close = math.nan
+        self.ema_up = EMAState(alpha=1 / window, min_periods=window)
+        self.ema_down = EMAState(alpha=1 / window, min_periods=window)
+
+    def update(self, close: float) -> float:
+        diff = float(close) - self.previous_close
+        self.previous_close = float(close)
+
+        up = diff if diff > 0 else 0.0
+        down = -diff if diff < 0 else 0.0
+        ema_up = self.ema_up.update(up)
+        ema_down = self.ema_down.update(down)
+
+        if ema_down == 0:
+            return 100.0
+        return 100 - (100 / (1 + ema_up / ema_down))
+
+    def to_dict(self) -> dict:
+        return {
+            "window": self.window,
+            "previous_close": _to_json(self.previous_close),
+            "ema_up": self.ema_up.to_dict(),
+            "ema_down": self.ema_down.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict):
+        obj = cls(window=state["window"])
+        obj.previous_close = _from_json(state["previous_close"])
+        obj.ema_up = EMAState.from_dict(state["ema_up"])
+        obj.ema_down = EMAState.from_dict(state["ema_down"])
+        return obj
+
+
+class MACDState:
+    """
+    MACD line, signal line and histogram, advanced one value at a time.
+    With min_periods=True the EMAs wait for a full window like ta.trend.MACD,
+    otherwise they start from the first value like Strategy_VW_MACD.
+    """
+
+    def __init__(self, window_slow: int, window_fast: int, window_signal: int, min_periods: bool = True):
+        self.window_slow = window_slow
+        self.window_fast = window_fast
+        self.window_signal = window_signal
+        self.min_periods = min_periods
+
+        self.ema_slow = EMAState(span=window_slow, min_periods=window_slow if min_periods else 0)
+        self.ema_fast = EMAState(span=window_fast, min_periods=window_fast if min_periods else 0)
+        self.ema_signal = EMAState(span=window_signal, min_periods=window_signal if min_periods else 0)
+
+    def update(self, value: float) -> tuple:
+        macd_line = self.ema_fast.update(value) - self.ema_slow.update(value)
+        macd_signal = self.ema_signal.update(macd_line)
+        return macd_line, macd_signal, macd_line - macd_signal
+
+    def to_dict(self) -> dict:
+        return {
+            "window_slow": self.window_slow,
+            "window_fast": self.window_fast,
+            "window_signal": self.window_signal,
+            "min_periods": self.min_periods,
+            "ema_slow": self.ema_slow.to_dict(),
+            "ema_fast": self.ema_fast.to_dict(),
+            "ema_signal": self.ema_signal.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict):
+        obj = cls(state["window_slow"], state["window_fast"], state["window_signal"], state["min_periods"])
+        obj.ema_slow = EMAState.from_dict(state["ema_slow"])
+        obj.ema_fast = EMAState.from_dict(state["ema_fast"])
+        obj.ema_signal = EMAState.from_dict(state["ema_signal"])
+        return obj
+
+
+class StreamingStrategy(ABC):
+    """
+    Base class for strategies that advance one bar at a time.
+
+    Subclasses hold their indicator states and implement the abstract _conditions(), which returns
+    the bar's indicator values with its BuyCondition and SellCondition, _params() and
+    _indicator_states(), so an incomplete subclass fails on instantiation. update() adds the
+    BuySignal / SellSignal rising edges the same way Trades does for a full frame.
+
+    The whole state round-trips through to_dict() / from_dict() as JSON-serialisable data,
+    so a watchlist can be refreshed by loading each state, appending the latest bar and saving it.
+    """
+    name = None
+
+    def __init__(self):
+        self.bars = 0
+        self.last_date = None
+        self.previous_buy_condition = False
+        self.previous_sell_condition = False
+
+    def update(self, close: float, volume: float = math.nan, date=None) -> dict:
+        """
+        Advances the strategy by one bar and returns its indicators, conditions and signals.
+        """
+        row = self._conditions(float(close), float(volume))
+        buy_condition = bool(row["BuyCondition"])
+        sell_condition = bool(row["SellCondition"])
+
+        row["BuySignal"] = buy_condition and not self.previous_buy_condition
+        row["SellSignal"] = sell_condition and not self.previous_sell_condition
+
+        self.previous_buy_condition = buy_condition
+        self.previous_sell_condition = sell_condition
+        self.bars += 1
+        if date is not None:
+            self.last_date = pd.Timestamp(date).isoformat()
+
+        return row
+
+    def update_frame(self, data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Advances the strategy through every bar of data and returns one row per bar.
+        Bars at or before last_date are skipped, so a frame that overlaps the stored state
+        only contributes its new bars.
+        """
+        close = get_column_values(data, "Close").astype(float)
+        volume = get_column_values(data, "Volume").astype(float) if "Volume" in data else [math.nan] * len(close)
+
+        rows, index = [], []
+        last_date = pd.Timestamp(self.last_date) if self.last_date else None
+        for date, close_price, bar_volume in zip(data.index, close, volume):
+            if last_date is not None and pd.Timestamp(date) <= last_date:
+                continue
+            rows.append(self.update(close_price, bar_volume, date))
+            index.append(date)
+
+        return pd.DataFrame(rows, index=pd.Index(index, name=data.index.name))
+
+    @abstractmethod
+    def _conditions(self, close: float, volume: float) -> dict:
+        """
+        Advances the indicator states by one bar and returns its indicator values with its
+        BuyCondition and SellCondition.
+        """
+
+    @abstractmethod
+    def _params(self) -> dict:
+        """
+        Returns the window parameters the strategy was created with.
+        """
+
+    @abstractmethod
+    def _indicator_states(self) -> dict:
+        """
+        Returns the indicator states by attribute name, saved by to_dict() and restored by from_dict().
+        """
+
+    def to_dict(self) -> dict:
+        return {
+            "strategy": self.name,
+            "params": self._params(),
+            "bars": self.bars,
+            "last_date": self.last_date,
+            "previous_buy_condition": self.previous_buy_condition,
+            "previous_sell_condition": self.previous_sell_condition,
+            "indicators": {key: state.to_dict() for key, state in self._indicator_states().items()},
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict):
+        obj = cls(**state["params"])
+        obj.bars = state["bars"]
+        obj.last_date = state["last_date"]
+        obj.previous_buy_condition = state["previous_buy_condition"]
+        obj.previous_sell_condition = state["previous_sell_condition"]
+        obj._load_indicator_states(state["indicators"])
+        return obj
+
+    def _load_indicator_states(self, states: dict):
+        for key, state in self._indicator_states().items():
+            setattr(self, key, type(state).from_dict(states[key]))
+
+
+class StreamingMA(StreamingStrategy):
+    """
+    Streaming counterpart of Strategy_MA.
+    """
+    name = "MA"
+
+    def __init__(self, window_slow=26, window_fast=12):
+        super().__init__()
+        self.ma_slow = RollingMeanState(window_slow, min_periods=1)
+        self.ma_fast = RollingMeanState(window_fast, min_periods=1)
+
+    def _conditions(self, close, volume):
+        ma_fast = self.ma_fast.update(close)
+        ma_slow = self.ma_slow.update(close)
+        return {
+            "Close": close,
+            "MA_fast": ma_fast,
+            "MA_slow": ma_slow,
+            "BuyCondition": ma_fast >= ma_slow,
+            "SellCondition": ma_fast < ma_slow,
+        }
+
+    def _params(self):
+        return {"window_slow": self.ma_slow.window, "window_fast": self.ma_fast.window}
+
+    def _indicator_states(self):
+        return {"ma_slow": self.ma_slow, "ma_fast": self.ma_fast}
+
+
+class StreamingMACD(StreamingStrategy):
+    """
+    Streaming counterpart of Strategy_MACD.
+    """
+    name = "MACD"
+    columns = ("macd", "macd_signal", "macd_diff")
+
+    def __init__(self, window_slow=26, window_fast=12, window_signal=9):
+        super().__init__()
+        self.macd = MACDState(window_slow, window_fast, window_signal, min_periods=True)
+        self.previous_diff = math.nan
+
+    def _conditions(self, close, volume):
+        macd_line, macd_signal, macd_diff = self.macd.update(self._value(close, volume))
+        previous_diff, self.previous_diff = self.previous_diff, macd_diff
+
+        row = {"Close": close}
+        row.update(zip(self.columns, (macd_line, macd_signal, macd_diff)))
+        row["BuyCondition"] = macd_diff > 0 and previous_diff <= 0
+        row["SellCondition"] = macd_diff < 0 and previous_diff >= 0
+        return row
+
+    @staticmethod
+    def _value(close, volume):
+        return close
+
+    def _params(self):
+        return {
+            "window_slow": self.macd.window_slow,
+            "window_fast": self.macd.window_fast,
+            "window_signal": self.macd.window_signal,
+        }
+
+    def _indicator_states(self):
+        return {"macd": self.macd}
+
+    def to_dict(self):
+        state = super().to_dict()
+        state["previous_diff"] = _to_json(self.previous_diff)
+        return state
+
+    @classmethod
+    def from_dict(cls, state):
+        obj = super().from_dict(state)
+        obj.previous_diff = _from_json(state["previous_diff"])
+        return obj
+
+
+class StreamingVW_MACD(StreamingMACD):
+    """
+    Streaming counterpart of Strategy_VW_MACD.
+    """
+    name = "VW_MACD"
+    columns = ("VW_MACD", "VW_MACD_signal", "VW_MACD_diff")
+
+    def __init__(self, window_slow=26, window_fast=12, window_signal=9):
+        StreamingStrategy.__init__(self)
+        self.macd = MACDState(window_slow, window_fast, window_signal, min_periods=False)
+        self.previous_diff = math.nan
+
+    @staticmethod
+    def _value(close, volume):
+        # same arithmetic as Strategy_VW_MACD: (close * volume) / volume, where 0 / 0 is NaN
+        if volume == 0:
+            return math.nan
+        return (close * volume) / volume
+
+
+class StreamingRSI(StreamingStrategy):
+    """
+    Streaming counterpart of Strategy_RSI.
+    """
+    name = "RSI"
+
+    def __init__(self, window_slow=14, window_fast=2):
+        super().__init__()
+        self.rsi_slow = RSIState(window_slow)
+        self.rsi_fast = RSIState(window_fast)
+
+    def _conditions(self, close, volume):
+        rsi_slow = self.rsi_slow.update(close)
+        rsi_fast = self.rsi_fast.update(close)
+        return {
+            "Close": close,
+            "rsi_slow": rsi_slow,
+            "rsi_fast": rsi_fast,
+            "BuyCondition": rsi_fast > rsi_slow,
+            "SellCondition": rsi_fast < rsi_slow,
+        }
+
+    def _params(self):
+        return {"window_slow": self.rsi_slow.window, "window_fast": self.rsi_fast.window}
+
+    def _indicator_states(self):
+        return {"rsi_slow": self.rsi_slow, "rsi_fast": self.rsi_fast}
+
+
+streaming_strategy_map = {
+    "MA": StreamingMA,
+    "MACD": StreamingMACD,
+    "RSI": StreamingRSI,
+    "VW_MACD": StreamingVW_MACD,
+}
+
+
+def create_streaming_strategy(strategy_name: str, data: pd.DataFrame = None, **kwargs) -> StreamingStrategy:
+    """
+    Returns a streaming strategy, primed with the bars of data when given.
+    """
+    strategy_class = streaming_strategy_map.get(strategy_name)
+
+    if not strategy_class:
+        raise ValueError(f"Strategy '{strategy_name}' is not supported.")
+
+    strategy = strategy_class(**kwargs)
+    if data is not None:
+        strategy.update_frame(data)
+    return strategy
+
+
+def load_streaming_strategy(state: dict) -> StreamingStrategy:
+    """
+    Rebuilds a streaming strategy from the output of StreamingStrategy.to_dict().
+    """
+    strategy_class = streaming_strategy_map.get(state.get("strategy"))
+
+    if not strategy_class:
+        raise ValueError(f"Strategy '{state.get('strategy')}' is not supported.")
+
+    return strategy_class.from_dict(state)
+
+
+def _to_json(value: float):
+    return None if math.isnan(value) else value
+
+
+def _from_json(value) -> float:
+    return math.nan if value is None else value
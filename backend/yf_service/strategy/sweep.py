@@ -0,0 +1,150 @@
+import inspect
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from yf_service.common.core import get_column_values
+from yf_service.strategy.handler import StrategyHandler
+from yf_service.strategy.results import Results, count_completed_trades
+from yf_service.strategy.trades import Trades
+
+# upper bound on the number of parameter combinations evaluated per sweep
+MAX_SWEEP_COMBINATIONS = 10000
+
+# upper bound on the worker processes of a pool, more than one per core only adds overhead
+MAX_PROCESS_WORKERS = os.cpu_count() or 1
+
+RESULT_METRICS = [
+    "strategy_roi",
+    "total_profit",
+    "total_number_of_trades",
+    "number_profit_trades",
+    "number_loss_trades",
+    "pct_win",
+    "pct_loss",
+    "greatest_profit",
+    "greatest_loss",
+]
+
+
+def parse_window_range(value) -> list:
+    """
+    Returns the list of window sizes described by value.
+    Ex:
+    >>> 14                                   : [14]
+    >>> [10, 20, 30]                         : [10, 20, 30]
+    >>> {"start": 10, "stop": 30, "step": 10} : [10, 20, 30] (stop is inclusive)
+    """
+    if value is None:
+        return [None]
+
+    if isinstance(value, dict):
+        start = int(value["start"])
+        stop = int(value["stop"])
+        step = int(value.get("step", 1))
+        if step < 1:
+            raise ValueError("Window range 'step' must be a positive integer.")
+        return list(range(start, stop + 1, step))
+
+    if isinstance(value, (list, tuple)):
+        return [int(window) for window in value]
+
+    return [int(value)]
+
+
+def build_combinations(strategy_name: str, window_slow, window_fast, window_signal=None) -> list:
+    """
+    Returns every valid (window_slow, window_fast, window_signal) combination for the strategy.
+    Combinations where the fast window is not shorter than the slow window are skipped.
+    """
+    strategy_class = StrategyHandler.strategy_map.get(strategy_name)
+    if not strategy_class:
+        raise ValueError(f"Strategy '{strategy_name}' is not supported.")
+
+    if "window_signal" not in inspect.signature(strategy_class).parameters:
+        window_signal = None
+
+    combinations = [
+        (slow, fast, signal)
+        for slow, fast, signal in itertools.product(
+            parse_window_range(window_slow),
+            parse_window_range(window_fast),
+            parse_window_range(window_signal),
+        )
+        if fast < slow
+    ]
+
+    if not combinations:
+        raise ValueError("No valid window combinations: 'window_fast' must be smaller than 'window_slow'.")
+
+    if len(combinations) > MAX_SWEEP_COMBINATIONS:
+        raise ValueError(f"Sweep has {len(combinations)} combinations, the maximum is {MAX_SWEEP_COMBINATIONS}.")
+
+    return combinations
+
+
+def run_parameter_sweep(data: pd.DataFrame,
+                        strategy_name: str,
+                        window_slow,
+                        window_fast,
+                        window_signal=None,
+                        max_workers: int = 1) -> list:
+    """
+    Evaluates a strategy for every window combination on one price frame and returns
+    the Results metrics of each combination, ranked by strategy_roi (best first).
+
+    The frame is reduced to its Close and Volume columns once. With max_workers > 1
+    the combinations are split across a process pool of at most MAX_PROCESS_WORKERS workers.
+    """
+    combinations = build_combinations(strategy_name, window_slow, window_fast, window_signal)
+    max_workers = max(1, min(max_workers, MAX_PROCESS_WORKERS, len(combinations)))
+
+    close = get_column_values(data, "Close").astype(float)
+    volume = get_column_values(data, "Volume").astype(float)
+    index = data.index
+
+    if max_workers > 1 and len(combinations) > 1:
+        chunks = [chunk.tolist() for chunk in np.array_split(np.array(combinations, dtype=object), max_workers) if len(chunk)]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(evaluate_combinations, close, volume, index, strategy_name, chunk)
+                for chunk in chunks
+            ]
+            rows = [row for future in futures for row in future.result()]
+    else:
+        rows = evaluate_combinations(close, volume, index, strategy_name, combinations)
+
+    return sorted(rows, key=lambda row: row["strategy_roi"], reverse=True)
+
+
+def evaluate_combinations(close: np.ndarray,
+                          volume: np.ndarray,
+                          index: pd.Index,
+                          strategy_name: str,
+                          combinations: list) -> list:
+    """
+    Runs Strategy -> Trades -> Results for each combination on the same close / volume arrays.
+    Combinations that complete no trades are left out.
+    """
+    base = pd.DataFrame({"Close": close, "Volume": volume}, index=index)
+    handler = StrategyHandler(data=base)
+    rows = []
+
+    for slow, fast, signal in combinations:
+        params = {"window_slow": slow, "window_fast": fast}
+        if signal is not None:
+            params["window_signal"] = signal
+
+        trades = Trades(handler.get_strategy(strategy_name=strategy_name, **params))
+        if not count_completed_trades(trades):
+            continue
+
+        results = Results(trades)
+        row = dict(params)
+        row.update({metric: getattr(results, metric) for metric in RESULT_METRICS})
+        rows.append(row)
+
+    return rows
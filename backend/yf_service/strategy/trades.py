@@ -1,42 +1,69 @@
+import copy
+
+import numpy as np
 import pandas as pd
 
+from yf_service.strategy.signals import rising_edge
+
 class Trades:
-    def __init__(self, strategy: pd.DataFrame):
+    def __init__(self, strategy):
         """
         Class that is responsible for the determination of buy and sell trades.
+        Reads the close prices and Buy / Sell conditions owned by the strategy, no frame is copied.
         """
-        self._data = strategy._df.copy()
-        
+        self.index = strategy.index
+        self.close = strategy.close
+
         # signal determination
-        self._data["BuySignal"] = self.determine_signals(condition="BuyCondition")
-        self._data["SellSignal"] = self.determine_signals(condition="SellCondition")
-        
+        self.buy_signal = self.determine_signals(condition=strategy.buy_condition)
+        self.sell_signal = self.determine_signals(condition=strategy.sell_condition)
+
         # price determination
-        self._data["BuyPrice"] = self.determine_price_at_signal(signal="BuySignal")
-        self._data["SellPrice"] = self.determine_price_at_signal(signal="SellSignal")
+        self.buy_price = self.determine_price_at_signal(signal=self.buy_signal)
+        self.sell_price = self.determine_price_at_signal(signal=self.sell_signal)
 
     def determine_signals(self, condition):
         """
-        Given a pandas Series of boolean values, return a new Series where only the first occurrence
-        of True and the first occurrence of False are retained, and all other values are set to None.
+        Given an array of boolean values, return a new array where only the first occurrence
+        of True after a run of False values is retained, and all other values are set to False.
         """
-        found_true = False
-        result = []
-
-        for value in self._data[condition]:
-            if value and not found_true:
-                result.append(True)
-                found_true = True
-            elif not value:
-                result.append(False)
-                found_true = False  # reset flag when a False is encountered
-            else:
-                result.append(False)
+        return rising_edge(condition)
 
-        return pd.Series(result, index=self._data[condition].index)
-    
     def determine_price_at_signal(self, signal):
         """
-        Returns the price when the price signal is True, otherwise None.
+        Returns the price when the price signal is True, otherwise 0.
+        """
+        return np.where(signal, self.close, 0.0)
+
+    def sliced(self, start: int = None, stop: int = None):
+        """
+        Returns the trades between the row positions start and stop as views of these arrays.
+        Signals before start are dropped, so a position opened earlier is not closed in the slice.
+        """
+        trades = copy.copy(self)
+        rows = slice(start, stop)
+
+        trades.index = self.index[rows]
+        trades.close = self.close[rows]
+        trades.buy_signal = self.buy_signal[rows]
+        trades.sell_signal = self.sell_signal[rows]
+        trades.buy_price = self.buy_price[rows]
+        trades.sell_price = self.sell_price[rows]
+        return trades
+
+    @property
+    def _data(self) -> pd.DataFrame:
+        """
+        Returns the trades as a DataFrame (Close, Buy / Sell signals and prices).
+        Built on demand for inspection, the pipeline itself works on the arrays.
         """
-        return self._data["Close"].where(self._data[signal] == True, False)
+        return pd.DataFrame(
+            {
+                "Close": self.close,
+                "BuySignal": self.buy_signal,
+                "SellSignal": self.sell_signal,
+                "BuyPrice": self.buy_price,
+                "SellPrice": self.sell_price,
+            },
+            index=self.index,
+        )
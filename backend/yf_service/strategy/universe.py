@@ -0,0 +1,155 @@
+import argparse
+import inspect
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from yf_service.common.core import get_column_values
+from yf_service.strategy.handler import StrategyHandler
+from yf_service.strategy.results import Results, count_completed_trades
+from yf_service.strategy.sweep import MAX_PROCESS_WORKERS, RESULT_METRICS
+from yf_service.strategy.trades import Trades
+
+# chunks submitted per worker, so slow tickers do not leave the other cores idle
+CHUNKS_PER_WORKER = 4
+
+
+def run_universe_backtest(frames: dict,
+                          strategy_name: str,
+                          params: dict,
+                          max_workers: int = None) -> dict:
+    """
+    Runs one strategy with Trades -> Results on every ticker of frames ({code: DataFrame})
+    and returns the tickers ranked by strategy_roi (best first).
+
+    Tickers are sharded across a process pool using every core by default (never more than
+    MAX_PROCESS_WORKERS). Each worker only receives the Close / Volume arrays of its tickers.
+    Ex:
+    >>> {
+    >>>     "strategy": "MA", "params": {...}, "workers": 8, "seconds": 1.2,
+    >>>     "results": [{"code": "AAPL", "strategy_roi": 12.3, ..., "seconds": 0.004}, ...],
+    >>>     "skipped": [{"code": "XYZ", "reason": "no trades", "seconds": 0.002}, ...]
+    >>> }
+    """
+    if strategy_name not in StrategyHandler.strategy_map:
+        raise ValueError(f"Strategy '{strategy_name}' is not supported.")
+
+    accepted = inspect.signature(StrategyHandler.strategy_map[strategy_name]).parameters
+    params = {key: value for key, value in params.items() if key in accepted}
+
+    max_workers = max(1, min(max_workers or MAX_PROCESS_WORKERS, MAX_PROCESS_WORKERS))
+    items = [
+        (
+            code,
+            df.index,
+            get_column_values(df, "Close").astype(float),
+            get_column_values(df, "Volume").astype(float),
+        )
+        for code, df in frames.items()
+        if df is not None and not df.empty
+    ]
+
+    start = time.perf_counter()
+
+    if max_workers > 1 and len(items) > 1:
+        n_chunks = min(len(items), max_workers * CHUNKS_PER_WORKER)
+        chunks = [items[i::n_chunks] for i in range(n_chunks)]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(evaluate_tickers, strategy_name, params, chunk) for chunk in chunks]
+            rows = [row for future in futures for row in future.result()]
+    else:
+        rows = evaluate_tickers(strategy_name, params, items)
+
+    seconds = time.perf_counter() - start
+
+    results = sorted((row for row in rows if "reason" not in row), key=lambda row: row["strategy_roi"], reverse=True)
+    skipped = [row for row in rows if "reason" in row]
+    skipped += [{"code": code, "reason": "no data", "seconds": 0.0} for code, df in frames.items() if df is None or df.empty]
+
+    return {
+        "strategy": strategy_name,
+        "params": params,
+        "workers": max_workers,
+        "tickers": len(frames),
+        "seconds": round(seconds, 4),
+        "results": results,
+        "skipped": skipped,
+    }
+
+
+def evaluate_tickers(strategy_name: str, params: dict, items: list) -> list:
+    """
+    Runs Strategy -> Trades -> Results for each (code, index, close, volume) item and
+    returns one row of Results metrics per ticker with the time it took.
+    """
+    rows = []
+
+    for code, index, close, volume in items:
+        start = time.perf_counter()
+        data = pd.DataFrame({"Close": close, "Volume": volume}, index=index)
+
+        strategy = StrategyHandler(data=data).get_strategy(strategy_name=strategy_name, **params)
+        trades = Trades(strategy)
+
+        if count_completed_trades(trades):
+            results = Results(trades)
+            row = {"code": code, "bars": len(index)}
+            row.update({metric: getattr(results, metric) for metric in RESULT_METRICS})
+        else:
+            row = {"code": code, "reason": "no trades"}
+
+        row["seconds"] = round(time.perf_counter() - start, 6)
+        rows.append(row)
+
+    return rows
+
+
+def main():
+    """
+    Command line entry point for the universe backtest on stored prices.
+    Ex:
+    >>> python -m yf_service.strategy.universe MA --window-slow 26 --window-fast 12 --time-period 5y
+    """
+    parser = argparse.ArgumentParser(description="Backtest a strategy over every stock with stored prices.")
+    parser.add_argument("strategy", choices=sorted(StrategyHandler.strategy_map))
+    parser.add_argument("--window-slow", type=int, default=26)
+    parser.add_argument("--window-fast", type=int, default=12)
+    parser.add_argument("--window-signal", type=int, default=None)
+    parser.add_argument("--time-period", default="max")
+    parser.add_argument("--codes", nargs="*", default=None, help="defaults to every stored code")
+    parser.add_argument("--workers", type=int, default=None, help="defaults to every core")
+    parser.add_argument("--top", type=int, default=None, help="only print the best N tickers")
+    args = parser.parse_args()
+
+    # strategy_methods imports this module, so it is imported here to avoid a cycle
+    from yf_service.methods.strategy_methods import strategyDB_Client
+
+    report = strategyDB_Client.backtest_universe({
+        "strategy": args.strategy,
+        "window_slow": args.window_slow,
+        "window_fast": args.window_fast,
+        "window_signal": args.window_signal,
+        "time_period": args.time_period,
+        "codes": args.codes,
+        "max_workers": args.workers,
+    })
+
+    table = pd.DataFrame(report["results"])
+    if args.top:
+        table = table.head(args.top)
+
+    with pd.option_context("display.max_rows", None, "display.width", 200):
+        print(table.to_string(index=False) if not table.empty else "No tickers completed a trade.")
+
+    per_ticker = np.array([row["seconds"] for row in report["results"] + report["skipped"]])
+    print(
+        f"\n{report['tickers']} tickers, {len(report['results'])} ranked, {len(report['skipped'])} skipped "
+        f"in {report['seconds']}s on {report['workers']} workers"
+        + (f" (per ticker: median {np.median(per_ticker):.4f}s, max {per_ticker.max():.4f}s)" if per_ticker.size else "")
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,21 @@
 import pandas as pd
 
+from yf_service.common.core import get_column_series
+from yf_service.strategy.base import Strategy
+from yf_service.strategy.indicators import ema
 
-class Strategy_VW_MACD:
+
+class Strategy_VW_MACD(Strategy):
     def __init__(self, 
                  data: pd.DataFrame,
                  window_slow=26, 
                  window_fast=12,
                  window_signal=9):
+        super().__init__(data)
         
         # algorithm implementation
-        close_prices = data["Close"]
-        volume = data["Volume"]
+        close_prices = get_column_series(data, "Close")
+        volume = get_column_series(data, "Volume")
         volume_weighted_price = close_prices * volume
 
         slow_vw_macd = self._ema(volume_weighted_price / volume, window_slow)
@@ -18,17 +23,18 @@ class Strategy_VW_MACD:
 
         macd_diff = fast_vw_macd - slow_vw_macd
         macd_signal = self._ema(macd_diff, window_signal)
+        vw_macd_diff = macd_diff - macd_signal
 
-        data["VW_MACD"] = macd_diff
-        data["VW_MACD_signal"] = macd_signal
-        data["VW_MACD_diff"] = macd_diff - macd_signal
+        self.indicators["VW_MACD"] = macd_diff.to_numpy()
+        self.indicators["VW_MACD_signal"] = macd_signal.to_numpy()
+        self.indicators["VW_MACD_diff"] = vw_macd_diff.to_numpy()
 
         # trading signals
-        data["BuyCondition"] = (data["VW_MACD_diff"] > 0) & (data["VW_MACD_diff"].shift(1) <= 0)
-        data["SellCondition"] = (data["VW_MACD_diff"] < 0) & (data["VW_MACD_diff"].shift(1) >= 0)
-
-        self._df = data
+        self.set_conditions(
+            buy_condition=(vw_macd_diff > 0) & (vw_macd_diff.shift(1) <= 0),
+            sell_condition=(vw_macd_diff < 0) & (vw_macd_diff.shift(1) >= 0),
+        )
 
     @staticmethod
     def _ema(close, window):
-        return close.ewm(span=window, adjust=False).mean()
+        return ema(close, span=window)
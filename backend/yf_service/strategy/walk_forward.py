@@ -0,0 +1,165 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from yf_service.common.core import get_column_values
+from yf_service.strategy.handler import StrategyHandler
+from yf_service.strategy.results import Results, count_completed_trades
+from yf_service.strategy.sweep import MAX_PROCESS_WORKERS, RESULT_METRICS, build_combinations, evaluate_combinations
+from yf_service.strategy.trades import Trades
+
+WINDOW_PARAMS = ["window_slow", "window_fast", "window_signal"]
+
+# the Results metrics a train slice can be optimised on: 1 when higher is better, -1 when lower is
+METRIC_DIRECTIONS = {
+    "strategy_roi": 1,
+    "total_profit": 1,
+    "number_profit_trades": 1,
+    "number_loss_trades": -1,
+    "pct_win": 1,
+    "pct_loss": -1,
+    "greatest_profit": 1,
+    # the profit of the worst trade, i.e. negative for a loss, so higher is a smaller loss
+    "greatest_loss": 1,
+}
+
+
+def build_folds(n_bars: int, train_size: int, test_size: int) -> list:
+    """
+    Returns the (train_start, test_start, test_end) row positions of consecutive walk-forward
+    folds. Each test slice starts where the previous one ended, so the test slices cover the
+    history after the first train slice without overlapping.
+    Ex:
+    >>> build_folds(10, train_size=4, test_size=3) : [(0, 4, 7), (3, 7, 10)]
+    """
+    if train_size < 2 or test_size < 1:
+        raise ValueError("'train_size' must be at least 2 bars and 'test_size' at least 1 bar.")
+
+    folds = []
+    test_start = train_size
+    while test_start < n_bars:
+        folds.append((test_start - train_size, test_start, min(test_start + test_size, n_bars)))
+        test_start += test_size
+    return folds
+
+
+def run_walk_forward(data: pd.DataFrame,
+                     strategy_name: str,
+                     window_slow,
+                     window_fast,
+                     window_signal=None,
+                     train_size: int = 252,
+                     test_size: int = 63,
+                     metric: str = "strategy_roi",
+                     max_workers: int = 1) -> dict:
+    """
+    Walk-forward optimisation of a strategy's windows.
+
+    For each fold the window combinations are grid searched on the train slice with the sweep's
+    evaluate_combinations (indicators shared through the indicator cache) and the combination
+    with the best metric, highest or lowest as given by METRIC_DIRECTIONS, is run on the
+    following test slice. The strategy is computed over train + test so its indicators are
+    warmed up, but only trades opened within the test slice count. Folds are independent and
+    run across a process pool of at most MAX_PROCESS_WORKERS workers when max_workers > 1.
+
+    Returns the per-fold params and metrics, the combined out-of-sample metrics and the
+    stitched out-of-sample equity curve (initial investment plus realised profit per test bar).
+    """
+    if metric not in METRIC_DIRECTIONS:
+        raise ValueError(f"Unsupported metric '{metric}', choose one of {list(METRIC_DIRECTIONS)}.")
+
+    combinations = build_combinations(strategy_name, window_slow, window_fast, window_signal)
+
+    close = get_column_values(data, "Close").astype(float)
+    volume = get_column_values(data, "Volume").astype(float)
+    index = data.index
+
+    folds = build_folds(len(close), int(train_size), int(test_size))
+    if not folds:
+        raise ValueError(f"Not enough bars ({len(close)}) for a train slice of {train_size} bars and a test slice.")
+
+    jobs = [
+        (close[train_start:test_end], volume[train_start:test_end], index[train_start:test_end],
+         test_start - train_start, strategy_name, combinations, metric)
+        for train_start, test_start, test_end in folds
+    ]
+
+    max_workers = max(1, min(max_workers, MAX_PROCESS_WORKERS, len(jobs)))
+    if max_workers > 1:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            fold_results = list(executor.map(evaluate_fold, *zip(*jobs)))
+    else:
+        fold_results = [evaluate_fold(*job) for job in jobs]
+
+    pnl = np.concatenate([fold.pop("pnl") for fold in fold_results])
+    equity = Results.INITIAL_INVESTMENT + np.cumsum(pnl)
+    test_dates = index[folds[0][1]:]
+
+    profits = [profit for fold in fold_results for _, profit in fold["profit_loss_shares"]]
+    total_profit = float(np.sum(profits)) if profits else 0.0
+
+    return {
+        "strategy": strategy_name,
+        "metric": metric,
+        "train_size": int(train_size),
+        "test_size": int(test_size),
+        "folds": fold_results,
+        "out_of_sample": {
+            "total_profit": round(total_profit, 2),
+            "strategy_roi": round(100 * total_profit / Results.INITIAL_INVESTMENT, 2),
+            "total_number_of_trades": len(profits),
+            "number_profit_trades": sum(profit > 0 for profit in profits),
+            "number_loss_trades": sum(profit < 0 for profit in profits),
+        },
+        "equity_curve": [
+            {"date": date, "equity": round(value, 2)}
+            for date, value in zip(test_dates.strftime('%Y-%m-%d'), equity.tolist())
+        ],
+    }
+
+
+def evaluate_fold(close: np.ndarray,
+                  volume: np.ndarray,
+                  index: pd.Index,
+                  train_size: int,
+                  strategy_name: str,
+                  combinations: list,
+                  metric: str) -> dict:
+    """
+    Grid searches combinations on the first train_size bars and evaluates the best one on
+    the remaining bars. Returns the fold's params, train / test metrics and the realised
+    profit on each test bar.
+    """
+    fold = {
+        "train_start": index[0].strftime('%Y-%m-%d'),
+        "test_start": index[train_size].strftime('%Y-%m-%d'),
+        "test_end": index[-1].strftime('%Y-%m-%d'),
+        "params": None,
+        "train_metric": None,
+        "test": None,
+        "profit_loss_shares": [],
+        "pnl": np.zeros(len(index) - train_size),
+    }
+
+    train_rows = evaluate_combinations(close[:train_size], volume[:train_size], index[:train_size], strategy_name, combinations)
+    if not train_rows:
+        return fold  # no combination completed a trade on the train slice
+
+    direction = METRIC_DIRECTIONS[metric]
+    best = max(train_rows, key=lambda row: direction * row[metric])
+    fold["params"] = {key: best[key] for key in WINDOW_PARAMS if key in best}
+    fold["train_metric"] = best[metric]
+
+    data = pd.DataFrame({"Close": close, "Volume": volume}, index=index)
+    strategy = StrategyHandler(data=data).get_strategy(strategy_name=strategy_name, **fold["params"])
+
+    trades = Trades(strategy).sliced(start=train_size)
+    if not count_completed_trades(trades):
+        return fold  # no completed buy/sell pairs on the test slice
+
+    results = Results(trades)
+    fold["test"] = {key: getattr(results, key) for key in RESULT_METRICS}
+    fold["profit_loss_shares"] = results.profit_loss_shares
+    np.add.at(fold["pnl"], results.sell_idx, results.profits)
+    return fold
@@ -18,7 +18,7 @@ const Chart = () => {
     setLoading(true);
     setError(null);
     try {
-      const response = await fetch(`/api/stock_price/${ticker}`);
+      const response = await fetch(`/api/stock_price/${ticker}?time_interval=${timeInterval || '1d'}`);
       if (!response.ok) {
         throw new Error('Stock data not found');
       }